@@ -0,0 +1,94 @@
+"""Compare card-face blit throughput with and without the texture atlas
+
+Usage: python atlas_benchmark.py [--cards 36] [--iterations 2000] [--headless]
+"""
+import argparse
+import io
+import os
+import random
+import sys
+import time
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--cards', type=int, default=36, help='card faces blitted per frame')
+    parser.add_argument('--iterations', type=int, default=2000, help='frames to time per variant')
+    parser.add_argument('--headless', action='store_true', help="use SDL's dummy video driver")
+    return parser.parse_args()
+
+
+def make_faces(count):
+    """Card faces as the game produces them: decoded PNG thumbnails and text fallbacks"""
+    import pygame
+    from enhanced_memory_game import Card, CARD_IMAGE_SIZE
+
+    faces = []
+    for i in range(count):
+        if i % 3:
+            # Round-trip through PNG like the thumbnail cache does
+            photo = pygame.Surface((200, 250))
+            photo.fill((random.randrange(256), random.randrange(256), random.randrange(256)))
+            pygame.draw.circle(photo, (255, 255, 255), (100, 120), 60)
+            photo = pygame.transform.smoothscale(photo, CARD_IMAGE_SIZE)
+            buffer = io.BytesIO()
+            pygame.image.save(photo, buffer, 'face.png')
+            buffer.seek(0)
+            faces.append(pygame.image.load(buffer, 'face.png'))
+        else:
+            card = Card({'id': i, 'name': f'Character {i}', 'image': None}, 0, 0)
+            card.create_text_image()
+            faces.append(card.image)
+    return faces
+
+
+def time_blits(screen, faces, iterations, scale_to=None):
+    """Blits per second, optionally resampling each face first as Card.draw does while animating"""
+    import pygame
+
+    positions = [((i % 6) * 112 + 100, (i // 6 % 6) * 132 + 120) for i in range(len(faces))]
+    pairs = list(zip(faces, positions))
+    start = time.perf_counter()
+    for _ in range(iterations):
+        for face, position in pairs:
+            if scale_to:
+                face = pygame.transform.smoothscale(face, scale_to)
+            screen.blit(face, position)
+    elapsed = time.perf_counter() - start
+    return len(pairs) * iterations / elapsed
+
+
+def main():
+    args = parse_args()
+    if args.headless:
+        os.environ['SDL_VIDEODRIVER'] = 'dummy'
+        os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+    import pygame
+    import enhanced_memory_game
+    from texture_atlas import TextureAtlas
+
+    screen = pygame.display.set_mode((enhanced_memory_game.WINDOW_WIDTH, enhanced_memory_game.WINDOW_HEIGHT))
+    random.seed(1)
+    enhanced_memory_game.Card.atlas = None
+    faces = make_faces(args.cards)
+
+    atlas = TextureAtlas(enhanced_memory_game.CARD_IMAGE_SIZE, enhanced_memory_game.COLORS['card_front'])
+    atlas_faces = [atlas.add(i, face) for i, face in enumerate(faces)]
+
+    width, height = enhanced_memory_game.CARD_IMAGE_SIZE
+    hover_size = (int(width * 1.05), int(height * 1.05))
+
+    print(f"Display format: {screen.get_bitsize()}-bit, atlas pages: {atlas.stats()['pages']}")
+    for label, scale_to, iterations in (("Direct blit", None, args.iterations),
+                                         ("Scaled blit", hover_size, max(1, args.iterations // 10))):
+        standalone = time_blits(screen, faces, iterations, scale_to)
+        packed = time_blits(screen, atlas_faces, iterations, scale_to)
+        print(f"{label}: standalone {standalone:12,.0f}/s  atlas {packed:12,.0f}/s  ({packed / standalone:.2f}x)")
+
+    pygame.quit()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,36 @@
+import os
+import tempfile
+
+def cache_root() -> str:
+    """Directory holding the game's on-disk caches
+
+    Honours MEMORY_GAME_CACHE_DIR, then the platform cache location.
+    """
+    override = os.environ.get('MEMORY_GAME_CACHE_DIR')
+    if override:
+        return override
+
+    if os.name == 'nt':
+        base = os.environ.get('LOCALAPPDATA') or os.path.expanduser('~')
+    else:
+        base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'starwars-memory-game')
+
+def cache_path(*parts) -> str:
+    """Path inside the cache root"""
+    return os.path.join(cache_root(), *parts)
+
+def atomic_write(path: str, data: bytes):
+    """Write a file so readers see either the old or the new contents, never a partial one"""
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
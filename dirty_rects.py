@@ -0,0 +1,68 @@
+from typing import Iterable, List
+
+import pygame
+
+
+class DirtyRegions:
+    """Screen rectangles that have to be repainted and pushed this frame
+
+    Changed areas (a card's old and new bounds, a HUD field, a twinkling
+    star) are collected with add(). expand() then grows the set to cover the
+    whole of every card or HUD field that a dirty rectangle touches, so those
+    can be redrawn unclipped in their normal order without double-blending
+    anti-aliased edges. The rectangles may overlap; pixels() counts what
+    pygame.display.update() will actually copy.
+    """
+
+    def __init__(self, bounds: pygame.Rect):
+        self.bounds = pygame.Rect(bounds)
+        self.rects: List[pygame.Rect] = []
+
+    def __bool__(self) -> bool:
+        return bool(self.rects)
+
+    def clear(self):
+        self.rects = []
+
+    def add(self, rect):
+        """Mark an area dirty (clipped to the screen; empty areas are ignored)"""
+        rect = pygame.Rect(rect).clip(self.bounds)
+        if rect.width and rect.height:
+            self.rects.append(rect)
+
+    def touches(self, rect: pygame.Rect) -> bool:
+        return rect.collidelist(self.rects) != -1
+
+    def expand(self, layers: Iterable[pygame.Rect]):
+        """Add every layer rect that overlaps the dirty set, until nothing more is pulled in"""
+        pending = [pygame.Rect(rect) for rect in layers]
+        grew = True
+        while grew and pending:
+            grew = False
+            remaining = []
+            for rect in pending:
+                if self.touches(rect):
+                    self.add(rect)
+                    grew = True
+                else:
+                    remaining.append(rect)
+            pending = remaining
+        self.prune()
+
+    def prune(self):
+        """Drop rectangles that lie entirely inside another one"""
+        kept = []
+        for index, rect in enumerate(self.rects):
+            covered = False
+            for other in rect.collidelistall(self.rects):
+                if other != index and self.rects[other].contains(rect):
+                    # Of two identical rects keep the first
+                    if self.rects[other] != rect or other < index:
+                        covered = True
+                        break
+            if not covered:
+                kept.append(rect)
+        self.rects = kept
+
+    def pixels(self) -> int:
+        return sum(rect.width * rect.height for rect in self.rects)
@@ -1,24 +1,56 @@
 import pygame
-import requests
 import random
 import sys
 import math
+import os
 import time
 from typing import List, Dict, Tuple, Optional
 import io
-from urllib.request import urlopen
+from image_loader import ImageLoader
+from thumbnail_cache import ThumbnailCache, MISSING
+from roster_cache import load_roster
+from http_client import get_client
+from texture_atlas import TextureAtlas
+from render_cache import FlipFrameCache, CardChromeCache, FontRegistry, SurfaceCache, TextCache, quantize
+from dirty_rects import DirtyRegions
+from starfield import Starfield
+from particles import ParticlePool
+from frame_profiler import FrameProfiler
+from frame_pacer import FramePacer
+from grid_index import GridIndex
+from viewport import Viewport
+from memory_engine import MemoryEngine, EMPTY, FIRST
 
 # Initialize Pygame
 pygame.init()
 pygame.mixer.init()
 
 # Constants
-GRID_SIZE = 6
+GRID_SIZE_ENV = 'MEMORY_GAME_GRID_SIZE'  # e.g. 20 for a marathon board
+GRID_SIZE = int(os.environ.get(GRID_SIZE_ENV, 6))
 CARD_WIDTH = 100
 CARD_HEIGHT = 120
 CARD_MARGIN = 12
-WINDOW_WIDTH = GRID_SIZE * (CARD_WIDTH + CARD_MARGIN) - CARD_MARGIN + 200
-WINDOW_HEIGHT = GRID_SIZE * (CARD_HEIGHT + CARD_MARGIN) - CARD_MARGIN + 200
+BOARD_TOP = 120  # first card row, below the title and stats
+
+# Boards that do not fit this window scroll and zoom inside it; only the
+# cards in view exist as Card objects, the rest is plain board state
+VIEWPORT_MAX_WINDOW = (1400, 1000)
+VIEWPORT_WHEEL_STEP = 60  # pixels scrolled per mouse wheel notch
+SCROLL_KEYS = {
+    pygame.K_LEFT: (-1, 0), pygame.K_RIGHT: (1, 0),
+    pygame.K_UP: (0, -1), pygame.K_DOWN: (0, 1),
+}
+ZOOM_IN_KEYS = (pygame.K_PLUS, pygame.K_EQUALS, pygame.K_KP_PLUS)
+ZOOM_OUT_KEYS = (pygame.K_MINUS, pygame.K_KP_MINUS)
+
+def window_size(grid_size: int) -> Tuple[int, int]:
+    """Window that fits a grid_size board, capped at VIEWPORT_MAX_WINDOW"""
+    width = grid_size * (CARD_WIDTH + CARD_MARGIN) - CARD_MARGIN + 200
+    height = grid_size * (CARD_HEIGHT + CARD_MARGIN) - CARD_MARGIN + 200
+    return min(width, VIEWPORT_MAX_WINDOW[0]), min(height, VIEWPORT_MAX_WINDOW[1])
+
+WINDOW_WIDTH, WINDOW_HEIGHT = window_size(GRID_SIZE)
 
 # WTW Color Palette for GUI
 COLORS = {
@@ -68,91 +100,131 @@ COLORS = {
     'particle_alt': (201, 0, 172),        # Fireworks for variety
 }
 
+# Opening credits: pre-built star backdrops cycled per frame, and the
+# padding above and below the first and last line of the pre-rendered crawl
+CREDITS_BACKDROPS = 4
+CREDITS_MARGIN = 100
+
+# Background stars; twinkling is refreshed at STARFIELD_REFRESH_MS, not per frame
+STAR_COUNT = 150
+
 # Animation constants
 FLIP_DURATION = 300  # milliseconds
 MATCH_HIGHLIGHT_DURATION = 800
 PARTICLE_LIFETIME = 1000
 
-class Particle:
-    """Particle effect for celebrations"""
-    def __init__(self, x, y):
-        self.x = x
-        self.y = y
-        self.vx = random.uniform(-3, 3)
-        self.vy = random.uniform(-5, -1)
-        self.lifetime = PARTICLE_LIFETIME
-        self.age = 0
-        self.size = random.randint(3, 8)
-        # Use WTW accent colors for particles
-        self.color = random.choice([COLORS['particle'], COLORS['particle_alt'], COLORS['fireworks']])
-
-    def update(self, dt):
-        self.x += self.vx
-        self.y += self.vy
-        self.vy += 0.1  # gravity
-        self.age += dt
-
-    def is_alive(self):
-        """Check if particle is still alive"""
-        return self.age < self.lifetime
-
-    def draw(self, screen):
-        alpha = max(0, 1 - self.age / self.lifetime)
-        if alpha > 0:
-            size = max(1, int(self.size * alpha))
-            pygame.draw.circle(screen, self.color, (int(self.x), int(self.y)), size)
-
-class Star:
-    """Twinkling star for background starfield"""
-    def __init__(self, x, y):
-        self.x = x
-        self.y = y
-        self.brightness = random.uniform(0.3, 1.0)
-        self.twinkle_speed = random.uniform(0.001, 0.003)
-        self.twinkle_phase = random.uniform(0, 2 * 3.14159)
-        self.size = random.randint(1, 3)
-        # Use subtle colors for stars
-        self.base_color = random.choice([
-            COLORS['text_secondary'],
-            COLORS['primary_light'],
-            (255, 255, 255),
-            COLORS['stratosphere_light']
-        ])
-
-    def update(self, dt):
-        self.twinkle_phase += self.twinkle_speed * dt
+# Image loading
+IMAGE_LOAD_WORKERS = 8  # Concurrent image downloads
+PROGRESSIVE_LOADING = True  # Start playing on text placeholders while images stream in
+IMAGE_FADE_DURATION = 250  # milliseconds to cross-fade a placeholder into its image
+# Decoded images of cards scrolled out of view, so scrolling back needs no reload
+IMAGE_MEMORY_CACHE_BYTES = 8 * 1024 * 1024
+
+# Pre-scaled flip/hover keyframes
+FLIP_FRAME_CACHE_BYTES = 16 * 1024 * 1024
+FLIP_WIDTH_STEP = 4  # pixels between cached flip widths
+FLIP_HEIGHT_STEP = 2  # pixels between cached hover heights
+CARD_CHROME_CACHE_BYTES = 8 * 1024 * 1024  # Pre-rendered card backs, frames and glows
+
+# Fonts and rendered strings shared across the game
+TEXT_CACHE_ENTRIES = 512
+FONTS = FontRegistry()
+TEXT_CACHE = TextCache(TEXT_CACHE_ENTRIES)
+
+# Repaint and push only the parts of the window that changed (F3 shows them)
+DIRTY_RECT_RENDERING = True
+
+# Sleep until the next input or scheduled change while nothing animates
+IDLE_PACING = True
+
+# Set to a .csv or .json path to export per-phase frame timings on exit
+PROFILE_ENV = 'MEMORY_GAME_PROFILE'
+
+def render_text(font, text, color):
+    """Anti-aliased text, rendered once and then served from TEXT_CACHE"""
+    return TEXT_CACHE.render(font, text, color)
+
+def quit_pygame():
+    """Shut pygame down, dropping the fonts and text that do not survive it"""
+    FONTS.clear()
+    TEXT_CACHE.clear()
+    pygame.quit()
+
+CARD_IMAGE_SIZE = (CARD_WIDTH - 20, CARD_HEIGHT - 40)
+
+# Scaled thumbnails survive between launches
+THUMBNAILS = ThumbnailCache()
+
+class InvalidImageError(Exception):
+    """The image URL answered, but not with a usable character picture"""
+
+def download_card_image(url):
+    """Download, validate and scale a character image"""
+    response = get_client().get(url)
+    if 400 <= response.status_code < 500:
+        raise InvalidImageError(f"HTTP {response.status_code}")
+    response.raise_for_status()
+    image_data = response.content
+
+    # Check if we actually got image data
+    if len(image_data) < 100:  # Very small file, likely not a real image
+        raise InvalidImageError(f"Image file too small ({len(image_data)} bytes)")
+
+    image_surface = pygame.image.load(io.BytesIO(image_data))
+
+    # Check if image is too small (likely a placeholder or broken)
+    if image_surface.get_width() < 50 or image_surface.get_height() < 50:
+        raise InvalidImageError(f"Image dimensions too small ({image_surface.get_width()}x{image_surface.get_height()})")
+
+    # Better scaling with anti-aliasing
+    return pygame.transform.smoothscale(image_surface, CARD_IMAGE_SIZE)
+
+def fetch_card_image(url):
+    """Card image from the thumbnail cache, downloading it on a miss; safe to call from a worker thread"""
+    cached = THUMBNAILS.get(url, CARD_IMAGE_SIZE)
+    if cached is MISSING:
+        raise InvalidImageError("Image previously found unusable")
+    if cached is not None:
+        return cached
+
+    try:
+        image = download_card_image(url)
+    except InvalidImageError:
+        THUMBNAILS.put_missing(url, CARD_IMAGE_SIZE)
+        raise
+
+    THUMBNAILS.put(url, CARD_IMAGE_SIZE, image)
+    return image
 
-    def draw(self, screen):
-        # Calculate twinkling effect
-        twinkle = 0.5 + 0.5 * math.sin(self.twinkle_phase)
-        current_brightness = self.brightness * twinkle
-
-        # Apply brightness to color
-        color = tuple(int(c * current_brightness) for c in self.base_color)
+class Card:
+    # Display-format atlas holding every card face, set up by MemoryGame
+    atlas: Optional[TextureAtlas] = None
 
-        if self.size > 1:
-            pygame.draw.circle(screen, color, (int(self.x), int(self.y)), self.size)
-        else:
-            screen.set_at((int(self.x), int(self.y)), color)
+    # Scaled face frames shared by all cards
+    flip_frames = FlipFrameCache(FLIP_FRAME_CACHE_BYTES, FLIP_WIDTH_STEP, FLIP_HEIGHT_STEP)
 
-    def is_alive(self):
-        return self.age < self.lifetime
+    # Card backgrounds and borders for every state, set up by MemoryGame
+    chrome: Optional[CardChromeCache] = None
 
-class Card:
-    def __init__(self, character_data: Dict, x: int, y: int):
+    def __init__(self, character_data: Dict, x: int, y: int, index: int = -1,
+                 size: Tuple[int, int] = (CARD_WIDTH, CARD_HEIGHT)):
         self.character_data = character_data
+        self.index = index  # board cell
         self.target_x = x
         self.target_y = y
         self.x = x
         self.y = y
-        self.width = CARD_WIDTH
-        self.height = CARD_HEIGHT
+        self.width, self.height = size
         self.is_flipped = False
         self.is_matched = False
         self.is_hovered = False
         self.image = None
+        self.image_key = None  # Atlas key of the current face
         self.has_image = False  # Track whether we have a real image or text fallback
-        self.rect = pygame.Rect(x, y, CARD_WIDTH, CARD_HEIGHT)
+        self.previous_image = None  # Placeholder being faded out
+        self.previous_image_key = None
+        self.image_fade_timer = 0
+        self.rect = pygame.Rect(x, y, self.width, self.height)
 
         # Animation properties
         self.flip_progress = 0.0
@@ -162,51 +234,80 @@ class Card:
         self.match_highlight_timer = 0
         self.bounce_offset = 0
 
+        # What was last put on screen, for dirty-rectangle rendering
+        self.drawn_state = None
+        self.drawn_bounds: Optional[pygame.Rect] = None
+
     def load_image(self):
         """Load character image from URL with caching, create text fallback if image fails"""
         try:
             if 'image' in self.character_data and self.character_data['image']:
-                response = urlopen(self.character_data['image'])
-                image_data = response.read()
-
-                # Check if we actually got image data
-                if len(image_data) < 100:  # Very small file, likely not a real image
-                    raise Exception(f"Image file too small ({len(image_data)} bytes)")
-
-                image_surface = pygame.image.load(io.BytesIO(image_data))
-
-                # Check if image is too small (likely a placeholder or broken)
-                if image_surface.get_width() < 50 or image_surface.get_height() < 50:
-                    raise Exception(f"Image dimensions too small ({image_surface.get_width()}x{image_surface.get_height()})")
-
-                # Better scaling with anti-aliasing
-                self.image = pygame.transform.smoothscale(image_surface, (CARD_WIDTH - 20, CARD_HEIGHT - 40))
-                self.has_image = True
+                self.set_image(fetch_card_image(self.character_data['image']))
             else:
                 self.create_text_image()
         except Exception as e:
-            print(f"Creating text fallback for {self.character_data.get('name', 'Unknown')}: {e}")
+            self.image_failed(e)
+
+    def use_face(self, key, surface):
+        """Show a face, sharing it with the other card of the pair through the atlas"""
+        if Card.atlas is not None:
+            surface = Card.atlas.add(key, surface)
+        self.release_face(self.image_key)
+        self.image = surface
+        self.image_key = key
+
+    @staticmethod
+    def release_face(key):
+        if Card.atlas is not None and key is not None:
+            Card.atlas.release(key)
+
+    def release(self):
+        """Give the card's faces back to the atlas; the card is leaving the screen"""
+        self.release_face(self.image_key)
+        self.release_face(self.previous_image_key)
+        self.image = self.previous_image = None
+        self.image_key = self.previous_image_key = None
+        self.image_fade_timer = 0
+
+    def set_image(self, image):
+        """Attach an already scaled character image"""
+        self.use_face(self.character_data.get('image'), image)
+        self.has_image = True
+
+    def swap_image(self, image):
+        """Replace the placeholder with the real image, cross-fading between them"""
+        if self.image is not None:
+            # Keep the placeholder's atlas cell alive until the fade is over
+            self.previous_image = self.image
+            self.previous_image_key = self.image_key
+            self.image_key = None
+            self.image_fade_timer = IMAGE_FADE_DURATION
+        self.set_image(image)
+
+    def image_failed(self, error):
+        """Fall back to a text card when the image could not be loaded"""
+        print(f"Creating text fallback for {self.character_data.get('name', 'Unknown')}: {error}")
+        if self.image is None:
             self.create_text_image()
 
     def create_text_image(self):
         """Create a Star Wars-themed text-based image for characters without valid images"""
         self.has_image = False
-        # Create a surface for the text-based character card
-        text_surface = pygame.Surface((CARD_WIDTH - 20, CARD_HEIGHT - 40), pygame.SRCALPHA)
 
         # Use character name
         name = self.character_data.get('name', 'Unknown')
 
-        # Create fonts for Star Wars style text (bold and larger)
-        try:
-            # Try to use a bold system font that looks more like Star Wars
-            font_large = pygame.font.Font(None, 24)
-            font_large.set_bold(True)
-            font_medium = pygame.font.Font(None, 18)
-            font_medium.set_bold(True)
-        except:
-            font_large = pygame.font.Font(None, 24)
-            font_medium = pygame.font.Font(None, 18)
+        # The other card of the pair may already have rendered this face
+        key = ('text', self.character_data.get('id'), name)
+        if Card.atlas is not None and key in Card.atlas:
+            self.use_face(key, None)
+            return
+
+        # Create a surface for the text-based character card
+        text_surface = pygame.Surface(CARD_IMAGE_SIZE, pygame.SRCALPHA)
+
+        # Bold font for Star Wars style text
+        font_medium = FONTS.get(None, 18, bold=True)
 
         # Split name into lines if too long
         words = name.split()
@@ -248,7 +349,7 @@ class Card:
             if i == 0:  # First line in primary dark color
                 text_color = COLORS['primary_dark']
 
-            text_render = font_medium.render(line, True, text_color)
+            text_render = render_text(font_medium, line, text_color)
             text_rect = text_render.get_rect()
             text_rect.centerx = text_surface.get_width() // 2
             text_rect.y = start_y + i * line_height
@@ -264,9 +365,9 @@ class Card:
         pygame.draw.circle(text_surface, star_color, (star_size, text_surface.get_height() - star_size), 3)
         pygame.draw.circle(text_surface, star_color, (text_surface.get_width() - star_size, text_surface.get_height() - star_size), 3)
 
-        self.image = text_surface
+        self.use_face(key, text_surface)
 
-    def update(self, dt, mouse_pos=None):
+    def update(self, dt):
         """Update card animations"""
         # Smooth flip animation
         if self.flip_progress != self.flip_target:
@@ -284,13 +385,14 @@ class Card:
             else:
                 self.scale += scale_speed if self.target_scale > self.scale else -scale_speed
 
-        # Hover detection
-        if mouse_pos and not self.is_matched and not self.is_flipped:
-            self.is_hovered = self.rect.collidepoint(mouse_pos)
-            self.target_scale = 1.05 if self.is_hovered else 1.0
-        else:
-            self.is_hovered = False
-            self.target_scale = 1.0
+        # Placeholder cross-fade
+        if self.image_fade_timer > 0:
+            self.image_fade_timer -= dt
+            if self.image_fade_timer <= 0:
+                self.image_fade_timer = 0
+                self.previous_image = None
+                self.release_face(self.previous_image_key)
+                self.previous_image_key = None
 
         # Match highlight timer
         if self.match_highlight_timer > 0:
@@ -299,7 +401,10 @@ class Card:
         else:
             self.bounce_offset = 0
 
-        # Update rect for collision detection
+        self.update_rect()
+
+    def update_rect(self):
+        """Update rect for collision detection"""
         center_x = self.x + self.width // 2
         center_y = self.y + self.height // 2
         scaled_width = int(self.width * self.scale)
@@ -311,26 +416,39 @@ class Card:
             scaled_height
         )
 
+    def place(self, x: int, y: int, size: Tuple[int, int]):
+        """Move to a new screen position and size after the board scrolled or zoomed"""
+        self.x = self.target_x = x
+        self.y = self.target_y = y
+        self.width, self.height = size
+        self.update_rect()
+
     def flip(self):
         """Trigger flip animation"""
         self.flip_target = 1.0 if not self.is_flipped else 0.0
         self.is_flipped = not self.is_flipped
 
+    def set_hovered(self, hovered: bool):
+        """Start growing towards (or shrinking back from) the hover scale"""
+        self.is_hovered = hovered
+        self.target_scale = 1.05 if hovered else 1.0
+
     def set_matched(self):
         """Mark card as matched with celebration effect"""
         self.is_matched = True
         self.match_highlight_timer = MATCH_HIGHLIGHT_DURATION
 
-    def draw(self, screen, font, small_font):
-        """Draw the card with smooth animations"""
+    def layout(self):
+        """Card rectangle, flip scale and glow radius for the current animation frame"""
         # Calculate scaled dimensions
         center_x = self.x + self.width // 2
         center_y = self.y + self.height // 2 + self.bounce_offset
 
-        # Flip effect: scale width based on flip progress
+        # Flip effect: scale width based on flip progress; sizes snap to the
+        # steps the sprite and frame caches are built at
         flip_scale = abs(math.cos(self.flip_progress * math.pi))
-        scaled_width = max(5, int(self.width * self.scale * flip_scale))
-        scaled_height = int(self.height * self.scale)
+        scaled_width = quantize(max(5, self.width * self.scale * flip_scale), FLIP_WIDTH_STEP)
+        scaled_height = quantize(self.height * self.scale, FLIP_HEIGHT_STEP)
 
         card_rect = pygame.Rect(
             center_x - scaled_width // 2,
@@ -339,41 +457,83 @@ class Card:
             scaled_height
         )
 
+        glow_radius = 0
+        if self.is_matched and self.match_highlight_timer > 0:
+            glow_radius = int(10 + math.sin(self.match_highlight_timer * 0.02) * 5)
+        return card_rect, flip_scale, glow_radius
+
+    def paint_bounds(self) -> pygame.Rect:
+        """Screen area draw() covers this frame, glow included"""
+        card_rect, _, glow_radius = self.layout()
+        return card_rect.inflate(glow_radius * 2, glow_radius * 2)
+
+    def visual_state(self):
+        """Everything that decides what draw() puts on screen"""
+        card_rect, _, glow_radius = self.layout()
+        fade = 0
+        if self.previous_image and self.image_fade_timer > 0:
+            fade = int(255 * (1 - self.image_fade_timer / IMAGE_FADE_DURATION))
+        return (tuple(card_rect), glow_radius, self.flip_progress > 0.5, self.is_matched,
+                self.is_hovered, self.image_key, self.has_image, fade)
+
+    def is_animating(self) -> bool:
+        """True while a flip, hover scale, match pulse or image fade is in progress"""
+        return (self.flip_progress != self.flip_target or self.scale != self.target_scale
+                or self.match_highlight_timer > 0 or self.image_fade_timer > 0)
+
+    def needs_redraw(self) -> bool:
+        return self.visual_state() != self.drawn_state
+
+    def draw(self, screen, small_font):
+        """Draw the card with smooth animations"""
+        card_rect, flip_scale, glow_radius = self.layout()
+        center_x = self.x + self.width // 2
+        center_y = self.y + self.height // 2 + self.bounce_offset
+        scaled_width, scaled_height = card_rect.size
+        self.drawn_state = self.visual_state()
+        self.drawn_bounds = card_rect.inflate(glow_radius * 2, glow_radius * 2)
+
         # Determine which side to show
         show_front = self.flip_progress > 0.5
 
-        # Choose colors based on state
+        # Choose the chrome sprite based on state
         if self.is_matched:
-            border_color = COLORS['card_matched']
-            card_color = COLORS['card_front']
+            state = 'matched'
         elif show_front:
-            border_color = COLORS['card_border']
-            card_color = COLORS['card_front']
+            state = 'front'
         else:
-            border_color = COLORS['card_hover'] if self.is_hovered else COLORS['card_border']
-            card_color = COLORS['card_hover'] if self.is_hovered else COLORS['card_back']
+            state = 'back_hover' if self.is_hovered else 'back'
 
         # Add glow effect for matched cards
-        if self.is_matched and self.match_highlight_timer > 0:
-            glow_radius = int(10 + math.sin(self.match_highlight_timer * 0.02) * 5)
-            glow_rect = card_rect.inflate(glow_radius * 2, glow_radius * 2)
-            pygame.draw.rect(screen, COLORS['success'], glow_rect, border_radius=12)
+        if glow_radius:
+            screen.blit(Card.chrome.glow(card_rect.size, glow_radius),
+                        (card_rect.x - glow_radius, card_rect.y - glow_radius))
 
-        # Draw card with rounded corners effect
-        pygame.draw.rect(screen, card_color, card_rect, border_radius=8)
-        pygame.draw.rect(screen, border_color, card_rect, width=3, border_radius=8)
+        # Card body with rounded corners, border and back label
+        screen.blit(Card.chrome.body(state, card_rect.size), card_rect)
 
         if show_front and scaled_width > 20:
             # Draw character image if available
             if self.image:
-                image_width = max(10, int((CARD_WIDTH - 20) * self.scale * flip_scale))
-                image_height = max(10, int((CARD_HEIGHT - 40) * self.scale))
+                zoom = self.width / CARD_WIDTH
+                image_width = max(10, CARD_IMAGE_SIZE[0] * zoom * self.scale * flip_scale)
+                image_height = max(10, CARD_IMAGE_SIZE[1] * zoom * self.scale)
 
                 if image_width > 5 and image_height > 5:
-                    scaled_image = pygame.transform.smoothscale(self.image, (image_width, image_height))
+                    scaled_image = Card.flip_frames.frame(self.image_key, self.image, image_width, image_height)
                     image_rect = scaled_image.get_rect()
                     image_rect.centerx = center_x
-                    image_rect.y = center_y - scaled_height // 2 + 8
+                    image_rect.y = center_y - scaled_height // 2 + round(8 * zoom)
+
+                    if self.previous_image and self.image_fade_timer > 0:
+                        # Fade the real image in over the placeholder
+                        previous = Card.flip_frames.frame(self.previous_image_key, self.previous_image,
+                                                          image_width, image_height)
+                        screen.blit(previous, image_rect)
+                        # Cached frames are shared, so fade a copy
+                        scaled_image = scaled_image.copy()
+                        scaled_image.set_alpha(int(255 * (1 - self.image_fade_timer / IMAGE_FADE_DURATION)))
+
                     screen.blit(scaled_image, image_rect)
 
             # Only draw character name text if we have a real image (not text-based fallback)
@@ -383,7 +543,7 @@ class Card:
                     name = name[:10] + "..."
 
                 text_color = COLORS['text_primary'] if not self.is_matched else COLORS['success']
-                text = small_font.render(name, True, text_color)
+                text = render_text(small_font, name, text_color)
                 text_rect = text.get_rect()
                 text_rect.centerx = center_x
                 text_rect.bottom = center_y + scaled_height // 2 - 5
@@ -391,33 +551,13 @@ class Card:
                 if scaled_width > text_rect.width:
                     screen.blit(text, text_rect)
 
-        elif not show_front and scaled_width > 20:
-            # Draw card back with Star Wars branding
-            star_color = COLORS['fireworks'] if self.is_hovered else COLORS['text_primary']
-
-            # Draw "STAR" text
-            star_text = font.render("STAR", True, star_color)
-            star_rect = star_text.get_rect()
-            star_rect.centerx = center_x
-            star_rect.centery = center_y - 8
-            if scaled_width > star_rect.width:
-                screen.blit(star_text, star_rect)
-
-            # Draw "WARS" text
-            wars_text = font.render("WARS", True, star_color)
-            wars_rect = wars_text.get_rect()
-            wars_rect.centerx = center_x
-            wars_rect.centery = center_y + 8
-            if scaled_width > wars_rect.width:
-                screen.blit(wars_text, wars_rect)
-
     def is_clicked(self, pos: Tuple[int, int]) -> bool:
         """Check if the card was clicked"""
         return self.rect.collidepoint(pos)
 
 class LoadingScreen:
     """Smooth loading screen with progress indication"""
-    def __init__(self, screen, font, title_font):
+    def __init__(self, screen, font, title_font, starfield):
         self.screen = screen
         self.font = font
         self.title_font = title_font
@@ -426,12 +566,8 @@ class LoadingScreen:
         self.dots = 0
         self.dot_timer = 0
 
-        # Create starfield for loading screen
-        self.stars = []
-        for _ in range(100):  # Fewer stars for loading screen
-            x = random.randint(0, WINDOW_WIDTH)
-            y = random.randint(0, WINDOW_HEIGHT)
-            self.stars.append(Star(x, y))
+        # Same starfield as the board behind it
+        self.starfield = starfield
 
     def update(self, dt):
         self.dot_timer += dt
@@ -440,37 +576,35 @@ class LoadingScreen:
             self.dot_timer = 0
 
         # Update stars
-        for star in self.stars:
-            star.update(dt)
+        self.starfield.update(dt)
 
     def set_progress(self, current, total, message="Loading"):
-        self.progress = int((current / total) * 100)
+        self.progress = int((current / total) * 100) if total else 100
         self.current_message = message
 
     def draw(self, message="Loading Star Wars characters"):
-        self.screen.fill(COLORS['background'])
+        width, height = self.screen.get_size()
 
-        # Draw twinkling starfield
-        for star in self.stars:
-            star.draw(self.screen)
+        # Background and twinkling starfield
+        self.starfield.draw(self.screen)
 
         # Title
-        title = self.title_font.render("Star Wars Memory Game", True, COLORS['primary'])
-        title_rect = title.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 - 100))
+        title = render_text(self.title_font, "Star Wars Memory Game", COLORS['primary'])
+        title_rect = title.get_rect(center=(width // 2, height // 2 - 100))
         self.screen.blit(title, title_rect)
 
         # Loading message with animated dots
         dots = "." * self.dots
         loading_text = f"{message}{dots}"
-        text = self.font.render(loading_text, True, COLORS['text_primary'])
-        text_rect = text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 - 30))
+        text = render_text(self.font, loading_text, COLORS['text_primary'])
+        text_rect = text.get_rect(center=(width // 2, height // 2 - 30))
         self.screen.blit(text, text_rect)
 
         # Progress bar
         bar_width = 300
         bar_height = 20
-        bar_x = (WINDOW_WIDTH - bar_width) // 2
-        bar_y = WINDOW_HEIGHT // 2 + 20
+        bar_x = (width - bar_width) // 2
+        bar_y = height // 2 + 20
 
         # Background bar
         pygame.draw.rect(self.screen, COLORS['card_border'],
@@ -484,51 +618,98 @@ class LoadingScreen:
 
         # Progress text
         progress_text = f"{self.progress}%"
-        progress_surface = self.font.render(progress_text, True, COLORS['text_secondary'])
-        progress_rect = progress_surface.get_rect(center=(WINDOW_WIDTH // 2, bar_y + bar_height + 30))
+        progress_surface = render_text(self.font, progress_text, COLORS['text_secondary'])
+        progress_rect = progress_surface.get_rect(center=(width // 2, bar_y + bar_height + 30))
         self.screen.blit(progress_surface, progress_rect)
 
         pygame.display.flip()
 
 class MemoryGame:
-    def __init__(self):
-        self.screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+    def __init__(self, grid_size: int = GRID_SIZE):
+        self.grid_size = grid_size
+        self.window_width, self.window_height = window_size(grid_size)
+        self.screen = pygame.display.set_mode((self.window_width, self.window_height))
         pygame.display.set_caption("Star Wars Memory Game - Enhanced Edition")
         self.clock = pygame.time.Clock()
+        # 60 FPS for smooth animations (0 runs uncapped), idling when nothing moves
+        self.pacer = FramePacer(self.clock, 60, IDLE_PACING)
+        self.pending_events: List[pygame.event.Event] = []
 
         # Enhanced fonts
-        self.font = pygame.font.Font(None, 28)
-        self.small_font = pygame.font.Font(None, 20)
-        self.title_font = pygame.font.Font(None, 42)
-        self.large_font = pygame.font.Font(None, 64)
-
-        # Game state
+        self.font = FONTS.get(None, 28)
+        self.small_font = FONTS.get(None, 20)
+        self.title_font = FONTS.get(None, 42)
+        self.large_font = FONTS.get(None, 64)
+
+        # Card chrome sprites shared by every card
+        Card.chrome = CardChromeCache(self.font, COLORS, CARD_CHROME_CACHE_BYTES)
+
+        # All card faces live in one display-format atlas
+        Card.atlas = TextureAtlas(CARD_IMAGE_SIZE, COLORS['card_front'])
+
+        # Board layout in world coordinates and the camera over it; a board
+        # that fits the window sits exactly where the fixed layout put it
+        self.grid = GridIndex(0, 0, CARD_WIDTH, CARD_HEIGHT, CARD_MARGIN, grid_size, grid_size)
+        board_area = pygame.Rect(100, BOARD_TOP, self.window_width - 200, self.window_height - 200)
+        self.viewport = Viewport(board_area, self.grid.size)
+
+        # Game state: the rules engine holds every cell (by character id),
+        # and only the cells in view have a Card (kept in self.cards in cell order)
+        self.engine = MemoryEngine([], grid_size)
+        self.roster: Dict[int, Dict] = {}  # character id -> character
         self.cards: List[Card] = []
-        self.flipped_cards: List[Card] = []
-        self.matches_found = 0
-        self.total_pairs = (GRID_SIZE * GRID_SIZE) // 2
+        self.visible: Dict[int, Card] = {}
+        # Second card of a turn stays up until the match check fires
+        self.flipped_cells: List[int] = []
+        self.flip_back_cells: List[int] = []
+        self.total_pairs = (grid_size * grid_size) // 2
         self.game_won = False
-        self.moves = 0
         self.start_time = time.time()
         self.game_time = 0
 
         # Effects
-        self.particles: List[Particle] = []
+        # Use WTW accent colors for particles
+        self.particles = ParticlePool([COLORS['particle'], COLORS['particle_alt'], COLORS['fireworks']],
+                                      PARTICLE_LIFETIME)
         self.screen_shake = 0
         self.combo_count = 0
         self.last_match_time = 0
 
         # Starfield background
-        self.stars: List[Star] = []
-        self.create_starfield()
+        self.starfield = self.create_starfield()
+        self.stars_refreshed = True
+
+        # Dirty-rectangle rendering
+        self.dirty = DirtyRegions(self.screen.get_rect())
+        self.full_redraw = True
+        self.hud_state: Dict[str, tuple] = {}
+        self.particle_bounds: Optional[pygame.Rect] = None
+        self.show_dirty_overlay = False
+        self.overlay_rects: List[pygame.Rect] = []
+
+        # Per-phase frame timings (F2)
+        self.profiler = FrameProfiler()
+        self.show_profiler = False
+        self.profile_font = FONTS.get(None, 18)
+        self.pixels_pushed = 0
 
         # UI state
         self.mouse_pos = (0, 0)
-        self.loading_screen = LoadingScreen(self.screen, self.font, self.title_font)
+        self.hovered_card: Optional[Card] = None
+        self.loading_screen = LoadingScreen(self.screen, self.font, self.title_font, self.starfield)
+
+        # Background image streaming, fed as cards come into view
+        self.image_loader: Optional[ImageLoader] = None
+        self.image_memory = SurfaceCache(IMAGE_MEMORY_CACHE_BYTES)
+        self.failed_images: Dict[str, Exception] = {}
+        self.images_reported = False
 
         # Load game data
+        init_start = time.time()
         self.load_characters()
         self.create_cards()
+        self.time_to_interactive = time.time() - init_start
+        print(f"Board ready in {self.time_to_interactive:.2f}s")
 
     def load_characters(self):
         """Load characters with enhanced loading screen"""
@@ -536,19 +717,21 @@ class MemoryGame:
         pygame.display.flip()
 
         try:
-            response = requests.get("https://akabab.github.io/starwars-api/api/all.json")
-            if response.status_code == 200:
-                all_characters = response.json()
-                characters_with_images = [char for char in all_characters if char.get('image')]
-
-                if len(characters_with_images) >= self.total_pairs:
-                    self.characters = random.sample(characters_with_images, self.total_pairs)
-                else:
-                    self.characters = characters_with_images
-
-                print(f"Loaded {len(self.characters)} characters")
+            all_characters = load_roster()
+            characters_with_images = [char for char in all_characters if char.get('image')]
+
+            if len(characters_with_images) >= self.total_pairs:
+                self.characters = random.sample(characters_with_images, self.total_pairs)
+            elif characters_with_images:
+                # Marathon boards need more pairs than the roster has, so
+                # characters repeat; any two cards of a character match
+                random.shuffle(characters_with_images)
+                self.characters = [characters_with_images[i % len(characters_with_images)]
+                                   for i in range(self.total_pairs)]
             else:
-                self.use_fallback_characters()
+                self.characters = characters_with_images
+
+            print(f"Loaded {len(self.characters)} characters")
         except Exception as e:
             print(f"Error loading characters: {e}")
             self.use_fallback_characters()
@@ -563,91 +746,234 @@ class MemoryGame:
         ]
 
         self.characters = []
-        for i in range(min(self.total_pairs, len(fallback_names))):
+        for i in range(self.total_pairs):
+            # Repeats on boards with more pairs than names
             self.characters.append({
-                'id': i + 1,
-                'name': fallback_names[i],
+                'id': i % len(fallback_names) + 1,
+                'name': fallback_names[i % len(fallback_names)],
                 'image': None
             })
 
     def create_cards(self):
-        """Create cards with loading progress"""
-        # Create pairs
-        all_cards_data = []
-        for character in self.characters:
-            all_cards_data.extend([character, character])
-
-        random.shuffle(all_cards_data)
-
-        # Create card objects
-        self.cards = []
-        start_x = (WINDOW_WIDTH - (GRID_SIZE * (CARD_WIDTH + CARD_MARGIN) - CARD_MARGIN)) // 2
-        start_y = 120
-
-        card_index = 0
-        for row in range(GRID_SIZE):
-            for col in range(GRID_SIZE):
-                if card_index < len(all_cards_data):
-                    x = start_x + col * (CARD_WIDTH + CARD_MARGIN)
-                    y = start_y + row * (CARD_HEIGHT + CARD_MARGIN)
-                    card = Card(all_cards_data[card_index], x, y)
-                    self.cards.append(card)
-                    card_index += 1
-
-        # Load images with progress
-        for i, card in enumerate(self.cards):
-            self.loading_screen.set_progress(i, len(self.cards), "Loading character images")
-            self.loading_screen.update(50)
+        """Deal the shuffled pairs onto the board and create the cards in view"""
+        # Pairs of character ids; cells past the last card (odd grids,
+        # short rosters) stay empty
+        self.roster = {character['id']: character for character in self.characters}
+        self.engine = MemoryEngine.deal([character['id'] for character in self.characters],
+                                        self.grid_size, self.grid_size * self.grid_size)
+
+        # Images are requested as their cards come into view
+        self.image_loader = ImageLoader(fetch_card_image, IMAGE_LOAD_WORKERS)
+        self.update_visible_cards()
+        if not PROGRESSIVE_LOADING:
+            self.load_card_images()
+
+    def update_visible_cards(self):
+        """Create Cards for cells that came into view, drop the ones that left and reposition the rest"""
+        viewport = self.viewport
+        cards = self.engine.cards
+        in_view = [index for index in self.grid.cells_in(viewport.visible()) if cards[index] != EMPTY]
+        keep = set(in_view)
+        for index in [index for index in self.visible if index not in keep]:
+            card = self.visible.pop(index)
+            card.release()
+            if card is self.hovered_card:
+                self.hovered_card = None
+
+        size = (viewport.scale(CARD_WIDTH), viewport.scale(CARD_HEIGHT))
+        cards = []
+        for index in in_view:
+            x, y = viewport.to_screen(*self.grid.cell_rect(index).topleft)
+            card = self.visible.get(index)
+            if card is None:
+                card = self.visible[index] = self.create_card(index, x, y, size)
+            else:
+                card.place(x, y, size)
+            cards.append(card)
+        self.cards = cards
+        self.refresh_hover()
+
+    def create_card(self, index: int, x: int, y: int, size: Tuple[int, int]) -> Card:
+        """A Card showing the current board state of a cell"""
+        card = Card(self.roster[self.engine.cards[index]], x, y, index, size)
+        if self.engine.is_revealed(index):
+            card.is_flipped = True
+            card.flip_progress = card.flip_target = 1.0
+        card.is_matched = self.engine.is_matched(index)
+        self.attach_face(card)
+        return card
+
+    def attach_face(self, card: Card):
+        """Give a card its face: shared with its pair, remembered, or a placeholder while it downloads"""
+        url = card.character_data.get('image')
+        if not url or url in self.failed_images:
+            card.create_text_image()
+        elif url in Card.atlas:
+            card.set_image(None)
+        else:
+            image = self.image_memory.find(url)
+            if image is not None:
+                card.set_image(image)
+            else:
+                card.create_text_image()
+                if self.image_loader:
+                    self.image_loader.submit(url, url)
+
+    def apply_images(self, results):
+        """Hand finished downloads to the cards in view and remember them for later"""
+        for url, image, error in results:
+            # Lets the image be fetched again if it is evicted from memory
+            self.image_loader.forget(url)
+            if error is None:
+                self.image_memory.put(url, image)
+            else:
+                self.failed_images[url] = error
+            for card in self.cards:
+                if card.character_data.get('image') == url:
+                    if error is None:
+                        card.swap_image(image)
+                    else:
+                        card.image_failed(error)
+
+    def load_card_images(self):
+        """Wait for the images of the cards in view, reporting progress as they arrive"""
+        loader = self.image_loader
+        last_tick = pygame.time.get_ticks()
+        while loader.pending:
+            self.apply_images(loader.poll(timeout=0.05))
+
+            # Keep the window responsive while the workers run
+            pygame.event.pump()
+            now = pygame.time.get_ticks()
+            self.loading_screen.set_progress(loader.completed, loader.total, "Loading character images")
+            self.loading_screen.update(now - last_tick)
             self.loading_screen.draw("Loading character images")
-            card.load_image()
+            last_tick = now
 
+        self.images_reported = True
         print("All images loaded!")
+        self.report_loading_stats()
+
+    def poll_image_stream(self):
+        """Swap in any images that finished decoding since the last frame"""
+        if not self.image_loader or not self.image_loader.pending:
+            return
+
+        self.apply_images(self.image_loader.poll())
+
+        if not self.image_loader.pending and not self.images_reported:
+            self.images_reported = True
+            print("All images loaded!")
+            self.report_loading_stats()
+
+    def stop_image_stream(self):
+        if self.image_loader:
+            self.image_loader.shutdown()
+            self.image_loader = None
+
+    def report_loading_stats(self):
+        stats = THUMBNAILS.stats()
+        print(f"Thumbnail cache: {stats['hits']} hits, {stats['misses']} misses")
+        http_stats = get_client().stats()
+        print(f"HTTP connections: {http_stats['connections_opened']} opened, {http_stats['connections_reused']} reused")
 
     def create_celebration_particles(self, x, y, count=15):
         """Create particle effects for celebrations"""
-        for _ in range(count):
-            self.particles.append(Particle(x, y))
+        self.particles.emit(x, y, count)
 
-    def create_starfield(self):
+    def create_starfield(self) -> Starfield:
         """Create a beautiful starfield background"""
-        num_stars = 150  # Adjust for desired density
-        for _ in range(num_stars):
-            x = random.randint(0, WINDOW_WIDTH)
-            y = random.randint(0, WINDOW_HEIGHT)
-            self.stars.append(Star(x, y))
+        # Use subtle colors for stars
+        palette = [
+            COLORS['text_secondary'],
+            COLORS['primary_light'],
+            (255, 255, 255),
+            COLORS['stratosphere_light']
+        ]
+        return Starfield((self.window_width, self.window_height), STAR_COUNT, palette, COLORS['background'])
 
     def handle_card_click(self, pos: Tuple[int, int]):
         """Enhanced card click handling with smooth animations"""
-        if self.game_won or len(self.flipped_cards) >= 2:
+        if self.game_won or len(self.flipped_cells) >= 2:
             return
 
-        clicked_card = None
-        for card in self.cards:
-            if card.is_clicked(pos) and not card.is_flipped and not card.is_matched:
-                clicked_card = card
-                break
-
-        if clicked_card:
+        clicked_card = self.card_at(pos)
+        if clicked_card and not clicked_card.is_flipped and not clicked_card.is_matched:
+            outcome = self.engine.flip(clicked_card.index)
             clicked_card.flip()
-            self.flipped_cards.append(clicked_card)
+            self.flipped_cells.append(clicked_card.index)
+            self.refresh_hover()
 
-            if len(self.flipped_cards) == 2:
-                self.moves += 1
+            if outcome != FIRST:
                 pygame.time.set_timer(pygame.USEREVENT + 1, 1000)  # Check match after 1 second
 
+    def card_at(self, pos: Tuple[int, int]) -> Optional[Card]:
+        """The card under pos, looked up through the grid index"""
+        clip = self.board_clip()
+        if clip is not None and not clip.collidepoint(pos):
+            return None
+        for index in self.grid.near(self.viewport.to_world(pos)):
+            card = self.visible.get(index)
+            if card is not None and card.is_clicked(pos):
+                return card
+        return None
+
+    def cell_center(self, index: int) -> Tuple[int, int]:
+        """Screen position of a cell's centre, whether or not it is in view"""
+        x, y = self.viewport.to_screen(*self.grid.cell_rect(index).topleft)
+        return x + self.viewport.scale(CARD_WIDTH) // 2, y + self.viewport.scale(CARD_HEIGHT) // 2
+
+    def board_clip(self) -> Optional[pygame.Rect]:
+        """Screen area cards are confined to, or None while the whole board fits"""
+        return self.viewport.area if self.viewport.scrollable else None
+
+    def view_changed(self):
+        """Follow a scroll or zoom: swap cards in and out and repaint everything"""
+        self.update_visible_cards()
+        self.full_redraw = True
+
+    def scroll_view(self, dx: float, dy: float):
+        if self.viewport.scroll(dx, dy):
+            self.view_changed()
+
+    def zoom_view(self, steps: int, anchor: Tuple[int, int]):
+        if self.viewport.zoom_at(anchor, steps):
+            self.view_changed()
+
+    def reveal_cell(self, index: int):
+        """Scroll just enough to bring a cell (and its margin) into view"""
+        rect = self.grid.cell_rect(index).inflate(CARD_MARGIN * 2, CARD_MARGIN * 2)
+        if self.viewport.reveal(rect):
+            self.view_changed()
+
+    def refresh_hover(self):
+        """Move the hover highlight to the card under the mouse, touching only the old and new card"""
+        card = self.card_at(self.mouse_pos)
+        if card is not None and (card.is_flipped or card.is_matched):
+            card = None
+        if card is self.hovered_card:
+            return
+        if self.hovered_card is not None:
+            self.hovered_card.set_hovered(False)
+        if card is not None:
+            card.set_hovered(True)
+        self.hovered_card = card
+
     def check_match(self):
         """Enhanced match checking with combo system"""
-        if len(self.flipped_cards) != 2:
+        if len(self.flipped_cells) != 2:
             return
 
-        card1, card2 = self.flipped_cards
+        first, second = self.flipped_cells
         current_time = time.time()
 
-        if card1.character_data['id'] == card2.character_data['id']:
+        # The engine resolved the turn on the second click; show it now
+        if self.engine.is_matched(first):
             # Match found!
-            card1.set_matched()
-            card2.set_matched()
-            self.matches_found += 1
+            for index in (first, second):
+                card = self.visible.get(index)
+                if card is not None:
+                    card.set_matched()
 
             # Combo system
             if current_time - self.last_match_time < 3.0:  # 3 seconds for combo
@@ -658,56 +984,52 @@ class MemoryGame:
             self.last_match_time = current_time
 
             # Celebration effects
-            self.create_celebration_particles(card1.x + card1.width // 2, card1.y + card1.height // 2)
-            self.create_celebration_particles(card2.x + card2.width // 2, card2.y + card2.height // 2)
+            self.create_celebration_particles(*self.cell_center(first))
+            self.create_celebration_particles(*self.cell_center(second))
             self.screen_shake = 200  # Screen shake duration
 
             # Check win condition
-            if self.matches_found == self.total_pairs:
+            if self.engine.won:
                 self.game_won = True
                 self.game_time = time.time() - self.start_time
                 # Final celebration
-                center_x, center_y = WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2
+                center_x, center_y = self.window_width // 2, self.window_height // 2
                 self.create_celebration_particles(center_x, center_y, 30)
 
         else:
             # No match - flip back after delay
+            self.flip_back_cells.extend(self.flipped_cells)
             pygame.time.set_timer(pygame.USEREVENT + 2, 1200)
 
         # Clear flipped cards reference (but keep them visually flipped for now)
-        self.flipped_cards = []
+        self.flipped_cells = []
+        self.refresh_hover()
 
     def flip_back_non_matches(self):
         """Flip back non-matching cards with animation"""
-        for card in self.cards:
-            if card.is_flipped and not card.is_matched:
-                # Only flip back if this card is not part of a current match
-                should_flip_back = True
-                for flipped in self.flipped_cards:
-                    if flipped == card:
-                        should_flip_back = False
-                        break
-
-                if should_flip_back:
+        for index in self.flip_back_cells:
+            # Only flip back if this card is not part of a current match
+            if index not in self.flipped_cells and self.engine.conceal(index):
+                card = self.visible.get(index)
+                if card is not None:
                     card.flip()
+        self.flip_back_cells = []
+        self.refresh_hover()
 
     def update_effects(self, dt):
         """Update visual effects"""
         # Update particles
-        self.particles = [p for p in self.particles if p.is_alive()]
-        for particle in self.particles:
-            particle.update(dt)
+        self.particles.update(dt)
 
         # Update stars
-        for star in self.stars:
-            star.update(dt)
+        self.stars_refreshed = self.starfield.update(dt)
 
         # Update screen shake
         if self.screen_shake > 0:
             self.screen_shake -= dt
 
-    def draw_enhanced_ui(self):
-        """Draw enhanced UI with better typography and layout"""
+    def hud_items(self):
+        """Title and stats panel as (name, text, blits, rect) in drawing order"""
         # Calculate shake offset
         shake_x = shake_y = 0
         if self.screen_shake > 0:
@@ -717,29 +1039,25 @@ class MemoryGame:
 
         # Apply shake to screen
         shake_offset = (int(shake_x), int(shake_y))
-
-        # Background with gradient effect
-        self.screen.fill(COLORS['background'])
-
-        # Draw twinkling starfield
-        for star in self.stars:
-            star.draw(self.screen)
+        items = []
 
         # Title with glow effect
-        title_text = self.title_font.render("Star Wars Memory Game", True, COLORS['primary'])
+        title = "Star Wars Memory Game"
+        title_text = render_text(self.title_font, title, COLORS['primary'])
         title_rect = title_text.get_rect()
-        title_rect.centerx = WINDOW_WIDTH // 2 + shake_offset[0]
+        title_rect.centerx = self.window_width // 2 + shake_offset[0]
         title_rect.y = 20 + shake_offset[1]
 
         # Glow effect for title
-        glow_text = self.title_font.render("Star Wars Memory Game", True, COLORS['primary_light'])
+        glow_text = render_text(self.title_font, title, COLORS['primary_light'])
+        blits = []
         for offset in [(1, 1), (-1, -1), (1, -1), (-1, 1)]:
             glow_rect = title_rect.copy()
             glow_rect.x += offset[0]
             glow_rect.y += offset[1]
-            self.screen.blit(glow_text, glow_rect)
-
-        self.screen.blit(title_text, title_rect)
+            blits.append((glow_text, glow_rect))
+        blits.append((title_text, title_rect))
+        items.append(('title', title, blits, title_rect.inflate(2, 2)))
 
         # Game stats in a nice panel
         current_time = time.time() - self.start_time if not self.game_won else self.game_time
@@ -749,38 +1067,61 @@ class MemoryGame:
         stats_y = 70 + shake_offset[1]
 
         # Moves counter
-        moves_text = f"Moves: {self.moves}"
-        moves_surface = self.font.render(moves_text, True, COLORS['text_primary'])
+        moves_text = f"Moves: {self.engine.moves}"
+        moves_surface = render_text(self.font, moves_text, COLORS['text_primary'])
         moves_rect = moves_surface.get_rect()
         moves_rect.x = 50 + shake_offset[0]
         moves_rect.y = stats_y
-        self.screen.blit(moves_surface, moves_rect)
+        items.append(('moves', moves_text, [(moves_surface, moves_rect)], moves_rect))
 
         # Matches counter
-        matches_text = f"Matches: {self.matches_found}/{self.total_pairs}"
-        matches_surface = self.font.render(matches_text, True, COLORS['text_primary'])
+        matches_text = f"Matches: {self.engine.matches}/{self.total_pairs}"
+        matches_surface = render_text(self.font, matches_text, COLORS['text_primary'])
         matches_rect = matches_surface.get_rect()
-        matches_rect.centerx = WINDOW_WIDTH // 2 + shake_offset[0]
+        matches_rect.centerx = self.window_width // 2 + shake_offset[0]
         matches_rect.y = stats_y
-        self.screen.blit(matches_surface, matches_rect)
+        items.append(('matches', matches_text, [(matches_surface, matches_rect)], matches_rect))
 
         # Timer
         time_text = f"Time: {minutes:02d}:{seconds:02d}"
-        time_surface = self.font.render(time_text, True, COLORS['text_primary'])
+        time_surface = render_text(self.font, time_text, COLORS['text_primary'])
         time_rect = time_surface.get_rect()
-        time_rect.right = WINDOW_WIDTH - 50 + shake_offset[0]
+        time_rect.right = self.window_width - 50 + shake_offset[0]
         time_rect.y = stats_y
-        self.screen.blit(time_surface, time_rect)
+        items.append(('time', time_text, [(time_surface, time_rect)], time_rect))
 
         # Combo indicator
         if self.combo_count > 1:
             combo_text = f"COMBO x{self.combo_count}!"
             combo_color = COLORS['fireworks'] if self.combo_count < 5 else COLORS['success']
-            combo_surface = self.font.render(combo_text, True, combo_color)
+            combo_surface = render_text(self.font, combo_text, combo_color)
             combo_rect = combo_surface.get_rect()
-            combo_rect.centerx = WINDOW_WIDTH // 2 + shake_offset[0]
+            combo_rect.centerx = self.window_width // 2 + shake_offset[0]
             combo_rect.y = stats_y + 30
-            self.screen.blit(combo_surface, combo_rect)
+            items.append(('combo', combo_text, [(combo_surface, combo_rect)], combo_rect))
+
+        return items
+
+    def draw_background(self, regions=None):
+        """Background and starfield, for the whole window or just the given rectangles"""
+        if regions is None:
+            self.starfield.draw(self.screen)
+            return
+
+        for region in regions:
+            self.starfield.draw(self.screen, region)
+
+    def draw_enhanced_ui(self, regions=None, hud=None):
+        """Draw enhanced UI with better typography and layout"""
+        if hud is None:
+            hud = self.hud_items()
+        self.draw_background(regions)
+
+        for name, text, blits, rect in hud:
+            if regions is None or rect.collidelist(regions) != -1:
+                for surface, position in blits:
+                    self.screen.blit(surface, position)
+        self.hud_state = {name: (text, tuple(rect)) for name, text, blits, rect in hud}
 
     def draw_win_screen(self):
         """Enhanced win screen with statistics"""
@@ -788,14 +1129,14 @@ class MemoryGame:
             return
 
         # Semi-transparent overlay
-        overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
+        overlay = pygame.Surface((self.window_width, self.window_height))
         overlay.set_alpha(180)
         overlay.fill((0, 0, 0))
         self.screen.blit(overlay, (0, 0))
 
         # Win message
-        win_text = self.large_font.render("Victory!", True, COLORS['fireworks'])
-        win_rect = win_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 - 80))
+        win_text = render_text(self.large_font, "Victory!", COLORS['fireworks'])
+        win_rect = win_text.get_rect(center=(self.window_width // 2, self.window_height // 2 - 80))
         self.screen.blit(win_text, win_rect)
 
         # Statistics
@@ -804,91 +1145,299 @@ class MemoryGame:
 
         stats = [
             f"Time: {minutes:02d}:{seconds:02d}",
-            f"Moves: {self.moves}",
+            f"Moves: {self.engine.moves}",
             f"Best Combo: x{max(1, self.combo_count)}"
         ]
 
         for i, stat in enumerate(stats):
-            stat_surface = self.font.render(stat, True, COLORS['text_primary'])
-            stat_rect = stat_surface.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 - 20 + i * 30))
+            stat_surface = render_text(self.font, stat, COLORS['text_primary'])
+            stat_rect = stat_surface.get_rect(center=(self.window_width // 2, self.window_height // 2 - 20 + i * 30))
             self.screen.blit(stat_surface, stat_rect)
 
         # Instructions
-        restart_text = self.font.render("Press R to restart or ESC to exit", True, COLORS['text_secondary'])
-        restart_rect = restart_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + 80))
+        restart_text = render_text(self.font, "Press R to restart or ESC to exit", COLORS['text_secondary'])
+        restart_rect = restart_text.get_rect(center=(self.window_width // 2, self.window_height // 2 + 80))
         self.screen.blit(restart_text, restart_rect)
 
     def draw(self):
         """Enhanced main draw function"""
         dt = self.clock.get_time()
+        profiler = self.profiler
+
+        # Pick up images streamed in by the background loader
+        with profiler.phase('images'):
+            self.poll_image_stream()
 
         # Update effects
-        self.update_effects(dt)
+        with profiler.phase('update_effects'):
+            self.update_effects(dt)
+
+        # Update cards
+        with profiler.phase('card_update'):
+            for card in self.cards:
+                card.update(dt)
+
+        # Shaking moves the HUD every frame and the win screen dims everything
+        if not DIRTY_RECT_RENDERING or self.full_redraw or self.screen_shake > 0 or self.game_won:
+            self.draw_full_frame()
+        else:
+            self.draw_dirty_frame()
+
+    def draw_full_frame(self):
+        """Repaint the whole window and flip it"""
+        profiler = self.profiler
 
         # Draw UI
-        self.draw_enhanced_ui()
+        with profiler.phase('draw_enhanced_ui'):
+            self.draw_enhanced_ui()
 
-        # Update and draw cards
-        for card in self.cards:
-            card.update(dt, self.mouse_pos)
-            card.draw(self.screen, self.font, self.small_font)
+        # Draw cards
+        with profiler.phase('card_draw'):
+            self.screen.set_clip(self.board_clip())
+            for card in self.cards:
+                card.draw(self.screen, self.small_font)
+            self.screen.set_clip(None)
 
         # Draw particles
-        for particle in self.particles:
-            particle.draw(self.screen)
+        with profiler.phase('particles'):
+            self.particles.draw(self.screen)
+            self.particle_bounds = self.particles.bounds()
 
         # Draw win screen if game is won
-        self.draw_win_screen()
+        with profiler.phase('draw_win_screen'):
+            self.draw_win_screen()
+
+        self.pixels_pushed = self.window_width * self.window_height
+        self.full_redraw = False
+        self.draw_overlays([self.screen.get_rect()])
+
+        with profiler.phase('display'):
+            pygame.display.flip()
+
+    def draw_dirty_frame(self):
+        """Repaint and push only what changed since the last frame"""
+        profiler = self.profiler
+        dirty = self.dirty
+
+        with profiler.phase('dirty_rects'):
+            dirty.clear()
+
+            # Cards that moved, flipped, pulsed or got a new face: old and new area
+            for card in self.cards:
+                if card.needs_redraw():
+                    if card.drawn_bounds:
+                        dirty.add(card.drawn_bounds)
+                    dirty.add(card.paint_bounds())
+
+            # HUD fields whose text or position changed, or that disappeared
+            hud = self.hud_items()
+            current = {name: (text, tuple(rect)) for name, text, blits, rect in hud}
+            for name, state in self.hud_state.items():
+                if current.get(name) != state:
+                    dirty.add(state[1])
+            for name, state in current.items():
+                if self.hud_state.get(name) != state:
+                    dirty.add(state[1])
+
+            # Where the particles were and where they are now
+            particle_bounds = self.particles.bounds()
+            for bounds in (self.particle_bounds, particle_bounds):
+                if bounds:
+                    dirty.add(bounds)
+            self.particle_bounds = particle_bounds
+
+            # Stars only twinkle in open sky; one peeking past a card's rounded
+            # corner keeps its colour until that card is repainted anyway
+            layers = [card.paint_bounds() for card in self.cards]
+            layers.extend(rect for name, text, blits, rect in hud)
+            if self.stars_refreshed:
+                for rect in self.starfield.dirty_rects(layers):
+                    dirty.add(rect)
+
+            # Cards and HUD fields overlapping a dirty area are redrawn whole
+            dirty.expand(layers)
+            changed = list(dirty.rects)
+
+            # Wipe last frame's debug overlays
+            if self.overlay_rects:
+                for rect in self.overlay_rects:
+                    dirty.add(rect)
+                dirty.expand(layers)
+                self.overlay_rects = []
+
+        if not dirty:
+            self.pixels_pushed = 0
+            return
 
-        pygame.display.flip()
+        regions = dirty.rects
+        with profiler.phase('draw_enhanced_ui'):
+            self.draw_enhanced_ui(regions, hud)
+        with profiler.phase('card_draw'):
+            self.screen.set_clip(self.board_clip())
+            for card in self.cards:
+                if card.paint_bounds().collidelist(regions) != -1:
+                    card.draw(self.screen, self.small_font)
+            self.screen.set_clip(None)
+        with profiler.phase('particles'):
+            self.particles.draw(self.screen)
+
+        self.pixels_pushed = dirty.pixels()
+        updates = list(regions)
+        updates.extend(self.draw_overlays(changed))
+
+        with profiler.phase('display'):
+            pygame.display.update(updates)
+
+    def draw_overlays(self, dirty_rects) -> List[pygame.Rect]:
+        """Debug overlays on top of the frame; returns their rects, which are wiped next frame"""
+        rects = []
+        if self.show_dirty_overlay:
+            rects.extend(self.draw_dirty_overlay(dirty_rects))
+        if self.show_profiler:
+            rects.append(self.profiler.draw(self.screen, self.profile_font, self.clock.get_time(), COLORS))
+        self.overlay_rects = rects
+        return rects
+
+    def draw_dirty_overlay(self, rects) -> List[pygame.Rect]:
+        """Outline this frame's dirty rectangles and report the pixels pushed"""
+        for rect in rects:
+            pygame.draw.rect(self.screen, COLORS['fireworks'], rect, 1)
+
+        total = self.window_width * self.window_height
+        label = (f"Dirty: {len(rects)} rects, {self.pixels_pushed:,} px "
+                 f"({self.pixels_pushed / total:.1%})")
+        # Changes every frame, so keep it out of the shared text cache
+        text = self.small_font.render(label, True, COLORS['infinity'], COLORS['background'])
+        label_rect = text.get_rect(bottomleft=(10, self.window_height - 10))
+        self.screen.blit(text, label_rect)
+
+        return list(rects) + [label_rect]
 
     def restart_game(self):
         """Restart with smooth transitions"""
-        self.__init__()
+        self.stop_image_stream()
+        # Frame timings, debug overlays, pacing and the pointer carry over into the new game
+        settings = (self.profiler, self.show_profiler, self.show_dirty_overlay, self.pacer, self.mouse_pos)
+        self.__init__(self.grid_size)
+        self.profiler, self.show_profiler, self.show_dirty_overlay, self.pacer, self.mouse_pos = settings
+        self.clock = self.pacer.clock
+        self.refresh_hover()
+
+    def export_profile(self):
+        """Write frame timing histograms if MEMORY_GAME_PROFILE names a .csv or .json file"""
+        path = os.environ.get(PROFILE_ENV)
+        if not path:
+            return
+        try:
+            self.profiler.export(path)
+            print(f"Frame timings written to {path}")
+        except OSError as e:
+            print(f"Could not write frame timings: {e}")
+
+    def handle_event(self, event) -> bool:
+        """React to one event; False once the player asked to quit"""
+        if event.type == pygame.QUIT:
+            return False
+        elif event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_ESCAPE:
+                return False
+            elif event.key == pygame.K_r and self.game_won:
+                self.restart_game()
+            elif event.key == pygame.K_F2:
+                self.show_profiler = not self.show_profiler
+                self.full_redraw = True
+            elif event.key == pygame.K_F3:
+                self.show_dirty_overlay = not self.show_dirty_overlay
+                self.full_redraw = True
+            elif event.key in SCROLL_KEYS:
+                # One card per press
+                columns, rows = SCROLL_KEYS[event.key]
+                self.scroll_view(columns * self.viewport.scale(CARD_WIDTH + CARD_MARGIN),
+                                 rows * self.viewport.scale(CARD_HEIGHT + CARD_MARGIN))
+            elif event.key in ZOOM_IN_KEYS:
+                self.zoom_view(1, self.viewport.area.center)
+            elif event.key in ZOOM_OUT_KEYS:
+                self.zoom_view(-1, self.viewport.area.center)
+        elif event.type == pygame.MOUSEBUTTONDOWN:
+            if event.button == 1:  # Left click
+                self.handle_card_click(event.pos)
+        elif event.type == pygame.MOUSEWHEEL:
+            if pygame.key.get_mods() & pygame.KMOD_CTRL:
+                self.zoom_view(event.y, self.mouse_pos)
+            else:
+                self.scroll_view(event.x * VIEWPORT_WHEEL_STEP, -event.y * VIEWPORT_WHEEL_STEP)
+        elif event.type == pygame.MOUSEMOTION:
+            self.mouse_pos = event.pos
+            if event.buttons[2]:  # Right-drag pans the board
+                self.scroll_view(-event.rel[0], -event.rel[1])
+            self.refresh_hover()
+        elif event.type == pygame.USEREVENT + 1:
+            # Check for match
+            pygame.time.set_timer(pygame.USEREVENT + 1, 0)  # Cancel timer
+            self.check_match()
+        elif event.type == pygame.USEREVENT + 2:
+            # Flip back non-matching cards
+            pygame.time.set_timer(pygame.USEREVENT + 2, 0)  # Cancel timer
+            self.flip_back_non_matches()
+        return True
+
+    def is_idle(self) -> bool:
+        """Nothing on screen will change until input, a timer or the next scheduled update"""
+        loading = self.image_loader is not None and self.image_loader.pending
+        return (not loading and not self.full_redraw and self.screen_shake <= 0
+                and not len(self.particles) and not any(card.is_animating() for card in self.cards))
+
+    def idle_timeout(self) -> float:
+        """Milliseconds until the starfield or the HUD clock next changes"""
+        timeout = self.starfield.refresh_ms - self.starfield.since_refresh
+        if not self.game_won:
+            elapsed_ms = (time.time() - self.start_time) * 1000
+            timeout = min(timeout, 1000 - elapsed_ms % 1000)
+        return timeout
 
-    def run(self):
-        """Enhanced main game loop"""
+    def step(self) -> bool:
+        """One frame: handle events, update and draw, then wait for the next tick"""
         running = True
+        with self.profiler.phase('events'):
+            events, self.pending_events = self.pending_events + pygame.event.get(), []
+            for event in events:
+                if not self.handle_event(event):
+                    running = False
 
-        while running:
-            dt = self.clock.get_time()
+        self.draw()
+        with self.profiler.phase('tick'):
+            woken_by = self.pacer.wait(self.is_idle(), self.idle_timeout())
+            if woken_by is not None:
+                self.pending_events.append(woken_by)
+        self.profiler.end_frame()
+        return running
 
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    running = False
-                elif event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_ESCAPE:
-                        running = False
-                    elif event.key == pygame.K_r and self.game_won:
-                        self.restart_game()
-                elif event.type == pygame.MOUSEBUTTONDOWN:
-                    if event.button == 1:  # Left click
-                        self.handle_card_click(event.pos)
-                elif event.type == pygame.MOUSEMOTION:
-                    self.mouse_pos = event.pos
-                elif event.type == pygame.USEREVENT + 1:
-                    # Check for match
-                    pygame.time.set_timer(pygame.USEREVENT + 1, 0)  # Cancel timer
-                    self.check_match()
-                elif event.type == pygame.USEREVENT + 2:
-                    # Flip back non-matching cards
-                    pygame.time.set_timer(pygame.USEREVENT + 2, 0)  # Cancel timer
-                    self.flip_back_non_matches()
-
-            self.draw()
-            self.clock.tick(60)  # 60 FPS for smooth animations
-
-        pygame.quit()
+    def report_pacing(self):
+        stats = self.pacer.stats()
+        print(f"Frame pacing: active {stats['active_seconds']:.1f}s ({stats['active_frames']} frames), "
+              f"idle {stats['idle_seconds']:.1f}s ({stats['idle_frames']} frames)")
+
+    def run(self):
+        """Enhanced main game loop"""
+        while self.step():
+            pass
+
+        self.stop_image_stream()
+        text_stats = TEXT_CACHE.stats()
+        print(f"Text cache: {text_stats['hit_rate']:.1%} hits, {text_stats['entries']} entries")
+        self.report_pacing()
+        self.export_profile()
+        quit_pygame()
         sys.exit()
 
 class ScrollingCredits:
     """Star Wars-style scrolling credits with original content"""
     def __init__(self, screen):
         self.screen = screen
-        self.font_title = pygame.font.Font(None, 64)
-        self.font_large = pygame.font.Font(None, 48)
-        self.font_medium = pygame.font.Font(None, 36)
-        self.font_small = pygame.font.Font(None, 28)
+        self.font_title = FONTS.get(None, 64)
+        self.font_large = FONTS.get(None, 48)
+        self.font_medium = FONTS.get(None, 36)
+        self.font_small = FONTS.get(None, 28)
 
         # Credits text with Star Wars-style humor
         self.credits_text = [
@@ -933,6 +1482,56 @@ class ScrollingCredits:
         self.scroll_speed = 50  # pixels per second
         self.total_height = len(self.credits_text) * 50  # approximate height
 
+        # Everything drawn per frame is built once up front
+        self.crawl = self.render_crawl()
+        self.top_fade, self.bottom_fade = self.render_fades()
+        self.backdrops = [self.render_backdrop() for _ in range(CREDITS_BACKDROPS)]
+        self.frame = 0
+
+    def render_crawl(self):
+        """All credit lines on one tall transparent surface, line i centred at CREDITS_MARGIN + i * 50"""
+        width = self.screen.get_width()
+        crawl = pygame.Surface((width, self.total_height + CREDITS_MARGIN * 2), pygame.SRCALPHA)
+        for i, (text, font, color) in enumerate(self.credits_text):
+            if text:  # Skip empty lines for rendering
+                text_surface = font.render(text, True, color)
+                text_rect = text_surface.get_rect(center=(width // 2, CREDITS_MARGIN + i * 50))
+                crawl.blit(text_surface, text_rect)
+        return crawl.convert_alpha()
+
+    def render_fades(self):
+        """Top and bottom gradients that mask the crawl as it enters and leaves"""
+        fade_height = 150  # Increased height for better coverage
+        width = self.screen.get_width()
+
+        # Create fade surfaces
+        top_fade = pygame.Surface((width, fade_height), pygame.SRCALPHA)
+        bottom_fade = pygame.Surface((width, fade_height), pygame.SRCALPHA)
+
+        # Create proper gradient from fully opaque to transparent
+        for i in range(fade_height):
+            # For top fade: fully opaque at top (i=0), transparent at bottom (i=fade_height-1)
+            top_alpha = int(255 * (1 - i / fade_height))
+            top_fade.fill((*COLORS['background'], top_alpha), (0, i, width, 1))
+
+            # For bottom fade: transparent at top (i=0), fully opaque at bottom (i=fade_height-1)
+            bottom_alpha = int(255 * (i / fade_height))
+            bottom_fade.fill((*COLORS['background'], bottom_alpha), (0, i, width, 1))
+
+        return top_fade.convert_alpha(), bottom_fade.convert_alpha()
+
+    def render_backdrop(self):
+        """Background with one random scattering of stars"""
+        backdrop = pygame.Surface(self.screen.get_size())
+        backdrop.fill(COLORS['background'])
+        for i in range(50):
+            star_x = random.randint(0, self.screen.get_width())
+            star_y = random.randint(0, self.screen.get_height())
+            star_brightness = random.randint(100, 255)
+            star_color = (star_brightness, star_brightness, star_brightness)
+            pygame.draw.circle(backdrop, star_color, (star_x, star_y), 1)
+        return backdrop.convert()
+
     def update(self, dt):
         """Update scroll position"""
         self.scroll_y -= self.scroll_speed * dt / 1000
@@ -951,53 +1550,21 @@ class ScrollingCredits:
 
     def draw(self):
         """Draw the scrolling credits"""
-        self.screen.fill(COLORS['background'])
-
-        # Add starfield background effect
-        for i in range(50):
-            star_x = random.randint(0, self.screen.get_width())
-            star_y = random.randint(0, self.screen.get_height())
-            star_brightness = random.randint(100, 255)
-            star_color = (star_brightness, star_brightness, star_brightness)
-            pygame.draw.circle(self.screen, star_color, (star_x, star_y), 1)
-
-        # Draw credits text
-        current_y = self.scroll_y
-        screen_center_x = self.screen.get_width() // 2
-
-        for text, font, color in self.credits_text:
-            if -100 < current_y < self.screen.get_height() + 100:  # Only draw visible text
-                if text:  # Skip empty lines for rendering
-                    text_surface = font.render(text, True, color)
-                    text_rect = text_surface.get_rect(center=(screen_center_x, current_y))
-                    self.screen.blit(text_surface, text_rect)
-
-            current_y += 50  # Line spacing
-
-        # Add improved fade effect at top and bottom for better text masking
-        fade_height = 150  # Increased height for better coverage
-
-        # Create fade surfaces
-        top_fade = pygame.Surface((self.screen.get_width(), fade_height), pygame.SRCALPHA)
-        bottom_fade = pygame.Surface((self.screen.get_width(), fade_height), pygame.SRCALPHA)
-
-        # Create proper gradient from fully opaque to transparent
-        for i in range(fade_height):
-            # For top fade: fully opaque at top (i=0), transparent at bottom (i=fade_height-1)
-            top_alpha = int(255 * (1 - i / fade_height))
-            top_color = (*COLORS['background'], top_alpha)
-
-            # For bottom fade: transparent at top (i=0), fully opaque at bottom (i=fade_height-1)
-            bottom_alpha = int(255 * (i / fade_height))
-            bottom_color = (*COLORS['background'], bottom_alpha)
-
-            # Fill each row of the fade surfaces
-            pygame.draw.rect(top_fade, top_color, (0, i, self.screen.get_width(), 1))
-            pygame.draw.rect(bottom_fade, bottom_color, (0, i, self.screen.get_width(), 1))
+        # Flickering starfield: cycle through the pre-built backdrops
+        self.screen.blit(self.backdrops[self.frame % len(self.backdrops)], (0, 0))
+        self.frame += 1
+
+        # Visible slice of the crawl
+        height = self.screen.get_height()
+        source_top = CREDITS_MARGIN - int(self.scroll_y)
+        dest_y = max(0, -source_top)
+        source_top = max(0, source_top)
+        self.screen.blit(self.crawl, (0, dest_y),
+                         pygame.Rect(0, source_top, self.screen.get_width(), height - dest_y))
 
         # Apply the fade overlays
-        self.screen.blit(top_fade, (0, 0))
-        self.screen.blit(bottom_fade, (0, self.screen.get_height() - fade_height))
+        self.screen.blit(self.top_fade, (0, 0))
+        self.screen.blit(self.bottom_fade, (0, height - self.bottom_fade.get_height()))
 
         pygame.display.flip()
 
@@ -1015,15 +1582,15 @@ def show_credits():
 
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
-                pygame.quit()
+                quit_pygame()
                 sys.exit()
 
             if not credits.handle_event(event):
-                pygame.quit()
+                quit_pygame()
                 return  # Skip to game
 
         if not credits.update(dt):
-            pygame.quit()
+            quit_pygame()
             return  # Credits finished
 
         credits.draw()
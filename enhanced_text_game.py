@@ -1,10 +1,29 @@
-import requests
+import itertools
 import random
 import time
 import os
 import sys
 from datetime import datetime
 import re
+from roster_cache import RosterError, RosterPrefetch
+from memory_engine import MemoryEngine, MATCH
+from pair_index import PairIndex
+from terminal_renderer import TerminalRenderer, RENDER_STATS_ENV, clear_screen, display_width
+from timeline import Timeline
+
+EMPTY_CARD = {'id': 999, 'name': 'Empty'}  # filler for slots the roster cannot fill
+CELL_WIDTH = 11  # board columns are 12 wide: the card plus a space
+HIDDEN_SYMBOLS = ["⭐", "🌌", "⚔️", "🚀", "👑", "🛸"]
+DIFFICULTY_GRID_SIZES = (4, 6)  # boards of the presets in show_welcome_screen
+FALLBACK_NAMES = [
+    "Luke Skywalker", "Princess Leia", "Han Solo", "Chewbacca", "Obi-Wan Kenobi",
+    "Darth Vader", "Yoda", "R2-D2", "C-3PO", "Emperor Palpatine",
+    "Anakin Skywalker", "Padmé Amidala", "Mace Windu", "Qui-Gon Jinn",
+    "Count Dooku", "General Grievous", "Boba Fett", "Jango Fett",
+    "Rey", "Finn", "Poe Dameron", "Kylo Ren", "BB-8", "Captain Phasma",
+    "Ahsoka Tano", "Ezra Bridger", "Kanan Jarrus", "Sabine Wren",
+    "Grand Admiral Thrawn", "Director Krennic", "Jyn Erso", "Cassian Andor"
+]
 
 class Colors:
     """WTW Color Palette - ANSI color codes for enhanced terminal output"""
@@ -69,16 +88,48 @@ class Colors:
     TEXT_WARNING = WARNING_PRIMARY
     TEXT_INFO = STRATOSPHERE_PRIMARY
 
+def fallback_characters(pairs):
+    """Enhanced fallback with more characters"""
+    return [{
+        'id': i + 1,
+        'name': FALLBACK_NAMES[i],
+        'homeworld': 'Unknown',
+        'species': 'Unknown'
+    } for i in range(min(pairs, len(FALLBACK_NAMES)))]
+
+def deal_deck(roster, grid_size):
+    """Characters for a board and its shuffled card ids; roster None means use the fallback"""
+    pairs = (grid_size * grid_size) // 2
+    if roster is None:
+        characters = fallback_characters(pairs)
+    elif len(roster) >= pairs:
+        characters = random.sample(roster, pairs)
+    else:
+        characters = roster[:pairs]
+
+    # Create pairs, fill remaining slots if needed and shuffle
+    cards = [character['id'] for character in characters for _ in range(2)]
+    cards.extend([EMPTY_CARD['id']] * (grid_size * grid_size - len(cards)))
+    random.shuffle(cards)
+    return characters, cards
+
+def start_roster_prefetch():
+    """Fetch the roster and deal a deck for every difficulty in the background"""
+    return RosterPrefetch(lambda roster: {size: deal_deck(roster, size) for size in DIFFICULTY_GRID_SIZES}).start()
+
 class EnhancedTextMemoryGame:
-    def __init__(self):
+    def __init__(self, prefetch=None):
+        # Roster and decks load in the background while the player reads the menus
+        self.prefetch = prefetch or start_roster_prefetch()
         self.grid_size = 6
         self.total_pairs = (self.grid_size * self.grid_size) // 2
-        self.board = [[None for _ in range(self.grid_size)] for _ in range(self.grid_size)]
-        self.revealed = [[False for _ in range(self.grid_size)] for _ in range(self.grid_size)]
-        self.matched = [[False for _ in range(self.grid_size)] for _ in range(self.grid_size)]
+        self.engine = MemoryEngine([], self.grid_size)
+        self.roster = {}  # card id -> character
+        self.pairs = PairIndex(self.engine)
+        self.cell_faces = []  # per cell: hidden, face-up and matched strings
+        self.column_header = ""
         self.characters = []
-        self.moves = 0
-        self.matches_found = 0
+        self.deck_cards = []  # shuffled card ids for the board
         self.start_time = None
         self.game_time = 0
         self.combo_count = 0
@@ -90,9 +141,10 @@ class EnhancedTextMemoryGame:
         self.move_history = []
         self.last_revealed = []
 
-        # Enable color support on Windows
-        if os.name == 'nt':
-            os.system('color')
+        # Redraws only what changed; also turns on colors in the Windows console
+        self.renderer = TerminalRenderer()
+        # Cosmetic pauses: scaled by MEMORY_GAME_PACING, cut short by any key
+        self.timeline = Timeline()
 
         self.show_welcome_screen()
         self.load_characters()
@@ -155,93 +207,94 @@ class EnhancedTextMemoryGame:
                 print(f"{Colors.ERROR_PRIMARY}Invalid choice! Please enter 1, 2, or 3.{Colors.RESET}")
 
         self.total_pairs = (self.grid_size * self.grid_size) // 2
-        self.board = [[None for _ in range(self.grid_size)] for _ in range(self.grid_size)]
-        self.revealed = [[False for _ in range(self.grid_size)] for _ in range(self.grid_size)]
-        self.matched = [[False for _ in range(self.grid_size)] for _ in range(self.grid_size)]
 
         print(f"\n{Colors.SUCCESS_PRIMARY}Great choice! Loading your {self.difficulty} difficulty game...{Colors.RESET}")
-        time.sleep(1.5)
+        self.timeline.pause(1.5)
     def load_characters(self):
-        """Load characters with WTW-themed progress indication"""
+        """Pick up the characters prefetched since launch, with WTW-themed progress"""
         print(f"\n{Colors.STRATOSPHERE_PRIMARY}🚀 Loading Star Wars characters from a galaxy far, far away...{Colors.RESET}")
 
-        # Animated loading with ultraviolet theme
-        for i in range(3):
-            for char in "⠋⠙⠹⠸⠼⠴⠦⠧⠇⠏":
-                print(f"\r{Colors.ULTRAVIOLET_PRIMARY}{char} Connecting to the Force...{Colors.RESET}", end="", flush=True)
-                time.sleep(0.1)
-
-        try:
-            response = requests.get("https://akabab.github.io/starwars-api/api/all.json")
-            if response.status_code == 200:
-                all_characters = response.json()
-                if len(all_characters) >= self.total_pairs:
-                    self.characters = random.sample(all_characters, self.total_pairs)
-                else:
-                    self.characters = all_characters[:self.total_pairs]
-                print(f"\r{Colors.SUCCESS_PRIMARY}✅ Successfully loaded {len(self.characters)} characters!{Colors.RESET}")
-            else:
-                print(f"\r{Colors.WARNING_PRIMARY}⚠️  API connection failed. Using backup characters...{Colors.RESET}")
-                self.use_fallback_characters()
-        except Exception as e:
+        # Spin for as long as the roster is actually still on its way
+        stages = {'fetching': "Connecting to the Force", 'preparing': "Dealing the decks"}
+        spinner = itertools.cycle("⠋⠙⠹⠸⠼⠴⠦⠧⠇⠏")
+        while not self.prefetch.wait(0.1):
+            stage = stages.get(self.prefetch.stage, "Connecting to the Force")
+            elapsed = time.time() - self.prefetch.started_at
+            print(f"\r{Colors.ULTRAVIOLET_PRIMARY}{next(spinner)} {stage}... {elapsed:.1f}s{Colors.RESET}", end="", flush=True)
+
+        decks = self.prefetch.result or {}
+        if self.grid_size not in decks:
+            decks[self.grid_size] = deal_deck(self.prefetch.roster, self.grid_size)
+        self.characters, self.deck_cards = decks[self.grid_size]
+
+        error = self.prefetch.error
+        if error is None:
+            print(f"\r{Colors.SUCCESS_PRIMARY}✅ Successfully loaded {len(self.characters)} characters!{Colors.RESET}")
+        elif isinstance(error, RosterError):
+            print(f"\r{Colors.WARNING_PRIMARY}⚠️  API connection failed. Using backup characters...{Colors.RESET}")
+        else:
             print(f"\r{Colors.WARNING_PRIMARY}⚠️  Connection error. Using backup characters...{Colors.RESET}")
-            self.use_fallback_characters()
-
-        time.sleep(1)
-
-    def use_fallback_characters(self):
-        """Enhanced fallback with more characters"""
-        fallback_names = [
-            "Luke Skywalker", "Princess Leia", "Han Solo", "Chewbacca", "Obi-Wan Kenobi",
-            "Darth Vader", "Yoda", "R2-D2", "C-3PO", "Emperor Palpatine",
-            "Anakin Skywalker", "Padmé Amidala", "Mace Windu", "Qui-Gon Jinn",
-            "Count Dooku", "General Grievous", "Boba Fett", "Jango Fett",
-            "Rey", "Finn", "Poe Dameron", "Kylo Ren", "BB-8", "Captain Phasma",
-            "Ahsoka Tano", "Ezra Bridger", "Kanan Jarrus", "Sabine Wren",
-            "Grand Admiral Thrawn", "Director Krennic", "Jyn Erso", "Cassian Andor"
-        ]
 
-        self.characters = []
-        for i in range(min(self.total_pairs, len(fallback_names))):
-            self.characters.append({
-                'id': i + 1,
-                'name': fallback_names[i],
-                'homeworld': 'Unknown',
-                'species': 'Unknown'
-            })
+        self.timeline.pause(1)
 
     def setup_board(self):
         """Set up board with WTW-themed shuffle animation"""
         print(f"\n{Colors.FIREWORKS_PRIMARY}🎲 Shuffling the galaxy...{Colors.RESET}")
 
-        # Create pairs
-        all_cards = []
-        for character in self.characters:
-            all_cards.extend([character, character])
-
-        # Fill remaining slots if needed
-        while len(all_cards) < self.grid_size * self.grid_size:
-            all_cards.append({'id': 999, 'name': 'Empty'})
-
-        # Animated shuffle with ultraviolet theme
-        for i in range(5):
-            random.shuffle(all_cards)
+        # Animated shuffle with ultraviolet theme; the deck was shuffled in the background
+        for i in self.timeline.animate(range(5), 0.3):
             print(f"\r{Colors.ULTRAVIOLET_PRIMARY}🎲 Shuffling{'.' * (i + 1)}{Colors.RESET}", end="", flush=True)
-            time.sleep(0.3)
 
         # Place on board
-        index = 0
-        for i in range(self.grid_size):
-            for j in range(self.grid_size):
-                self.board[i][j] = all_cards[index]
-                index += 1
+        self.roster = {character['id']: character for character in self.characters}
+        self.roster[EMPTY_CARD['id']] = EMPTY_CARD
+        self.engine = MemoryEngine(self.deck_cards, self.grid_size)
+        self.pairs = PairIndex(self.engine, ignore=(EMPTY_CARD['id'],))
+        self.render_cells()
 
         print(f"\r{Colors.SUCCESS_PRIMARY}✅ Galaxy shuffled and ready!{Colors.RESET}")
-        time.sleep(1)
+        self.timeline.pause(1)
+
+    def render_cells(self):
+        """Build every cell's three faces once, so redrawing the board is only lookups"""
+        faces = {}
+        for card, character in self.roster.items():
+            name = character['name']
+            emoji = self.get_character_emoji(name)
+            # Show temporarily revealed cards with accent color
+            short_name = (name[:7] + "..") if len(name) > 9 else name
+            revealed = f"{Colors.CORAL_PRIMARY}{self.fit_cell(f'{emoji}{short_name}')}{Colors.RESET} "
+            # Show matched cards with success color and character info
+            short_name = (name[:6] + "..") if len(name) > 8 else name
+            matched = f"{Colors.SUCCESS_PRIMARY}{self.fit_cell(f'✓{emoji}{short_name}')}{Colors.RESET} "
+            faces[card] = (revealed, matched)
+
+        self.cell_faces = []
+        for cell, card in enumerate(self.engine.cards):
+            # Show hidden cards with ultraviolet theme
+            row, col = divmod(cell, self.grid_size)
+            symbol = HIDDEN_SYMBOLS[(row + col) % len(HIDDEN_SYMBOLS)]
+            hidden = f"{Colors.BG_ULTRAVIOLET}{Colors.TEXT_CONTRAST}{self.fit_cell(f' {symbol} ?????')}{Colors.RESET} "
+            self.cell_faces.append((hidden,) + faces[card])
+
+        self.column_header = "".join(f"{j+1:^12}" for j in range(self.grid_size))
+
+    def character_at(self, cell):
+        """Character on the card in a board cell"""
+        return self.roster[self.engine.cards[cell]]
+
+    def coordinate(self, cell):
+        """Board cell as the player types it, e.g. B3"""
+        row, col = divmod(cell, self.grid_size)
+        return f"{chr(65 + row)}{col + 1}"
 
     def clear_screen(self):
         """Clear screen with smooth transition"""
-        os.system('cls' if os.name == 'nt' else 'clear')
+        self.renderer.clear()
+
+    def fit_cell(self, text):
+        """Pad a board cell to its column, so a flip only redraws that cell"""
+        return text + " " * (CELL_WIDTH - display_width(text))
 
     def get_character_emoji(self, name):
         """Get emoji for character based on name"""
@@ -263,14 +316,14 @@ class EnhancedTextMemoryGame:
 
     def display_board(self):
         """Enhanced board display with WTW colors and ultraviolet theme"""
-        self.clear_screen()
+        frame = []
 
         # Header with WTW branding
-        print(f"{Colors.ULTRAVIOLET_PRIMARY}{Colors.BOLD}")
-        print("╔" + "═" * 78 + "╗")
-        print(f"║{' ' * 15}⭐ STAR WARS MEMORY GAME - WTW EDITION ⭐{' ' * 16}║")
-        print("╚" + "═" * 78 + "╝")
-        print(f"{Colors.RESET}")
+        frame.append(f"{Colors.ULTRAVIOLET_PRIMARY}{Colors.BOLD}\n")
+        frame.append("╔" + "═" * 78 + "╗\n")
+        frame.append(f"║{' ' * 15}⭐ STAR WARS MEMORY GAME - WTW EDITION ⭐{' ' * 16}║\n")
+        frame.append("╚" + "═" * 78 + "╝\n")
+        frame.append(f"{Colors.RESET}\n")
 
         # Game stats with WTW semantic colors
         current_time = time.time() - self.start_time if self.start_time else 0
@@ -285,71 +338,53 @@ class EnhancedTextMemoryGame:
 
         difficulty_color = difficulty_colors.get(self.difficulty, Colors.TEXT_PRIMARY)
 
-        print(f"{Colors.TEXT_CONTRAST}📊 Stats: {Colors.RESET}", end="")
-        print(f"{Colors.STRATOSPHERE_PRIMARY}Moves: {Colors.TEXT_CONTRAST}{self.moves}{Colors.RESET} | ", end="")
-        print(f"{Colors.SUCCESS_PRIMARY}Matches: {Colors.TEXT_CONTRAST}{self.matches_found}/{self.total_pairs}{Colors.RESET} | ", end="")
-        print(f"{Colors.FIREWORKS_PRIMARY}Time: {Colors.TEXT_CONTRAST}{minutes:02d}:{seconds:02d}{Colors.RESET} | ", end="")
-        print(f"{difficulty_color}Difficulty: {Colors.TEXT_CONTRAST}{self.difficulty.title()}{Colors.RESET}")
+        frame.append(f"{Colors.TEXT_CONTRAST}📊 Stats: {Colors.RESET}")
+        frame.append(f"{Colors.STRATOSPHERE_PRIMARY}Moves: {Colors.TEXT_CONTRAST}{self.engine.moves}{Colors.RESET} | ")
+        frame.append(f"{Colors.SUCCESS_PRIMARY}Matches: {Colors.TEXT_CONTRAST}{self.engine.matches}/{self.total_pairs}{Colors.RESET} | ")
+        frame.append(f"{Colors.FIREWORKS_PRIMARY}Time: {Colors.TEXT_CONTRAST}{minutes:02d}:{seconds:02d}{Colors.RESET} | ")
+        frame.append(f"{difficulty_color}Difficulty: {Colors.TEXT_CONTRAST}{self.difficulty.title()}{Colors.RESET}\n")
 
         if self.hint_count > 0:
-            print(f"{Colors.CORAL_PRIMARY}💡 Hints available: {Colors.TEXT_CONTRAST}{self.hint_count}{Colors.RESET}")
+            frame.append(f"{Colors.CORAL_PRIMARY}💡 Hints available: {Colors.TEXT_CONTRAST}{self.hint_count}{Colors.RESET}\n")
 
         if self.combo_count > 1:
-            print(f"{Colors.FIREWORKS_PRIMARY}🔥 COMBO STREAK: x{self.combo_count}! {Colors.RESET}")
+            frame.append(f"{Colors.FIREWORKS_PRIMARY}🔥 COMBO STREAK: x{self.combo_count}! {Colors.RESET}\n")
 
-        print("─" * 80)
+        frame.append("─" * 80 + "\n")
 
         # Column headers with ultraviolet theme
-        print(f"{Colors.ULTRAVIOLET_PRIMARY}    ", end="")
-        for j in range(self.grid_size):
-            print(f"{j+1:^12}", end="")
-        print(f"{Colors.RESET}")
+        frame.append(f"{Colors.ULTRAVIOLET_PRIMARY}    {self.column_header}{Colors.RESET}\n")
 
-        # Board with WTW color scheme
+        # Board with WTW color scheme: hidden, face up (1) or matched (2)
+        engine, faces = self.engine, self.cell_faces
         for i in range(self.grid_size):
-            print(f"{Colors.ULTRAVIOLET_PRIMARY}{chr(65+i):>2}: {Colors.RESET}", end="")
-            for j in range(self.grid_size):
-                if self.matched[i][j]:
-                    # Show matched cards with success color and character info
-                    name = self.board[i][j]['name']
-                    emoji = self.get_character_emoji(name)
-                    short_name = (name[:8] + "..") if len(name) > 10 else name
-                    print(f"{Colors.SUCCESS_PRIMARY}✓{emoji}{short_name:<8}{Colors.RESET}", end=" ")
-                elif self.revealed[i][j]:
-                    # Show temporarily revealed cards with accent color
-                    name = self.board[i][j]['name']
-                    emoji = self.get_character_emoji(name)
-                    short_name = (name[:8] + "..") if len(name) > 10 else name
-                    print(f"{Colors.CORAL_PRIMARY}{emoji}{short_name:<9}{Colors.RESET}", end=" ")
-                else:
-                    # Show hidden cards with ultraviolet theme
-                    card_symbols = ["⭐", "🌌", "⚔️", "🚀", "👑", "🛸"]
-                    symbol = card_symbols[(i + j) % len(card_symbols)]
-                    print(f"{Colors.BG_ULTRAVIOLET}{Colors.TEXT_CONTRAST} {symbol} ????? {Colors.RESET}", end=" ")
-            print()
-
-        print("─" * 80)
+            frame.append(f"{Colors.ULTRAVIOLET_PRIMARY}{chr(65+i):>2}: {Colors.RESET}")
+            for cell in range(i * self.grid_size, (i + 1) * self.grid_size):
+                frame.append(faces[cell][engine.is_revealed(cell) + engine.is_matched(cell)])
+            frame.append("\n")
+
+        frame.append("─" * 80 + "\n")
 
         # Game completion status with WTW victory theme
-        if self.matches_found == self.total_pairs:
+        if self.engine.won:
             final_time = time.time() - self.start_time
             minutes = int(final_time // 60)
             seconds = int(final_time % 60)
 
-            print(f"{Colors.SUCCESS_PRIMARY}{Colors.BOLD}")
-            print("🎉" * 20)
-            print("🏆 VICTORY! THE FORCE IS STRONG WITH YOU! 🏆")
-            print("🎉" * 20)
-            print(f"{Colors.RESET}")
+            frame.append(f"{Colors.SUCCESS_PRIMARY}{Colors.BOLD}\n")
+            frame.append("🎉" * 20 + "\n")
+            frame.append("🏆 VICTORY! THE FORCE IS STRONG WITH YOU! 🏆\n")
+            frame.append("🎉" * 20 + "\n")
+            frame.append(f"{Colors.RESET}\n")
 
-            print(f"{Colors.ULTRAVIOLET_PRIMARY}📈 Final Statistics:{Colors.RESET}")
-            print(f"   ⏱️  Time: {Colors.TEXT_CONTRAST}{minutes:02d}:{seconds:02d}{Colors.RESET}")
-            print(f"   🎯 Moves: {Colors.TEXT_CONTRAST}{self.moves}{Colors.RESET}")
-            print(f"   🔥 Best Combo: {Colors.TEXT_CONTRAST}x{max(1, self.combo_count)}{Colors.RESET}")
-            print(f"   🏅 Difficulty: {difficulty_color}{self.difficulty.title()}{Colors.RESET}")
+            frame.append(f"{Colors.ULTRAVIOLET_PRIMARY}📈 Final Statistics:{Colors.RESET}\n")
+            frame.append(f"   ⏱️  Time: {Colors.TEXT_CONTRAST}{minutes:02d}:{seconds:02d}{Colors.RESET}\n")
+            frame.append(f"   🎯 Moves: {Colors.TEXT_CONTRAST}{self.engine.moves}{Colors.RESET}\n")
+            frame.append(f"   🔥 Best Combo: {Colors.TEXT_CONTRAST}x{max(1, self.combo_count)}{Colors.RESET}\n")
+            frame.append(f"   🏅 Difficulty: {difficulty_color}{self.difficulty.title()}{Colors.RESET}\n")
 
             # Performance rating with WTW color scheme
-            efficiency = (self.total_pairs * 2) / max(self.moves, 1)
+            efficiency = (self.total_pairs * 2) / max(self.engine.moves, 1)
             if efficiency > 0.8:
                 rating = f"{Colors.SUCCESS_PRIMARY}🌟 Jedi Master{Colors.RESET}"
             elif efficiency > 0.6:
@@ -359,15 +394,17 @@ class EnhancedTextMemoryGame:
             else:
                 rating = f"{Colors.FIREWORKS_PRIMARY}👶 Youngling{Colors.RESET}"
 
-            print(f"   🎖️  Rating: {rating}")
+            frame.append(f"   🎖️  Rating: {rating}\n")
 
         else:
-            print(f"{Colors.TEXT_CONTRAST}💡 Commands: {Colors.RESET}", end="")
-            print(f"{Colors.ULTRAVIOLET_PRIMARY}[A1-{chr(64+self.grid_size)}{self.grid_size}] {Colors.RESET}to select | ", end="")
+            frame.append(f"{Colors.TEXT_CONTRAST}💡 Commands: {Colors.RESET}")
+            frame.append(f"{Colors.ULTRAVIOLET_PRIMARY}[A1-{chr(64+self.grid_size)}{self.grid_size}] {Colors.RESET}to select | ")
             if self.hint_count > 0:
-                print(f"{Colors.CORAL_PRIMARY}[hint] {Colors.RESET}for help | ", end="")
-            print(f"{Colors.WARNING_PRIMARY}[undo] {Colors.RESET}last move | ", end="")
-            print(f"{Colors.ERROR_PRIMARY}[quit] {Colors.RESET}to exit")
+                frame.append(f"{Colors.CORAL_PRIMARY}[hint] {Colors.RESET}for help | ")
+            frame.append(f"{Colors.WARNING_PRIMARY}[undo] {Colors.RESET}last move | ")
+            frame.append(f"{Colors.ERROR_PRIMARY}[quit] {Colors.RESET}to exit\n")
+
+        self.renderer.render("".join(frame))
 
     def get_coordinates(self, coord_str):
         """Enhanced coordinate parsing with better error handling"""
@@ -390,8 +427,7 @@ class EnhancedTextMemoryGame:
         """Check if a move is valid"""
         return (0 <= row < self.grid_size and
                 0 <= col < self.grid_size and
-                not self.matched[row][col] and
-                not self.revealed[row][col])
+                self.engine.can_flip(self.engine.cell(row, col)))
 
     def give_hint(self):
         """Provide a helpful hint with WTW styling"""
@@ -399,25 +435,18 @@ class EnhancedTextMemoryGame:
             print(f"{Colors.ERROR_PRIMARY}❌ No hints available!{Colors.RESET}")
             return False
 
-        # Find a pair that can be hinted
-        for character in self.characters:
-            positions = []
-            for i in range(self.grid_size):
-                for j in range(self.grid_size):
-                    if (self.board[i][j]['id'] == character['id'] and
-                        not self.matched[i][j] and not self.revealed[i][j]):
-                        positions.append((i, j))
-
-            if len(positions) >= 2:
-                pos1, pos2 = positions[:2]
-                name = character['name']
-                coord1 = f"{chr(65 + pos1[0])}{pos1[1] + 1}"
-                coord2 = f"{chr(65 + pos2[0])}{pos2[1] + 1}"
-
-                print(f"{Colors.CORAL_PRIMARY}💡 HINT: {Colors.FIREWORKS_PRIMARY}{name}{Colors.RESET} can be found at positions {Colors.ULTRAVIOLET_PRIMARY}{coord1}{Colors.RESET} and {Colors.ULTRAVIOLET_PRIMARY}{coord2}{Colors.RESET}")
-                self.hint_count -= 1
-                time.sleep(2)
-                return True
+        # Best remaining pair: one the player has seen both cards of, then one card of
+        hint = self.pairs.hint()
+        if hint is not None:
+            card, cell1, cell2 = hint
+            name = self.roster[card]['name']
+            coord1 = self.coordinate(cell1)
+            coord2 = self.coordinate(cell2)
+
+            print(f"{Colors.CORAL_PRIMARY}💡 HINT: {Colors.FIREWORKS_PRIMARY}{name}{Colors.RESET} can be found at positions {Colors.ULTRAVIOLET_PRIMARY}{coord1}{Colors.RESET} and {Colors.ULTRAVIOLET_PRIMARY}{coord2}{Colors.RESET}")
+            self.hint_count -= 1
+            self.timeline.pause(2)
+            return True
 
         print(f"{Colors.WARNING_PRIMARY}💡 No obvious pairs to hint at the moment!{Colors.RESET}")
         return False
@@ -430,15 +459,14 @@ class EnhancedTextMemoryGame:
 
         # Remove last move from history and revert board state
         last_move = self.move_history.pop()
-        for pos in last_move:
-            row, col = pos
-            self.revealed[row][col] = False
+        for cell in last_move:
+            self.engine.conceal(cell)
 
-        if self.moves > 0:
-            self.moves -= 1
+        if self.engine.moves > 0:
+            self.engine.moves -= 1
 
         print(f"{Colors.SUCCESS_PRIMARY}↶ Last move undone!{Colors.RESET}")
-        time.sleep(1)
+        self.timeline.pause(1)
         return True
 
     def play_turn(self):
@@ -462,13 +490,14 @@ class EnhancedTextMemoryGame:
 
             row, col = self.get_coordinates(choice)
             if row is not None and self.is_valid_move(row, col):
-                first_card = (row, col)
-                self.revealed[row][col] = True
-                print(f"{Colors.SUCCESS_PRIMARY}✓ Card selected: {self.board[row][col]['name']}{Colors.RESET}")
-                time.sleep(1)
+                first_card = self.engine.cell(row, col)
+                outcome = self.engine.flip(first_card)
+                self.pairs.record(first_card, outcome)
+                print(f"{Colors.SUCCESS_PRIMARY}✓ Card selected: {self.character_at(first_card)['name']}{Colors.RESET}")
+                self.timeline.pause(1)
             else:
                 print(f"{Colors.ERROR_PRIMARY}❌ Invalid selection! Use format like A1, B3, etc.{Colors.RESET}")
-                time.sleep(1)
+                self.timeline.pause(1)
 
         # Get second card
         while second_card is None:
@@ -482,41 +511,33 @@ class EnhancedTextMemoryGame:
                 continue
             elif choice == 'undo':
                 # For second card, just cancel this turn
-                r1, c1 = first_card
-                self.revealed[r1][c1] = False
+                self.engine.cancel()
                 print(f"{Colors.WARNING_PRIMARY}↶ Turn cancelled{Colors.RESET}")
-                time.sleep(1)
+                self.timeline.pause(1)
                 return True
 
             row, col = self.get_coordinates(choice)
             if row is not None and self.is_valid_move(row, col):
-                second_card = (row, col)
-                self.revealed[row][col] = True
-                print(f"{Colors.SUCCESS_PRIMARY}✓ Card selected: {self.board[row][col]['name']}{Colors.RESET}")
-                time.sleep(1)
+                second_card = self.engine.cell(row, col)
+                outcome = self.engine.flip(second_card)
+                self.pairs.record(second_card, outcome)
+                print(f"{Colors.SUCCESS_PRIMARY}✓ Card selected: {self.character_at(second_card)['name']}{Colors.RESET}")
+                self.timeline.pause(1)
             else:
                 print(f"{Colors.ERROR_PRIMARY}❌ Invalid selection! Use format like A1, B3, etc.{Colors.RESET}")
-                time.sleep(1)
+                self.timeline.pause(1)
 
         # Show both cards
         self.display_board()
-        self.moves += 1
         current_time = time.time()
 
         # Add to move history
         self.move_history.append([first_card, second_card])
 
-        # Check for match with WTW celebration
-        r1, c1 = first_card
-        r2, c2 = second_card
-
-        if self.board[r1][c1]['id'] == self.board[r2][c2]['id']:
+        # The engine resolved the match on the second flip; celebrate with WTW colors
+        if outcome == MATCH:
             print(f"{Colors.SUCCESS_PRIMARY}{Colors.BOLD}🎉 MATCH! 🎉{Colors.RESET}")
-            print(f"{Colors.ULTRAVIOLET_PRIMARY}You found: {Colors.FIREWORKS_PRIMARY}{self.board[r1][c1]['name']}{Colors.RESET}")
-
-            self.matched[r1][c1] = True
-            self.matched[r2][c2] = True
-            self.matches_found += 1
+            print(f"{Colors.ULTRAVIOLET_PRIMARY}You found: {Colors.FIREWORKS_PRIMARY}{self.character_at(first_card)['name']}{Colors.RESET}")
 
             # Combo system with WTW colors
             if current_time - self.last_match_time < 10.0:  # 10 seconds for combo
@@ -535,12 +556,12 @@ class EnhancedTextMemoryGame:
         else:
             print(f"{Colors.ERROR_PRIMARY}❌ No match.{Colors.RESET}")
             print(f"{Colors.TEXT_CONTRAST}Cards will be hidden again...{Colors.RESET}")
-            time.sleep(2.5)  # Longer time to memorize
-            self.revealed[r1][c1] = False
-            self.revealed[r2][c2] = False
+            self.timeline.pause(2.5)  # Longer time to memorize
+            self.engine.conceal(first_card)
+            self.engine.conceal(second_card)
             self.combo_count = 0  # Reset combo on miss
 
-        time.sleep(1.5)
+        self.timeline.pause(1.5)
         return True
 
     def play(self):
@@ -553,9 +574,11 @@ class EnhancedTextMemoryGame:
 
         self.start_time = time.time()
 
-        while self.matches_found < self.total_pairs:
+        while not self.engine.won:
             if not self.play_turn():
                 print(f"\n{Colors.ULTRAVIOLET_PRIMARY}Thanks for playing! May the Force be with you! 🌟{Colors.RESET}")
+                if os.environ.get(RENDER_STATS_ENV):
+                    print(self.renderer.report())
                 return
 
         # Final display
@@ -564,14 +587,15 @@ class EnhancedTextMemoryGame:
         # Additional celebration with WTW theme
         print(f"\n{Colors.FIREWORKS_PRIMARY}✨ The galaxy celebrates your victory! ✨{Colors.RESET}")
         print(f"{Colors.ULTRAVIOLET_PRIMARY}🎊 Thank you for playing the WTW Enhanced Star Wars Memory Game! 🎊{Colors.RESET}")
+        if os.environ.get(RENDER_STATS_ENV):
+            print(self.renderer.report())
 
-def show_console_credits():
+def show_console_credits(timeline=None):
     """Display Star Wars-style opening credits in the console"""
-    import os
-    import time
+    timeline = timeline or Timeline()
 
     # Clear screen
-    os.system('cls' if os.name == 'nt' else 'clear')
+    clear_screen()
 
     credits_lines = [
         ("", ""),
@@ -612,24 +636,15 @@ def show_console_credits():
         else:
             print()  # Empty line
 
-        time.sleep(0.8)  # Pause between lines for dramatic effect
-
-        # Check if user wants to skip
-        try:
-            import select
-            import sys
-            if sys.stdin in select.select([sys.stdin], [], [], 0)[0]:
-                input()  # Consume any input
-                break
-        except:
-            # Windows doesn't support select, so just continue
-            pass
+        # Pause between lines for dramatic effect; any key skips the rest
+        if timeline.pause(0.8):
+            break
 
     # Final pause
-    time.sleep(2)
+    timeline.pause(2)
 
     # Clear screen for game start
-    os.system('cls' if os.name == 'nt' else 'clear')
+    clear_screen()
 
     # Show "Press any key to continue" message
     print(f"{Colors.ULTRAVIOLET_PRIMARY}{'=' * 60}{Colors.RESET}")
@@ -640,15 +655,18 @@ def show_console_credits():
     input()
 
     # Clear screen again
-    os.system('cls' if os.name == 'nt' else 'clear')
+    clear_screen()
 
 if __name__ == "__main__":
     try:
+        # Fetch the roster and deal the decks while the credits roll
+        prefetch = start_roster_prefetch()
+
         # Show opening credits
         show_console_credits()
 
         # Start the game
-        game = EnhancedTextMemoryGame()
+        game = EnhancedTextMemoryGame(prefetch)
         game.play()
     except KeyboardInterrupt:
         print(f"\n{Colors.WARNING_PRIMARY}Game interrupted. May the Force be with you! 🌟{Colors.RESET}")
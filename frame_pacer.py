@@ -0,0 +1,56 @@
+import time
+from typing import Dict, Optional
+
+import pygame
+
+# Longest an idle game sleeps before drawing a frame anyway
+IDLE_MAX_WAIT_MS = 1000
+
+
+class FramePacer:
+    """Ends each frame either at the full frame rate or asleep until something happens
+
+    While anything animates the game ticks at ``fps`` as before. When the
+    caller reports the scene idle, the pacer blocks in pygame.event.wait
+    until input, a timer event or the given timeout (the next moment
+    something on screen is due to change), so a static board uses
+    next to no CPU. Wall time and frames are accounted to each mode.
+    """
+
+    def __init__(self, clock: pygame.time.Clock, fps: int = 60, idle_enabled: bool = True):
+        self.clock = clock
+        self.fps = fps
+        self.idle_enabled = idle_enabled
+        self.mode_seconds: Dict[str, float] = {'active': 0.0, 'idle': 0.0}
+        self.mode_frames: Dict[str, int] = {'active': 0, 'idle': 0}
+        self.last = time.perf_counter()
+
+    def wait(self, idle: bool, timeout_ms: float = IDLE_MAX_WAIT_MS) -> Optional[pygame.event.Event]:
+        """Finish the frame; returns the event that woke an idle wait, if any"""
+        event = None
+        if idle and self.idle_enabled:
+            mode = 'idle'
+            event = pygame.event.wait(max(1, min(int(timeout_ms), IDLE_MAX_WAIT_MS)))
+            if event.type == pygame.NOEVENT:
+                event = None
+            # Keep clock.get_time() the real time since the previous frame
+            self.clock.tick()
+        else:
+            mode = 'active'
+            self.clock.tick(self.fps)
+
+        now = time.perf_counter()
+        self.mode_seconds[mode] += now - self.last
+        self.mode_frames[mode] += 1
+        self.last = now
+        return event
+
+    def stats(self) -> Dict[str, float]:
+        total = sum(self.mode_seconds.values())
+        return {
+            'active_seconds': self.mode_seconds['active'],
+            'idle_seconds': self.mode_seconds['idle'],
+            'active_frames': self.mode_frames['active'],
+            'idle_frames': self.mode_frames['idle'],
+            'idle_share': self.mode_seconds['idle'] / total if total else 0.0,
+        }
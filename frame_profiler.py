@@ -0,0 +1,152 @@
+import csv
+import json
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Deque, Dict, List, Optional, Tuple
+
+import pygame
+
+# Frames kept for the rolling percentiles shown on screen
+PROFILE_WINDOW = 600
+# Histogram buckets for the export: fixed width, last bucket catches the rest
+PROFILE_BUCKET_MS = 0.25
+PROFILE_BUCKETS = 200
+# How often the on-screen table is re-rendered
+PROFILE_OVERLAY_REFRESH_MS = 500
+
+
+def percentile(sorted_samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_samples:
+        return 0.0
+    index = min(len(sorted_samples) - 1, int(pct / 100 * len(sorted_samples)))
+    return sorted_samples[index]
+
+
+class FrameProfiler:
+    """Per-phase frame timings with rolling percentiles and full-session histograms
+
+    Wrap each part of the frame in ``with profiler.phase(name):``; a phase
+    entered several times in one frame is summed. end_frame() closes the
+    frame, also recording its total wall time as the 'frame' phase.
+    """
+
+    def __init__(self, window: int = PROFILE_WINDOW, bucket_ms: float = PROFILE_BUCKET_MS,
+                 buckets: int = PROFILE_BUCKETS):
+        self.window = window
+        self.bucket_ms = bucket_ms
+        self.buckets = buckets
+        self.order: List[str] = []
+        self.samples: Dict[str, Deque[float]] = {}
+        self.histograms: Dict[str, List[int]] = {}
+        self.totals: Dict[str, float] = {}
+        self.current: Dict[str, float] = {}
+        self.frames = 0
+        self.frame_start = time.perf_counter()
+
+        self.panel: Optional[pygame.Surface] = None
+        self.panel_age = PROFILE_OVERLAY_REFRESH_MS
+
+    @contextmanager
+    def phase(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.current[name] = self.current.get(name, 0.0) + time.perf_counter() - start
+
+    def end_frame(self):
+        now = time.perf_counter()
+        self.current['frame'] = now - self.frame_start
+        self.frame_start = now
+        self.frames += 1
+        for name, seconds in self.current.items():
+            self.record(name, seconds * 1000)
+        self.current = {}
+
+    def record(self, name: str, ms: float):
+        if name not in self.samples:
+            self.order.append(name)
+            self.samples[name] = deque(maxlen=self.window)
+            self.histograms[name] = [0] * self.buckets
+            self.totals[name] = 0.0
+        self.samples[name].append(ms)
+        self.histograms[name][min(self.buckets - 1, int(ms / self.bucket_ms))] += 1
+        self.totals[name] += ms
+
+    def phases(self) -> List[str]:
+        """Phase names in the order first seen, with the frame total last"""
+        names = [name for name in self.order if name != 'frame']
+        return names + ['frame'] if 'frame' in self.samples else names
+
+    def percentiles(self, name: str) -> Tuple[float, float, float]:
+        """Rolling p50, p95 and p99 of a phase in milliseconds"""
+        samples = sorted(self.samples.get(name, ()))
+        return percentile(samples, 50), percentile(samples, 95), percentile(samples, 99)
+
+    def summary(self) -> List[Dict[str, float]]:
+        rows = []
+        for name in self.phases():
+            count = sum(self.histograms[name])
+            p50, p95, p99 = self.percentiles(name)
+            rows.append({
+                'phase': name,
+                'count': count,
+                'mean_ms': self.totals[name] / count if count else 0.0,
+                'p50_ms': p50,
+                'p95_ms': p95,
+                'p99_ms': p99,
+            })
+        return rows
+
+    def export(self, path: str):
+        """Write the histograms (and summary) to JSON, or CSV for any other extension"""
+        if path.lower().endswith('.json'):
+            data = {
+                'frames': self.frames,
+                'bucket_ms': self.bucket_ms,
+                'summary': self.summary(),
+                'histograms': self.histograms,
+            }
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2)
+            return
+
+        with open(path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(['phase', 'bucket_start_ms', 'bucket_end_ms', 'count'])
+            for name in self.phases():
+                for index, count in enumerate(self.histograms[name]):
+                    if count:
+                        end = (index + 1) * self.bucket_ms if index < self.buckets - 1 else ''
+                        writer.writerow([name, index * self.bucket_ms, end, count])
+
+    def draw(self, screen: pygame.Surface, font: pygame.font.Font, dt: float,
+             colors: Dict[str, tuple]) -> pygame.Rect:
+        """Blit the timing table in the bottom-right corner and return its rect"""
+        self.panel_age += dt
+        if self.panel is None or self.panel_age >= PROFILE_OVERLAY_REFRESH_MS:
+            self.panel = self.render_panel(font, colors)
+            self.panel_age = 0
+        rect = self.panel.get_rect(bottomright=(screen.get_width() - 10, screen.get_height() - 10))
+        screen.blit(self.panel, rect)
+        return rect
+
+    def render_panel(self, font: pygame.font.Font, colors: Dict[str, tuple]) -> pygame.Surface:
+        rows = [('phase', 'p50', 'p95', 'p99')]
+        for name in self.phases():
+            rows.append((name,) + tuple(f"{value:.2f}" for value in self.percentiles(name)))
+
+        line_height = font.get_linesize()
+        columns = (0, 150, 210, 270)
+        width, padding = 330, 8
+        panel = pygame.Surface((width + padding * 2, line_height * len(rows) + padding * 2))
+        panel.fill(colors['text_contrast'])
+        pygame.draw.rect(panel, colors['primary'], panel.get_rect(), 1)
+        for i, row in enumerate(rows):
+            color = colors['text_secondary'] if i == 0 else colors['text_primary']
+            for x, cell in zip(columns, row):
+                # Changes constantly, so keep it out of the shared text cache
+                panel.blit(font.render(cell, True, color), (padding + x, padding + i * line_height))
+        return panel
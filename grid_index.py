@@ -0,0 +1,68 @@
+from typing import List, Optional, Tuple
+
+import pygame
+
+
+class GridIndex:
+    """Maps positions to the cells of an evenly spaced grid arithmetically
+
+    Built from the board layout: cells of cell_width x cell_height, gap
+    pixels apart, starting at (left, top). Cells are numbered in reading
+    order (row * columns + column). Lookups are a couple of integer
+    divisions, so they cost the same on a 6x6 board as on a 50x50 one.
+    """
+
+    def __init__(self, left: int, top: int, cell_width: int, cell_height: int, gap: int,
+                 columns: int, rows: int):
+        self.left = left
+        self.top = top
+        self.cell_width = cell_width
+        self.cell_height = cell_height
+        self.pitch_x = cell_width + gap
+        self.pitch_y = cell_height + gap
+        self.columns = columns
+        self.rows = rows
+
+    @property
+    def size(self) -> Tuple[int, int]:
+        """Width and height of the whole grid, outer gaps excluded"""
+        return (self.columns * self.pitch_x - (self.pitch_x - self.cell_width),
+                self.rows * self.pitch_y - (self.pitch_y - self.cell_height))
+
+    def cell_rect(self, index: int) -> pygame.Rect:
+        row, column = divmod(index, self.columns)
+        return pygame.Rect(self.left + column * self.pitch_x, self.top + row * self.pitch_y,
+                           self.cell_width, self.cell_height)
+
+    def cell_at(self, pos: Tuple[float, float]) -> Optional[int]:
+        """Index of the cell containing pos, or None over a gap or off the grid"""
+        column, x = divmod(pos[0] - self.left, self.pitch_x)
+        row, y = divmod(pos[1] - self.top, self.pitch_y)
+        if x >= self.cell_width or y >= self.cell_height:
+            return None
+        if 0 <= column < self.columns and 0 <= row < self.rows:
+            return int(row) * self.columns + int(column)
+        return None
+
+    def near(self, pos: Tuple[float, float]) -> List[int]:
+        """Cells whose rectangle, grown by up to a gap on each side, could contain pos
+
+        At most four; callers confirm against the actual (e.g. scaled)
+        rectangle of whatever sits in the cell.
+        """
+        column, x = divmod(pos[0] - self.left, self.pitch_x)
+        row, y = divmod(pos[1] - self.top, self.pitch_y)
+        column, row = int(column), int(row)
+        columns = (column, column + 1) if x >= self.cell_width else (column,)
+        rows = (row, row + 1) if y >= self.cell_height else (row,)
+        return [r * self.columns + c for r in rows if 0 <= r < self.rows
+                for c in columns if 0 <= c < self.columns]
+
+    def cells_in(self, rect: pygame.Rect) -> List[int]:
+        """Cells overlapping rect, in reading order"""
+        first_column = max(0, (rect.left - self.left) // self.pitch_x)
+        last_column = min(self.columns - 1, (rect.right - 1 - self.left) // self.pitch_x)
+        first_row = max(0, (rect.top - self.top) // self.pitch_y)
+        last_row = min(self.rows - 1, (rect.bottom - 1 - self.top) // self.pitch_y)
+        return [row * self.columns + column for row in range(first_row, last_row + 1)
+                for column in range(first_column, last_column + 1)]
@@ -0,0 +1,296 @@
+"""Headless benchmark of the enhanced GUI game driven by a scripted, seeded play-through
+
+Usage: python gui_benchmark.py [--scenarios default-6x6 grid-12x12] [--seed 1]
+                               [--output results.json] [--tracemalloc]
+
+Each scenario runs in its own process under SDL's dummy video driver, with a
+roster and card images served from a local fixture, and plays a hover sweep,
+mismatches and matches until the board is won, then restarts. Boards larger
+than the window are scrolled to each card before it is pointed at. Results
+are written as JSON so runs can be compared across commits.
+"""
+import argparse
+import functools
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+SCENARIOS = {
+    'default-6x6': 6,
+    'grid-12x12': 12,
+    'grid-20x20': 20,
+    'grid-50x50': 50,
+}
+DEFAULT_SCENARIOS = ['default-6x6', 'grid-12x12']
+MISMATCH_RATE = 0.4  # share of turns that deliberately flip two different cards
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--scenarios', nargs='+', default=DEFAULT_SCENARIOS, choices=sorted(SCENARIOS),
+                        help='boards to play')
+    parser.add_argument('--seed', type=int, default=1, help='seed for the board shuffle and the script')
+    parser.add_argument('--output', help='write results to this JSON file instead of stdout')
+    parser.add_argument('--tracemalloc', action='store_true',
+                        help='also record the peak Python heap (slows the run down)')
+    parser.add_argument('--child', help=argparse.SUPPRESS)
+    parser.add_argument('--result-file', help=argparse.SUPPRESS)
+    return parser.parse_args()
+
+
+class QuietHandler(SimpleHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        pass
+
+
+def write_fixture(directory, characters):
+    """Roster JSON and one distinct PNG per character; returns the roster with relative image paths"""
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    import pygame
+
+    rng = random.Random(0)
+    roster = []
+    for i in range(characters):
+        image = pygame.Surface((200, 250))
+        image.fill((rng.randrange(256), rng.randrange(256), rng.randrange(256)))
+        for _ in range(12):
+            color = (rng.randrange(256), rng.randrange(256), rng.randrange(256))
+            pygame.draw.line(image, color, (rng.randrange(200), 0), (rng.randrange(200), 250), 3)
+        pygame.draw.circle(image, (255, 255, 255), (100, 110), 60)
+        name = f'character-{i}.png'
+        pygame.image.save(image, os.path.join(directory, name))
+        roster.append({'id': i + 1, 'name': f'Fixture Character {i + 1}', 'image': name})
+    return roster
+
+
+def serve_fixture(directory, characters):
+    """Start a local HTTP server for the fixture; returns (server, roster URL)"""
+    server = ThreadingHTTPServer(('127.0.0.1', 0), functools.partial(QuietHandler, directory=directory))
+    base = f'http://127.0.0.1:{server.server_address[1]}/'
+    roster = write_fixture(directory, characters)
+    for character in roster:
+        character['image'] = base + character['image']
+    with open(os.path.join(directory, 'all.json'), 'w', encoding='utf-8') as f:
+        json.dump(roster, f)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, base + 'all.json'
+
+
+def build_script(game, rng):
+    """Frame-numbered events: hover sweep, then turns until the board is won, then a restart
+
+    Pointer events name board cells; they are turned into screen positions
+    when they fire, after scrolling the cell into view.
+    """
+    import pygame
+    from memory_engine import EMPTY
+
+    script = []
+    frame = 5
+    cards = game.engine.cards
+    cells = [index for index in range(len(cards)) if cards[index] != EMPTY]
+
+    # Hover sweep across every card
+    for index in cells:
+        script.append((frame, 'move', index))
+        frame += 1
+
+    pairs = {}
+    for index in cells:
+        pairs.setdefault(cards[index], []).append(index)
+    remaining = [positions for positions in pairs.values() if len(positions) == 2]
+    rng.shuffle(remaining)
+
+    while remaining:
+        mismatch = len(remaining) >= 2 and rng.random() < MISMATCH_RATE
+        if mismatch:
+            first, second = rng.sample(range(len(remaining)), 2)
+            clicks = [remaining[first][0], remaining[second][1]]
+        else:
+            clicks = remaining.pop()
+        for offset, position in zip((0, 2), clicks):
+            script.append((frame + offset, 'move', position))
+            script.append((frame + offset, 'click', position))
+        # The game's own match/flip-back timers are replaced by events on fixed frames
+        script.append((frame + 10, 'event', pygame.USEREVENT + 1))
+        if mismatch:
+            script.append((frame + 14, 'event', pygame.USEREVENT + 2))
+        frame += 24
+
+    # Admire the win screen, restart and sweep the new board
+    frame += 60
+    script.append((frame, 'key', pygame.K_r))
+    frame += 5
+    for index in cells:
+        script.append((frame, 'move', index))
+        frame += 1
+    return script, frame + 30
+
+
+def run_scenario(name, seed, trace):
+    """Play one scenario in this process and return its measurements"""
+    os.environ['SDL_VIDEODRIVER'] = 'dummy'
+    os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+    if trace:
+        import tracemalloc
+        tracemalloc.start()
+
+    import pygame
+    import enhanced_memory_game
+    from frame_profiler import percentile
+
+    random.seed(seed)
+    game = enhanced_memory_game.MemoryGame(grid_size=SCENARIOS[name])
+    # Uncapped, and never sleeping while idle
+    game.pacer.fps = 0
+    game.pacer.idle_enabled = False
+    script, total_frames = build_script(game, random.Random(seed))
+
+    events = {}
+    for frame, kind, payload in script:
+        events.setdefault(frame, []).append((kind, payload))
+
+    frame_times = []
+    restarts = 0
+    won_at_frame = None
+    visible_cards_max = 0
+    start = time.perf_counter()
+    for frame in range(total_frames):
+        for kind, payload in events.get(frame, ()):
+            if kind in ('move', 'click'):
+                game.reveal_cell(payload)
+                position = game.cell_center(payload)
+                if kind == 'move':
+                    pygame.event.post(pygame.event.Event(pygame.MOUSEMOTION, pos=position, rel=(0, 0),
+                                                         buttons=(0, 0, 0)))
+                else:
+                    pygame.event.post(pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=position, button=1))
+            elif kind == 'key':
+                restarts += 1
+                pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=payload, mod=0, unicode=''))
+            else:
+                pygame.event.post(pygame.event.Event(payload))
+
+        frame_start = time.perf_counter()
+        game.step()
+        frame_times.append((time.perf_counter() - frame_start) * 1000)
+        if won_at_frame is None and game.game_won:
+            won_at_frame = frame
+        visible_cards_max = max(visible_cards_max, len(game.cards))
+
+        # Keep play deterministic: only the script fires match checks
+        pygame.time.set_timer(pygame.USEREVENT + 1, 0)
+        pygame.time.set_timer(pygame.USEREVENT + 2, 0)
+    elapsed = time.perf_counter() - start
+
+    game.stop_image_stream()
+    frame_times.sort()
+    result = {
+        'scenario': name,
+        'grid_size': game.grid_size,
+        'cards': game.engine.pairs * 2,
+        'visible_cards_max': visible_cards_max,
+        'atlas_pages': enhanced_memory_game.Card.atlas.stats()['pages'],
+        'frames': total_frames,
+        'seconds': elapsed,
+        'fps': total_frames / elapsed,
+        'frame_ms': {
+            'p50': percentile(frame_times, 50),
+            'p95': percentile(frame_times, 95),
+            'p99': percentile(frame_times, 99),
+            'max': frame_times[-1],
+        },
+        'time_to_interactive_s': game.time_to_interactive,
+        'won_at_frame': won_at_frame,
+        'restarts': restarts,
+        'phases': game.profiler.summary(),
+        'peak_rss_kb': peak_rss_kb(),
+    }
+    if trace:
+        result['python_heap_peak_kb'] = tracemalloc.get_traced_memory()[1] // 1024
+    pygame.quit()
+    return result
+
+
+def peak_rss_kb():
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == 'darwin' else peak
+
+
+def git_revision():
+    try:
+        return subprocess.check_output(['git', 'rev-parse', 'HEAD'], cwd=os.path.dirname(os.path.abspath(__file__)),
+                                       stderr=subprocess.DEVNULL, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    args = parse_args()
+    if args.child:
+        result = run_scenario(args.child, args.seed, args.tracemalloc)
+        with open(args.result_file, 'w', encoding='utf-8') as f:
+            json.dump(result, f)
+        return 0
+
+    results = {
+        'commit': git_revision(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'seed': args.seed,
+        'scenarios': [],
+    }
+    with tempfile.TemporaryDirectory() as workdir:
+        fixture = os.path.join(workdir, 'fixture')
+        os.makedirs(fixture)
+        pairs = max(SCENARIOS[name] ** 2 // 2 for name in args.scenarios)
+        server, roster_url = serve_fixture(fixture, pairs)
+        try:
+            for name in args.scenarios:
+                # A fresh cache per scenario, so every run starts cold
+                env = dict(os.environ, MEMORY_GAME_ROSTER_URL=roster_url,
+                           MEMORY_GAME_CACHE_DIR=os.path.join(workdir, 'cache-' + name),
+                           SDL_VIDEODRIVER='dummy', SDL_AUDIODRIVER='dummy')
+                result_file = os.path.join(workdir, name + '.json')
+                command = [sys.executable, os.path.abspath(__file__), '--child', name,
+                           '--seed', str(args.seed), '--result-file', result_file]
+                if args.tracemalloc:
+                    command.append('--tracemalloc')
+                print(f"Running {name}...", file=sys.stderr)
+                completed = subprocess.run(command, env=env, stdout=subprocess.DEVNULL)
+                if completed.returncode != 0:
+                    print(f"{name} failed with exit code {completed.returncode}", file=sys.stderr)
+                    return 1
+                with open(result_file, encoding='utf-8') as f:
+                    result = json.load(f)
+                results['scenarios'].append(result)
+                print(f"{name}: {result['fps']:.0f} fps, frame p50 {result['frame_ms']['p50']:.2f} ms, "
+                      f"p99 {result['frame_ms']['p99']:.2f} ms, peak RSS {result['peak_rss_kb']} kB",
+                      file=sys.stderr)
+        finally:
+            server.shutdown()
+
+    output = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(output + '\n')
+    else:
+        print(output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
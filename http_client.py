@@ -0,0 +1,106 @@
+import threading
+from typing import Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# Number of hosts kept in the pool and connections kept open per host
+POOL_HOSTS = 4
+POOL_CONNECTIONS_PER_HOST = 8
+REQUEST_TIMEOUT = 10  # seconds
+
+
+def counting_pool(base, adapter: 'CountingAdapter'):
+    """Subclass of a urllib3 connection pool class that tells adapter about every new connection"""
+    def _new_conn(self):
+        adapter.connection_opened()
+        return base._new_conn(self)
+
+    return type(f'Counting{base.__name__}', (base,), {'_new_conn': _new_conn})
+
+
+class CountingAdapter(HTTPAdapter):
+    """HTTPAdapter that counts the requests it sends and the connections its pools open"""
+
+    def __init__(self, *args, **kwargs):
+        self.counts_lock = threading.Lock()
+        self.requests_sent = 0
+        self.connections_opened = 0
+        super().__init__(*args, **kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        manager = self.poolmanager
+        manager.pool_classes_by_scheme = {
+            scheme: counting_pool(base, self) for scheme, base in manager.pool_classes_by_scheme.items()
+        }
+
+    def connection_opened(self):
+        with self.counts_lock:
+            self.connections_opened += 1
+
+    def send(self, request, **kwargs):
+        with self.counts_lock:
+            self.requests_sent += 1
+        return super().send(request, **kwargs)
+
+
+class HttpClient:
+    """Pooled keep-alive HTTP client shared by roster and image downloads
+
+    One requests session with a bounded connection pool per host, so a
+    board's worth of images reuses a handful of TCP/TLS connections instead
+    of handshaking for every card. Responses are requested gzip-compressed.
+    Safe to use from the image loader's worker threads.
+    """
+
+    def __init__(self, pool_hosts: int = POOL_HOSTS,
+                 connections_per_host: int = POOL_CONNECTIONS_PER_HOST,
+                 timeout: float = REQUEST_TIMEOUT):
+        self.timeout = timeout
+        self.session = requests.Session()
+        self.session.headers['Accept-Encoding'] = 'gzip, deflate'
+        # pool_block makes extra callers wait for a free connection rather
+        # than opening throwaway ones past the per-host limit
+        self.adapter = CountingAdapter(pool_connections=pool_hosts,
+                                       pool_maxsize=connections_per_host,
+                                       pool_block=True)
+        self.session.mount('http://', self.adapter)
+        self.session.mount('https://', self.adapter)
+
+    def get(self, url: str, headers: Optional[Dict[str, str]] = None,
+            timeout: Optional[float] = None) -> requests.Response:
+        """GET a URL over a pooled connection"""
+        return self.session.get(url, headers=headers, timeout=timeout or self.timeout)
+
+    def stats(self) -> Dict[str, int]:
+        """Requests sent versus connections opened for them
+
+        Every request the adapter sends counts once, redirect hops included;
+        urllib3's own retries do not, so connections_reused (requests minus
+        connections opened, never below zero) errs on the low side.
+        """
+        with self.adapter.counts_lock:
+            sent = self.adapter.requests_sent
+            opened = self.adapter.connections_opened
+        return {
+            'requests': sent,
+            'connections_opened': opened,
+            'connections_reused': max(0, sent - opened),
+        }
+
+    def close(self):
+        self.session.close()
+
+
+_client: Optional[HttpClient] = None
+_client_lock = threading.Lock()
+
+
+def get_client() -> HttpClient:
+    """The process-wide HTTP client"""
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = HttpClient()
+        return _client
@@ -0,0 +1,74 @@
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Hashable, List, Set, Tuple
+
+# Default number of concurrent downloads; enough to saturate a typical link
+# without opening dozens of connections to the image host
+DEFAULT_WORKERS = 8
+
+
+class ImageLoader:
+    """Bounded worker pool that fetches and decodes card images off the main thread.
+
+    Jobs are submitted with a key and run ``load_fn(*args)`` on a worker.
+    Finished results are queued and handed back to the main thread through
+    ``poll()``, so surfaces are only ever attached to cards from the game loop.
+    Submitting the same key twice only runs the job once, unless the key was
+    forgotten in between.
+    """
+
+    def __init__(self, load_fn: Callable[..., Any], max_workers: int = DEFAULT_WORKERS):
+        self.load_fn = load_fn
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="image-loader")
+        self.results: "queue.Queue[Tuple[Hashable, Any, Exception]]" = queue.Queue()
+        self.submitted: Set[Hashable] = set()
+        self.total = 0
+        self.completed = 0
+        self.closed = False
+        self.lock = threading.Lock()
+
+    def submit(self, key: Hashable, *args):
+        """Queue a load job unless one for this key is already running or done"""
+        with self.lock:
+            if key in self.submitted:
+                return
+            self.submitted.add(key)
+            self.total += 1
+        self.executor.submit(self._run, key, args)
+
+    def forget(self, key: Hashable):
+        """Let key be submitted (and loaded) again, e.g. after its result was dropped"""
+        with self.lock:
+            self.submitted.discard(key)
+
+    def _run(self, key, args):
+        if self.closed:
+            return
+        try:
+            result = self.load_fn(*args)
+        except Exception as e:
+            self.results.put((key, None, e))
+        else:
+            self.results.put((key, result, None))
+
+    @property
+    def pending(self) -> int:
+        return self.total - self.completed
+
+    def poll(self, timeout: float = 0) -> List[Tuple[Hashable, Any, Exception]]:
+        """Return every result finished so far, waiting up to ``timeout`` for the first one"""
+        finished = []
+        try:
+            finished.append(self.results.get(timeout=timeout) if timeout else self.results.get_nowait())
+            while True:
+                finished.append(self.results.get_nowait())
+        except queue.Empty:
+            pass
+        self.completed += len(finished)
+        return finished
+
+    def shutdown(self):
+        """Stop accepting work; jobs still queued are dropped"""
+        self.closed = True
+        self.executor.shutdown(wait=False)
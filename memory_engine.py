@@ -0,0 +1,140 @@
+import random
+from array import array
+from typing import Iterable, Optional
+
+EMPTY = 0xFFFF  # card id of a cell without a card
+
+# Outcomes of MemoryEngine.flip() and turn()
+INVALID = 0  # off the board, no card there, already face up, or a turn still open
+FIRST = 1  # first card of a turn is now face up
+MATCH = 2  # second card matched the first; both stay face up
+MISMATCH = 3  # second card did not match; both stay up until concealed
+
+
+class MemoryEngine:
+    """Rules of the memory game on a compact board, free of pygame and terminal I/O
+
+    The board is one unsigned short per cell holding the card id (cards
+    with equal ids match; EMPTY for no card), and face-up and matched cards
+    are bitsets in two bytearrays. Cells are numbered row * columns + column.
+    Flipping, resolving a turn, the counters and the win check are all
+    constant time, so the GUI and console front ends drive it per click or
+    command and simulators can play millions of moves.
+
+    flip() turns one card up and resolves the turn on the second: a match
+    stays face up, a mismatch stays up until the front end conceals it, so
+    it decides how long the player gets to look. turn() plays both flips
+    at once and leaves a mismatch face down.
+    """
+
+    __slots__ = ('cards', 'columns', 'rows', 'revealed', 'matched', 'first', 'moves', 'matches', 'pairs')
+
+    def __init__(self, cards: Iterable[int], columns: int):
+        self.cards = array('H', cards)
+        self.columns = columns
+        self.rows = -(-len(self.cards) // columns)
+        self.revealed = bytearray((len(self.cards) + 7) >> 3)
+        self.matched = bytearray(len(self.revealed))
+        self.first = -1  # face-up first card of the open turn
+        self.moves = 0
+        self.matches = 0
+        self.pairs = (len(self.cards) - self.cards.count(EMPTY)) // 2
+
+    @classmethod
+    def deal(cls, card_ids: Iterable[int], columns: int, cells: Optional[int] = None,
+             rng: random.Random = random) -> 'MemoryEngine':
+        """Two of each card id shuffled onto the board, padded with EMPTY up to cells"""
+        cards = [card for card in card_ids for _ in (0, 1)]
+        rng.shuffle(cards)
+        if cells is not None:
+            cards.extend([EMPTY] * (cells - len(cards)))
+        return cls(cards, columns)
+
+    def __len__(self) -> int:
+        return len(self.cards)
+
+    def cell(self, row: int, column: int) -> int:
+        return row * self.columns + column
+
+    @property
+    def won(self) -> bool:
+        return self.matches == self.pairs
+
+    @property
+    def remaining(self) -> int:
+        """Pairs still to be found"""
+        return self.pairs - self.matches
+
+    def is_revealed(self, cell: int) -> bool:
+        """Face up: an open turn, an unconcealed mismatch or a matched pair"""
+        return bool(self.revealed[cell >> 3] & (1 << (cell & 7)))
+
+    def is_matched(self, cell: int) -> bool:
+        return bool(self.matched[cell >> 3] & (1 << (cell & 7)))
+
+    def can_flip(self, cell: int) -> bool:
+        return (0 <= cell < len(self.cards) and self.cards[cell] != EMPTY
+                and not self.revealed[cell >> 3] & (1 << (cell & 7)))
+
+    def flip(self, cell: int) -> int:
+        """Turn a card face up; returns FIRST, MATCH, MISMATCH or INVALID"""
+        cards = self.cards
+        if not 0 <= cell < len(cards) or cards[cell] == EMPTY:
+            return INVALID
+        index, bit = cell >> 3, 1 << (cell & 7)
+        revealed = self.revealed
+        if revealed[index] & bit:
+            return INVALID
+        revealed[index] |= bit
+
+        first = self.first
+        if first < 0:
+            self.first = cell
+            return FIRST
+        self.first = -1
+        self.moves += 1
+        if cards[first] != cards[cell]:
+            return MISMATCH
+        matched = self.matched
+        matched[index] |= bit
+        matched[first >> 3] |= 1 << (first & 7)
+        self.matches += 1
+        return MATCH
+
+    def conceal(self, cell: int) -> bool:
+        """Turn a face-up card that is not matched back down"""
+        index, bit = cell >> 3, 1 << (cell & 7)
+        if not self.revealed[index] & bit or self.matched[index] & bit:
+            return False
+        self.revealed[index] ^= bit
+        if cell == self.first:
+            self.first = -1
+        return True
+
+    def cancel(self):
+        """Take back the first card of an open turn"""
+        if self.first >= 0:
+            self.conceal(self.first)
+
+    def turn(self, first: int, second: int) -> int:
+        """Play a whole move; returns MATCH, MISMATCH (cards left face down) or INVALID"""
+        cards, revealed = self.cards, self.revealed
+        size = len(cards)
+        if (self.first >= 0 or first == second or not 0 <= first < size or not 0 <= second < size
+                or revealed[first >> 3] & (1 << (first & 7)) or revealed[second >> 3] & (1 << (second & 7))):
+            return INVALID
+        card = cards[first]
+        if card == EMPTY or cards[second] == EMPTY:
+            return INVALID
+        self.moves += 1
+        if card != cards[second]:
+            return MISMATCH
+        matched = self.matched
+        index, bit = first >> 3, 1 << (first & 7)
+        revealed[index] |= bit
+        matched[index] |= bit
+        index, bit = second >> 3, 1 << (second & 7)
+        revealed[index] |= bit
+        matched[index] |= bit
+        self.matches += 1
+        return MATCH
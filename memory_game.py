@@ -1,10 +1,12 @@
 import pygame
-import requests
 import random
 import sys
 from typing import List, Dict, Tuple, Optional
 import io
-from urllib.request import urlopen
+from thumbnail_cache import ThumbnailCache, MISSING
+from roster_cache import load_roster
+from http_client import get_client
+from memory_engine import MemoryEngine, MATCH
 
 # Initialize Pygame
 pygame.init()
@@ -26,6 +28,11 @@ RED = (200, 0, 0)
 GRAY = (128, 128, 128)
 LIGHT_GRAY = (200, 200, 200)
 
+CARD_IMAGE_SIZE = (CARD_WIDTH - 10, CARD_HEIGHT - 30)
+
+# Scaled thumbnails survive between launches
+THUMBNAILS = ThumbnailCache()
+
 class Card:
     def __init__(self, character_data: Dict, x: int, y: int):
         self.character_data = character_data
@@ -33,29 +40,43 @@ class Card:
         self.y = y
         self.width = CARD_WIDTH
         self.height = CARD_HEIGHT
-        self.is_flipped = False
-        self.is_matched = False
         self.image = None
         self.rect = pygame.Rect(x, y, CARD_WIDTH, CARD_HEIGHT)
 
     def load_image(self):
-        """Load character image from URL"""
+        """Load character image from the thumbnail cache or URL"""
         try:
             if 'image' in self.character_data and self.character_data['image']:
-                response = urlopen(self.character_data['image'])
-                image_data = response.read()
-                image_surface = pygame.image.load(io.BytesIO(image_data))
-                self.image = pygame.transform.scale(image_surface, (CARD_WIDTH - 10, CARD_HEIGHT - 30))
+                url = self.character_data['image']
+                cached = THUMBNAILS.get(url, CARD_IMAGE_SIZE)
+                if cached is MISSING:
+                    self.image = None
+                elif cached is not None:
+                    self.image = cached
+                else:
+                    response = get_client().get(url)
+                    if 400 <= response.status_code < 500:
+                        # Broken link: remember it so later launches skip the download
+                        THUMBNAILS.put_missing(url, CARD_IMAGE_SIZE)
+                    response.raise_for_status()
+                    image_data = response.content
+                    try:
+                        image_surface = pygame.image.load(io.BytesIO(image_data))
+                    except pygame.error:
+                        THUMBNAILS.put_missing(url, CARD_IMAGE_SIZE)
+                        raise
+                    self.image = pygame.transform.scale(image_surface, CARD_IMAGE_SIZE)
+                    THUMBNAILS.put(url, CARD_IMAGE_SIZE, self.image)
         except Exception as e:
             print(f"Error loading image for {self.character_data.get('name', 'Unknown')}: {e}")
             self.image = None
 
-    def draw(self, screen, font):
-        """Draw the card on screen"""
-        if self.is_matched:
+    def draw(self, screen, font, revealed: bool, matched: bool):
+        """Draw the card on screen, face up or down as the board says"""
+        if matched:
             # Draw matched card with green border
             pygame.draw.rect(screen, GREEN, self.rect, 3)
-        elif self.is_flipped:
+        elif revealed:
             # Draw flipped card (show character)
             pygame.draw.rect(screen, WHITE, self.rect)
             pygame.draw.rect(screen, BLACK, self.rect, 2)
@@ -106,12 +127,12 @@ class MemoryGame:
         self.font = pygame.font.Font(None, 24)
         self.title_font = pygame.font.Font(None, 36)
 
+        # Card i sits in board cell i; the engine holds the game state
         self.cards: List[Card] = []
-        self.flipped_cards: List[Card] = []
-        self.matches_found = 0
+        self.engine = MemoryEngine([], GRID_SIZE)
+        self.flipped_cells: List[int] = []
         self.total_pairs = (GRID_SIZE * GRID_SIZE) // 2
         self.game_won = False
-        self.moves = 0
 
         self.load_characters()
         self.create_cards()
@@ -120,20 +141,15 @@ class MemoryGame:
         """Load characters from Star Wars API"""
         print("Loading Star Wars characters...")
         try:
-            response = requests.get("https://akabab.github.io/starwars-api/api/all.json")
-            if response.status_code == 200:
-                all_characters = response.json()
-                # Filter characters that have images and select random ones
-                characters_with_images = [char for char in all_characters if char.get('image')]
-                if len(characters_with_images) < self.total_pairs:
-                    print(f"Warning: Only {len(characters_with_images)} characters with images available")
-                    self.characters = characters_with_images
-                else:
-                    self.characters = random.sample(characters_with_images, self.total_pairs)
-                print(f"Loaded {len(self.characters)} characters")
+            all_characters = load_roster()
+            # Filter characters that have images and select random ones
+            characters_with_images = [char for char in all_characters if char.get('image')]
+            if len(characters_with_images) < self.total_pairs:
+                print(f"Warning: Only {len(characters_with_images)} characters with images available")
+                self.characters = characters_with_images
             else:
-                print(f"Error loading characters: HTTP {response.status_code}")
-                self.use_fallback_characters()
+                self.characters = random.sample(characters_with_images, self.total_pairs)
+            print(f"Loaded {len(self.characters)} characters")
         except Exception as e:
             print(f"Error loading characters: {e}")
             self.use_fallback_characters()
@@ -176,6 +192,7 @@ class MemoryGame:
                     card = Card(all_cards_data[card_index], x, y)
                     self.cards.append(card)
                     card_index += 1
+        self.engine = MemoryEngine([card.character_data['id'] for card in self.cards], GRID_SIZE)
 
         # Load images for all cards (this might take a moment)
         print("Loading character images...")
@@ -183,59 +200,40 @@ class MemoryGame:
             print(f"Loading image {i + 1}/{len(self.cards)}")
             card.load_image()
         print("All images loaded!")
+        stats = THUMBNAILS.stats()
+        print(f"Thumbnail cache: {stats['hits']} hits, {stats['misses']} misses")
+        http_stats = get_client().stats()
+        print(f"HTTP connections: {http_stats['connections_opened']} opened, {http_stats['connections_reused']} reused")
 
     def handle_card_click(self, pos: Tuple[int, int]):
         """Handle clicking on a card"""
-        if self.game_won or len(self.flipped_cards) >= 2:
+        if self.game_won or len(self.flipped_cells) >= 2:
             return
 
         # Find clicked card
-        clicked_card = None
-        for card in self.cards:
-            if card.is_clicked(pos) and not card.is_flipped and not card.is_matched:
-                clicked_card = card
+        clicked_cell = None
+        for cell, card in enumerate(self.cards):
+            if card.is_clicked(pos) and self.engine.can_flip(cell):
+                clicked_cell = cell
                 break
 
-        if clicked_card:
-            # Flip the card
-            clicked_card.is_flipped = True
-            self.flipped_cards.append(clicked_card)
-
-            # Check if two cards are flipped
-            if len(self.flipped_cards) == 2:
-                self.moves += 1
-                self.check_match()
+        if clicked_cell is not None:
+            # Flip the card; the second one of a turn is checked right away
+            outcome = self.engine.flip(clicked_cell)
+            self.flipped_cells.append(clicked_cell)
 
-    def check_match(self):
-        """Check if two flipped cards match"""
-        if len(self.flipped_cards) != 2:
-            return
-
-        card1, card2 = self.flipped_cards
-
-        # Check if cards match (same character ID)
-        if card1.character_data['id'] == card2.character_data['id']:
-            # Match found!
-            card1.is_matched = True
-            card2.is_matched = True
-            self.matches_found += 1
-            self.flipped_cards = []
-
-            # Check if game is won
-            if self.matches_found == self.total_pairs:
-                self.game_won = True
-        else:
-            # No match - cards will be flipped back after a delay
-            pass
+            if outcome == MATCH:
+                self.flipped_cells = []
+                # Check if game is won
+                if self.engine.won:
+                    self.game_won = True
+            # On MISMATCH both cards stay up until flip_back_cards
 
     def flip_back_cards(self):
         """Flip back non-matching cards"""
-        if len(self.flipped_cards) == 2:
-            card1, card2 = self.flipped_cards
-            if not card1.is_matched and not card2.is_matched:
-                card1.is_flipped = False
-                card2.is_flipped = False
-            self.flipped_cards = []
+        for cell in self.flipped_cells:
+            self.engine.conceal(cell)
+        self.flipped_cells = []
 
     def draw(self):
         """Draw the game screen"""
@@ -249,7 +247,7 @@ class MemoryGame:
         self.screen.blit(title_text, title_rect)
 
         # Draw game stats
-        stats_text = f"Moves: {self.moves} | Matches: {self.matches_found}/{self.total_pairs}"
+        stats_text = f"Moves: {self.engine.moves} | Matches: {self.engine.matches}/{self.total_pairs}"
         stats_surface = self.font.render(stats_text, True, BLACK)
         stats_rect = stats_surface.get_rect()
         stats_rect.centerx = WINDOW_WIDTH // 2
@@ -257,8 +255,8 @@ class MemoryGame:
         self.screen.blit(stats_surface, stats_rect)
 
         # Draw all cards
-        for card in self.cards:
-            card.draw(self.screen, self.font)
+        for cell, card in enumerate(self.cards):
+            card.draw(self.screen, self.font, self.engine.is_revealed(cell), self.engine.is_matched(cell))
 
         # Draw win message
         if self.game_won:
@@ -278,18 +276,12 @@ class MemoryGame:
 
     def restart_game(self):
         """Restart the game"""
-        self.flipped_cards = []
-        self.matches_found = 0
+        self.flipped_cells = []
         self.game_won = False
-        self.moves = 0
-
-        # Reset all cards
-        for card in self.cards:
-            card.is_flipped = False
-            card.is_matched = False
 
-        # Shuffle cards again
+        # Shuffle cards again and start a fresh board
         random.shuffle(self.cards)
+        self.engine = MemoryEngine([card.character_data['id'] for card in self.cards], GRID_SIZE)
 
         # Reposition cards
         card_index = 0
@@ -326,13 +318,11 @@ class MemoryGame:
                         self.handle_card_click(event.pos)
 
             # Handle flipping back non-matching cards after delay
-            if len(self.flipped_cards) == 2:
-                card1, card2 = self.flipped_cards
-                if not card1.is_matched and not card2.is_matched:
-                    flip_back_timer += 1
-                    if flip_back_timer >= flip_back_delay:
-                        self.flip_back_cards()
-                        flip_back_timer = 0
+            if len(self.flipped_cells) == 2:
+                flip_back_timer += 1
+                if flip_back_timer >= flip_back_delay:
+                    self.flip_back_cards()
+                    flip_back_timer = 0
             else:
                 flip_back_timer = 0
 
@@ -0,0 +1,68 @@
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from memory_engine import EMPTY, MATCH, MemoryEngine
+
+
+class PairIndex:
+    """Where the unmatched pairs of a board are, and how much of each the player has seen
+
+    Built once from the engine's board (one pass over the cells), then kept
+    up to date from the outcome of every flip, so answering a hint never
+    rescans the board. Pairs are bucketed by how many of their two cards
+    have been face up so far; hint() prefers pairs the player has already
+    seen both cards of, then one, then none.
+    """
+
+    def __init__(self, engine: MemoryEngine, ignore: Iterable[int] = ()):
+        ignored = set(ignore)
+        ignored.add(EMPTY)
+        cells: Dict[int, List[int]] = {}
+        for cell, card in enumerate(engine.cards):
+            if card not in ignored:
+                cells.setdefault(card, []).append(cell)
+
+        # Only real pairs can be hinted; fillers that come in other counts are left out
+        self.cells: Dict[int, Tuple[int, int]] = {
+            card: (positions[0], positions[1]) for card, positions in cells.items() if len(positions) == 2
+        }
+        self.seen = bytearray(len(engine.cards))
+        # Card ids by number of their cards seen (dicts keep hints in a stable order)
+        self.by_seen: Tuple[Dict[int, None], ...] = ({}, {}, {})
+        self.seen_count: Dict[int, int] = {}
+        for card, (first, second) in self.cells.items():
+            count = engine.is_revealed(first) + engine.is_revealed(second)
+            if engine.is_matched(first):
+                continue
+            self.seen[first] = engine.is_revealed(first)
+            self.seen[second] = engine.is_revealed(second)
+            self.seen_count[card] = count
+            self.by_seen[count][card] = None
+        self.engine = engine
+
+    def __len__(self) -> int:
+        """Pairs still on the board"""
+        return len(self.seen_count)
+
+    def record(self, cell: int, outcome: int):
+        """Note a flip of cell that returned outcome from MemoryEngine.flip()"""
+        card = self.engine.cards[cell]
+        count = self.seen_count.get(card)
+        if count is None:
+            return
+        if outcome == MATCH:
+            del self.by_seen[count][card]
+            del self.seen_count[card]
+            return
+        if outcome and not self.seen[cell]:
+            self.seen[cell] = 1
+            del self.by_seen[count][card]
+            self.seen_count[card] = count + 1
+            self.by_seen[count + 1][card] = None
+
+    def hint(self) -> Optional[Tuple[int, int, int]]:
+        """(card id, cell, cell) of the best pair to point out, or None when none is left"""
+        for bucket in reversed(self.by_seen):
+            if bucket:
+                card = next(iter(bucket))
+                return (card,) + self.cells[card]
+        return None
@@ -0,0 +1,220 @@
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, Optional
+
+import pygame
+
+
+def quantize(value: float, step: int) -> int:
+    """Round a pixel size to the nearest multiple of step (never below step)"""
+    return max(step, int(value / step + 0.5) * step)
+
+
+class SurfaceCache:
+    """Least-recently-used cache of rendered surfaces with a byte budget"""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.entries: "OrderedDict[Hashable, pygame.Surface]" = OrderedDict()
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def surface_bytes(surface: pygame.Surface) -> int:
+        return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+    def get(self, key: Hashable, build: Callable[[], pygame.Surface]) -> pygame.Surface:
+        """Cached surface for key, calling build() to render it on a miss"""
+        surface = self.find(key)
+        if surface is None:
+            surface = build()
+            self.put(key, surface)
+        return surface
+
+    def find(self, key: Hashable) -> Optional[pygame.Surface]:
+        """Cached surface for key, or None on a miss"""
+        surface = self.entries.get(key)
+        if surface is not None:
+            self.entries.move_to_end(key)
+            self.hits += 1
+        else:
+            self.misses += 1
+        return surface
+
+    def put(self, key: Hashable, surface: pygame.Surface):
+        """Store a surface, evicting the least recently used ones over the budget"""
+        size = self.surface_bytes(surface)
+        if size > self.max_bytes:
+            return
+        previous = self.entries.pop(key, None)
+        if previous is not None:
+            self.total_bytes -= self.surface_bytes(previous)
+        self.entries[key] = surface
+        self.total_bytes += size
+        while self.total_bytes > self.max_bytes:
+            _, evicted = self.entries.popitem(last=False)
+            self.total_bytes -= self.surface_bytes(evicted)
+            self.evictions += 1
+
+    def clear(self):
+        self.entries.clear()
+        self.total_bytes = 0
+
+    def stats(self) -> Dict[str, float]:
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'evictions': self.evictions,
+            'entries': len(self.entries),
+            'bytes': self.total_bytes,
+        }
+
+
+class FlipFrameCache:
+    """Pre-scaled keyframes of card faces for the flip and hover animations
+
+    Card.draw used to smoothscale the face on every frame of a flip. Sizes
+    are instead quantized (width by flip progress, height by hover scale)
+    and each resampled frame is kept, keyed by the face's atlas key, so the
+    two cards of a pair share their frames and an animation only resamples
+    the first time it runs.
+    """
+
+    def __init__(self, max_bytes: int, width_step: int, height_step: int):
+        self.surfaces = SurfaceCache(max_bytes)
+        self.width_step = width_step
+        self.height_step = height_step
+
+    def frame(self, face_key: Optional[Hashable], face: pygame.Surface,
+              width: float, height: float) -> pygame.Surface:
+        """The face scaled to (about) width x height"""
+        size = (quantize(width, self.width_step), quantize(height, self.height_step))
+        if size == face.get_size():
+            return face
+        if face_key is None:
+            return pygame.transform.smoothscale(face, size)
+        return self.surfaces.get((face_key, size), lambda: pygame.transform.smoothscale(face, size))
+
+    def stats(self) -> Dict[str, float]:
+        return self.surfaces.stats()
+
+
+class CardChromeCache:
+    """Pre-rendered card bodies shared by every card
+
+    Holds the rounded card background and border for each visual state
+    (back, hovered back with its STAR/WARS label, front, matched) and the
+    matched-glow halo for each pulse radius, at the quantized sizes the flip
+    and hover animations produce. Drawing a card's chrome is then one blit,
+    or two while its glow is pulsing.
+    """
+
+    def __init__(self, font: pygame.font.Font, colors: Dict[str, tuple], max_bytes: int):
+        self.font = font
+        self.colors = colors
+        self.surfaces = SurfaceCache(max_bytes)
+
+    def _colors(self, state: str):
+        colors = self.colors
+        if state == 'matched':
+            return colors['card_front'], colors['card_matched']
+        if state == 'front':
+            return colors['card_front'], colors['card_border']
+        if state == 'back_hover':
+            return colors['card_hover'], colors['card_hover']
+        return colors['card_back'], colors['card_border']
+
+    def _render_body(self, state: str, size) -> pygame.Surface:
+        sprite = pygame.Surface(size, pygame.SRCALPHA)
+        rect = sprite.get_rect()
+        card_color, border_color = self._colors(state)
+        pygame.draw.rect(sprite, card_color, rect, border_radius=8)
+        pygame.draw.rect(sprite, border_color, rect, width=3, border_radius=8)
+
+        if state in ('back', 'back_hover') and rect.width > 20:
+            # Card back with Star Wars branding
+            star_color = self.colors['fireworks'] if state == 'back_hover' else self.colors['text_primary']
+            for word, offset in (("STAR", -8), ("WARS", 8)):
+                text = self.font.render(word, True, star_color)
+                text_rect = text.get_rect(center=(rect.centerx, rect.centery + offset))
+                if rect.width > text_rect.width:
+                    sprite.blit(text, text_rect)
+        return sprite.convert_alpha() if pygame.display.get_surface() else sprite
+
+    def _render_glow(self, size, radius: int) -> pygame.Surface:
+        sprite = pygame.Surface((size[0] + radius * 2, size[1] + radius * 2), pygame.SRCALPHA)
+        pygame.draw.rect(sprite, self.colors['success'], sprite.get_rect(), border_radius=12)
+        return sprite.convert_alpha() if pygame.display.get_surface() else sprite
+
+    def body(self, state: str, size) -> pygame.Surface:
+        """Card background, border and back label for state at size"""
+        return self.surfaces.get((state, size), lambda: self._render_body(state, size))
+
+    def glow(self, size, radius: int) -> pygame.Surface:
+        """Matched-card halo extending radius pixels around a card of size"""
+        return self.surfaces.get(('glow', size, radius), lambda: self._render_glow(size, radius))
+
+    def stats(self) -> Dict[str, float]:
+        return self.surfaces.stats()
+
+
+class FontRegistry:
+    """One Font object per (face, size, bold), created on first use"""
+
+    def __init__(self):
+        self.fonts: Dict[tuple, pygame.font.Font] = {}
+
+    def get(self, face: Optional[str], size: int, bold: bool = False) -> pygame.font.Font:
+        key = (face, size, bold)
+        font = self.fonts.get(key)
+        if font is None:
+            font = pygame.font.Font(face, size)
+            if bold:
+                font.set_bold(True)
+            self.fonts[key] = font
+        return font
+
+    def clear(self):
+        """Forget every font; needed after pygame.quit() invalidates them"""
+        self.fonts.clear()
+
+
+class TextCache:
+    """Least-recently-used cache of rendered text keyed by (font, text, color, antialias)"""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self.entries: "OrderedDict[tuple, pygame.Surface]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font: pygame.font.Font, text: str, color, antialias: bool = True) -> pygame.Surface:
+        """Same as font.render, reusing the surface when this text was rendered before"""
+        key = (font, text, tuple(color), antialias)
+        surface = self.entries.get(key)
+        if surface is not None:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self.entries[key] = surface
+        if len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+        return surface
+
+    def clear(self):
+        self.entries.clear()
+
+    def stats(self) -> Dict[str, float]:
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'entries': len(self.entries),
+        }
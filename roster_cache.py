@@ -0,0 +1,145 @@
+import json
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+import requests
+
+from cache_paths import atomic_write, cache_path
+from http_client import get_client
+
+# MEMORY_GAME_ROSTER_URL points the games at another roster, e.g. a local fixture
+ROSTER_URL = os.environ.get('MEMORY_GAME_ROSTER_URL', "https://akabab.github.io/starwars-api/api/all.json")
+
+# How long a stored roster is used without asking the server again
+ROSTER_TTL = 24 * 60 * 60  # seconds
+
+
+class RosterError(Exception):
+    """The roster could not be fetched and no cached copy is available"""
+
+
+class RosterCache:
+    """Local copy of the character roster, shared by all game front ends
+
+    A stored roster younger than ``ttl`` is returned straight from disk.
+    Older copies are revalidated with If-None-Match/If-Modified-Since, so an
+    unchanged roster costs a 304 rather than a full download. If the server
+    cannot be reached, a stale copy is better than no roster at all.
+    """
+
+    def __init__(self, url: str = ROSTER_URL, path: Optional[str] = None, ttl: float = ROSTER_TTL):
+        self.url = url
+        self.path = path or cache_path('roster.json')
+        self.ttl = ttl
+
+    def _read(self) -> Optional[Dict]:
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if entry.get('url') != self.url or not isinstance(entry.get('roster'), list):
+            return None
+        return entry
+
+    def _write(self, entry: Dict):
+        try:
+            atomic_write(self.path, json.dumps(entry).encode('utf-8'))
+        except OSError as e:
+            print(f"Could not write roster cache: {e}")
+
+    def load(self) -> List[Dict]:
+        """Return the roster, hitting the network only when the local copy is stale"""
+        cached = self._read()
+        if cached and time.time() - cached.get('fetched_at', 0) < self.ttl:
+            return cached['roster']
+
+        headers = {}
+        if cached:
+            if cached.get('etag'):
+                headers['If-None-Match'] = cached['etag']
+            if cached.get('last_modified'):
+                headers['If-Modified-Since'] = cached['last_modified']
+
+        try:
+            response = get_client().get(self.url, headers=headers)
+        except requests.RequestException:
+            if cached:
+                return cached['roster']
+            raise
+
+        if response.status_code == 304 and cached:
+            cached['fetched_at'] = time.time()
+            self._write(cached)
+            return cached['roster']
+
+        if response.status_code == 200:
+            roster = response.json()
+            self._write({
+                'url': self.url,
+                'etag': response.headers.get('ETag'),
+                'last_modified': response.headers.get('Last-Modified'),
+                'fetched_at': time.time(),
+                'roster': roster,
+            })
+            return roster
+
+        if cached:
+            return cached['roster']
+        raise RosterError(f"HTTP {response.status_code}")
+
+
+def load_roster() -> List[Dict]:
+    """Roster from the shared cache"""
+    return RosterCache().load()
+
+
+class RosterPrefetch:
+    """Loads the roster on a background thread while the player is busy with something else
+
+    Start it as early as possible and wait() for it when the roster is
+    needed. ``prepare`` runs on the same thread once loading is over, with
+    the roster or None when it could not be loaded (``error`` says why), so
+    whatever a game derives from the roster is ready by then too; its
+    return value ends up in ``result``. ``stage`` names the step under way
+    for progress displays.
+    """
+
+    def __init__(self, prepare: Optional[Callable[[Optional[List[Dict]]], Any]] = None,
+                 cache: Optional[RosterCache] = None):
+        self.cache = cache or RosterCache()
+        self.prepare = prepare
+        self.stage = 'waiting'
+        self.roster: Optional[List[Dict]] = None
+        self.error: Optional[Exception] = None
+        self.result: Any = None
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.done = threading.Event()
+        self.thread = threading.Thread(target=self._run, name='roster-prefetch', daemon=True)
+
+    def start(self) -> 'RosterPrefetch':
+        self.started_at = time.time()
+        self.thread.start()
+        return self
+
+    def _run(self):
+        try:
+            self.stage = 'fetching'
+            try:
+                self.roster = self.cache.load()
+            except Exception as e:  # RosterError, network or bad JSON: the caller falls back
+                self.error = e
+            if self.prepare is not None:
+                self.stage = 'preparing'
+                self.result = self.prepare(self.roster)
+        finally:
+            self.stage = 'done'
+            self.finished_at = time.time()
+            self.done.set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """True once loading and preparation are over"""
+        return self.done.wait(timeout)
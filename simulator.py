@@ -0,0 +1,290 @@
+"""Monte Carlo simulation of seeded memory games played by modelled players
+
+Usage: python simulator.py [--grids 4 6] [--hints 0 3 5] [--players perfect span:8 random]
+                           [--games 100000] [--seed 1] [--processes N] [--output results.json]
+
+Each player model is a memory span: how many of the most recently seen
+cards the player still remembers (perfect remembers all of them, random
+none). Players always take a pair they remember, spend a hint when they
+know no pair, and otherwise flip cards they do not remember. Games are
+split into seeded chunks played across a process pool, so a run is
+reproducible whatever the number of processes. The report gives the
+move-count distribution for every grid size, hint budget and player, and
+suggests efficiency cut-offs for the ratings of the console game.
+"""
+import argparse
+import json
+import math
+import multiprocessing
+import random
+import sys
+import time
+from collections import Counter, OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+from memory_engine import EMPTY, FIRST, MATCH, MemoryEngine
+from pair_index import PairIndex
+
+PLAYERS = {
+    'perfect': None,
+    'random': 0,
+}  # plus span:N for a player remembering the last N cards seen
+CHUNK_GAMES = 2000  # games per pool task
+# Ratings of EnhancedTextMemoryGame, best first, and the share of games of
+# the reference player that should reach at least each one
+RATINGS = (('Jedi Master', 0.25), ('Jedi Knight', 0.50), ('Padawan', 0.75), ('Youngling', 1.0))
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--grids', nargs='+', type=int, default=[4, 6], help='board sizes (NxN)')
+    parser.add_argument('--hints', nargs='+', type=int, default=[0, 3, 5], help='hint budgets')
+    parser.add_argument('--players', nargs='+', default=['perfect', 'span:8', 'random'],
+                        help='player models: perfect, random or span:N')
+    parser.add_argument('--reference', help='player whose results set the rating cut-offs '
+                                            '(default: the first of --players)')
+    parser.add_argument('--games', type=int, default=100000, help='games per grid, hint budget and player')
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--processes', type=int, help='worker processes (default: all cores)')
+    parser.add_argument('--output', help='also write the results to this JSON file')
+    args = parser.parse_args()
+    for player in args.players + [args.reference or args.players[0]]:
+        try:
+            player_span(player)
+        except ValueError:
+            parser.error(f"unknown player model: {player}")
+    return args
+
+
+def player_span(player: str) -> Optional[int]:
+    """Memory span of a player model name (None for unlimited)"""
+    if player in PLAYERS:
+        return PLAYERS[player]
+    if player.startswith('span:') and player[5:].isdigit():
+        return int(player[5:])
+    raise ValueError(player)
+
+
+class Player:
+    """Plays one game on an engine, remembering at most span cards (None: all)"""
+
+    def __init__(self, engine: MemoryEngine, rng: random.Random, span: Optional[int], hints: int):
+        self.engine = engine
+        self.rng = rng
+        self.span = span
+        self.hints = hints
+        self.pairs = PairIndex(engine) if hints else None
+        # Cards not matched yet, with each cell's slot in the list for O(1) removal
+        self.face_down = [cell for cell in range(len(engine)) if engine.cards[cell] != EMPTY]
+        self.slot = {cell: i for i, cell in enumerate(self.face_down)}
+        self.memory: 'OrderedDict[int, int]' = OrderedDict()  # cell -> card, oldest first
+        self.single: Dict[int, int] = {}  # card -> its only remembered cell
+        self.known: Dict[int, Tuple[int, int]] = {}  # card -> both remembered cells
+
+    def remember(self, cell: int):
+        if self.span == 0:
+            return
+        memory = self.memory
+        if cell in memory:
+            memory.move_to_end(cell)
+            return
+        card = self.engine.cards[cell]
+        other = self.single.pop(card, None)
+        if other is None:
+            self.single[card] = cell
+        else:
+            self.known[card] = (other, cell)
+        memory[cell] = card
+
+        if self.span is not None and len(memory) > self.span:
+            old, card = memory.popitem(last=False)
+            if self.single.get(card) == old:
+                del self.single[card]
+            else:
+                first, second = self.known.pop(card)
+                self.single[card] = second if first == old else first
+
+    def forget(self, card: int, first: int, second: int):
+        """Drop a matched pair from memory and from the face-down cards"""
+        self.single.pop(card, None)
+        self.known.pop(card, None)
+        for cell in (first, second):
+            self.memory.pop(cell, None)
+            i = self.slot.pop(cell)
+            last = self.face_down.pop()
+            if last != cell:
+                self.face_down[i] = last
+                self.slot[last] = i
+
+    def pick_unknown(self, exclude: int = -1) -> int:
+        """A random face-down card the player does not remember"""
+        face_down, memory, rng = self.face_down, self.memory, self.rng
+        for _ in range(8):
+            cell = face_down[int(rng.random() * len(face_down))]
+            if cell not in memory and cell != exclude:
+                return cell
+        return rng.choice([cell for cell in face_down if cell not in memory and cell != exclude])
+
+    def play(self) -> int:
+        """Play until the board is won; returns the number of moves"""
+        engine, cards = self.engine, self.engine.cards
+        while not engine.won:
+            if self.known:
+                first, second = next(iter(self.known.values()))
+            elif self.hints:
+                self.hints -= 1
+                card, first, second = self.pairs.hint()
+            else:
+                first = self.pick_unknown()
+                self.remember(first)
+                partner = self.known.get(cards[first])
+                if partner is not None:
+                    second = partner[0] if partner[1] == first else partner[1]
+                else:
+                    second = self.pick_unknown(first)
+                    self.remember(second)
+
+            outcome = engine.turn(first, second)
+            if self.pairs is not None:
+                self.pairs.record(first, FIRST)
+                self.pairs.record(second, outcome)
+            if outcome == MATCH:
+                self.forget(cards[first], first, second)
+        return engine.moves
+
+
+def play_chunk(task) -> Tuple[int, int, str, Counter]:
+    """Pool task: play a seeded batch of games, returning the moves histogram"""
+    grid, hints, player, seed, games = task
+    rng = random.Random(seed)
+    span = player_span(player)
+    cells = grid * grid
+    card_ids = range(1, cells // 2 + 1)
+    moves = Counter()
+    for _ in range(games):
+        engine = MemoryEngine.deal(card_ids, grid, cells, rng)
+        moves[Player(engine, rng, span, hints).play()] += 1
+    return grid, hints, player, moves
+
+
+def percentile(histogram: Dict[int, int], pct: float) -> int:
+    """Smallest value with at least pct percent of the samples at or below it"""
+    target = math.ceil(sum(histogram.values()) * pct / 100)
+    seen = 0
+    for value in sorted(histogram):
+        seen += histogram[value]
+        if seen >= target:
+            return value
+    return 0
+
+
+def summarize(grid: int, histogram: Dict[int, int]) -> Dict:
+    games = sum(histogram.values())
+    mean = sum(moves * count for moves, count in histogram.items()) / games
+    variance = sum(count * (moves - mean) ** 2 for moves, count in histogram.items()) / games
+    cards = grid * grid // 2 * 2
+    return {
+        'games': games,
+        'mean': mean,
+        'stdev': math.sqrt(variance),
+        'min': min(histogram),
+        'p10': percentile(histogram, 10),
+        'p25': percentile(histogram, 25),
+        'p50': percentile(histogram, 50),
+        'p75': percentile(histogram, 75),
+        'p90': percentile(histogram, 90),
+        'max': max(histogram),
+        'mean_efficiency': cards / mean,
+        'histogram': {str(moves): histogram[moves] for moves in sorted(histogram)},
+    }
+
+
+def rating_cutoffs(grid: int, histogram: Dict[int, int]) -> Tuple[Dict[str, float], Dict[str, str]]:
+    """Efficiency (cards / moves) a game needs for each rating, from a reference histogram
+
+    When a rating's percentile lands on the same move count as the rating
+    above it, it is moved to the next higher move count seen so that every
+    rating stays reachable. Returns the cut-offs and a note per rating that
+    was 'shifted' that way, or left 'collapsed' onto the one above because
+    no higher move count exists.
+    """
+    cards = grid * grid // 2 * 2
+    move_counts = sorted(histogram)
+    cutoffs: Dict[str, float] = {}
+    notes: Dict[str, str] = {}
+    previous = 0
+    for name, share in RATINGS[:-1]:
+        moves = percentile(histogram, share * 100)
+        if moves <= previous:
+            higher = [count for count in move_counts if count > previous]
+            if higher:
+                moves = higher[0]
+                notes[name] = 'shifted'
+            else:
+                moves = previous
+                notes[name] = 'collapsed'
+        cutoffs[name] = round(cards / moves, 3)
+        previous = moves
+    return cutoffs, notes
+
+
+def main():
+    args = parse_args()
+    reference = args.reference or args.players[0]
+    players = list(dict.fromkeys(args.players + [reference]))
+    tasks = []
+    for grid in args.grids:
+        for hints in args.hints:
+            for player in players:
+                for start in range(0, args.games, CHUNK_GAMES):
+                    # String seeds hash the same in every process and run
+                    seed = f'{args.seed}:{grid}:{hints}:{player}:{start}'
+                    tasks.append((grid, hints, player, seed, min(CHUNK_GAMES, args.games - start)))
+
+    histograms: Dict[Tuple[int, int, str], Counter] = {}
+    started = time.perf_counter()
+    with multiprocessing.Pool(args.processes) as pool:
+        for done, (grid, hints, player, moves) in enumerate(pool.imap_unordered(play_chunk, tasks), 1):
+            histograms.setdefault((grid, hints, player), Counter()).update(moves)
+            print(f"\r{done}/{len(tasks)} batches", end='', file=sys.stderr, flush=True)
+    elapsed = time.perf_counter() - started
+    total_games = sum(sum(h.values()) for h in histograms.values())
+    print(f"\r{total_games} games in {elapsed:.1f} s ({total_games / elapsed:.0f} games/s)", file=sys.stderr)
+
+    results = {'seed': args.seed, 'games': args.games, 'reference': reference, 'configs': []}
+    print(f"{'grid':>5} {'hints':>5} {'player':>10} {'mean':>8} {'stdev':>7} {'p10':>5} {'p50':>5} "
+          f"{'p90':>5} {'cards/move':>10}")
+    for grid in args.grids:
+        for hints in args.hints:
+            for player in players:
+                summary = summarize(grid, histograms[(grid, hints, player)])
+                summary.update(grid=grid, hints=hints, player=player)
+                if player == reference:
+                    cutoffs, notes = rating_cutoffs(grid, histograms[(grid, hints, player)])
+                    summary['rating_cutoffs'] = cutoffs
+                    summary['rating_cutoff_notes'] = notes
+                results['configs'].append(summary)
+                print(f"{grid:>5} {hints:>5} {player:>10} {summary['mean']:>8.1f} {summary['stdev']:>7.1f} "
+                      f"{summary['p10']:>5} {summary['p50']:>5} {summary['p90']:>5} "
+                      f"{summary['mean_efficiency']:>10.3f}")
+
+    print(f"\nSuggested rating cut-offs (cards / moves), from player {reference}:")
+    for config in results['configs']:
+        if config['player'] == reference:
+            notes = config['rating_cutoff_notes']
+            cutoffs = ', '.join(f"{name} >= {value}" + (f" ({notes[name]})" if name in notes else '')
+                                for name, value in config['rating_cutoffs'].items())
+            print(f"  {config['grid']}x{config['grid']}, {config['hints']} hints: {cutoffs}")
+    if any(config.get('rating_cutoff_notes') for config in results['configs']):
+        print("  shifted: moved to the next move count so it differs from the rating above; "
+              "collapsed: no higher move count was seen, so it equals the rating above")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+            f.write('\n')
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,148 @@
+import math
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+import pygame
+
+# Twinkle refresh rate of the star layer, independent of the card frame rate
+STARFIELD_REFRESH_MS = 66  # about 15 updates per second
+# Dirty areas from a refresh are reported per tile of this many pixels
+STARFIELD_TILE = 32
+
+
+class Starfield:
+    """Twinkling star background kept as arrays and rendered into one surface
+
+    Stars are stored as parallel arrays (position, radius, brightness, twinkle
+    phase and speed, base colour). Every refresh computes all colours with one
+    vectorized expression and writes them straight into the pixels of a
+    cached background surface, whose star pixel coordinates are worked out
+    once up front. Screens then blit (part of) that surface, so drawing the
+    background costs the same whether there are a hundred stars or several
+    thousand, and the per-star work only happens at the refresh rate.
+    """
+
+    def __init__(self, size: Tuple[int, int], count: int, palette: Sequence[Tuple[int, int, int]],
+                 background: Tuple[int, int, int], refresh_ms: float = STARFIELD_REFRESH_MS,
+                 seed: Optional[int] = None):
+        width, height = size
+        rng = np.random.default_rng(seed)
+        self.size = size
+        self.refresh_ms = refresh_ms
+        self.since_refresh = 0.0
+
+        self.x = rng.integers(0, width, count)
+        self.y = rng.integers(0, height, count)
+        self.radius = rng.integers(1, 4, count)
+        self.brightness = rng.uniform(0.3, 1.0, count)
+        self.twinkle_speed = rng.uniform(0.001, 0.003, count)
+        self.twinkle_phase = rng.uniform(0, 2 * math.pi, count)
+        self.base_color = np.asarray(palette, dtype=np.float64)[rng.integers(0, len(palette), count)]
+        self.colors = np.zeros((count, 3), dtype=np.uint8)
+
+        # Bounding box of every star, for dirty-rectangle tracking
+        self.left = self.x - self.radius - 1
+        self.top = self.y - self.radius - 1
+        self.right = self.x + self.radius + 2
+        self.bottom = self.y + self.radius + 2
+
+        self._build_pixel_index()
+
+        self.surface = pygame.Surface(size, 0, 32)
+        display = pygame.display.get_surface()
+        if display is not None and display.get_bytesize() in (3, 4):
+            self.surface = self.surface.convert()
+        self.surface.fill(background)
+        self.refresh()
+
+    def _build_pixel_index(self):
+        """Screen pixels covered by each star: single pixels or small discs"""
+        width, height = self.size
+        xs, ys, owners = [], [], []
+        for radius in np.unique(self.radius):
+            stars = np.flatnonzero(self.radius == radius)
+            if radius == 1:
+                dx = dy = np.zeros(1, dtype=np.int64)
+            else:
+                grid = np.arange(-radius, radius + 1)
+                dx, dy = np.meshgrid(grid, grid, indexing='ij')
+                disc = dx * dx + dy * dy <= radius * radius
+                dx, dy = dx[disc], dy[disc]
+            px = (self.x[stars, None] + dx[None, :]).ravel()
+            py = (self.y[stars, None] + dy[None, :]).ravel()
+            owner = np.repeat(stars, len(dx))
+            inside = (px >= 0) & (px < width) & (py >= 0) & (py < height)
+            xs.append(px[inside])
+            ys.append(py[inside])
+            owners.append(owner[inside])
+
+        # Keep star order so overlapping stars resolve the same way every refresh
+        owner = np.concatenate(owners)
+        order = np.argsort(owner, kind='stable')
+        self.pixel_x = np.concatenate(xs)[order]
+        self.pixel_y = np.concatenate(ys)[order]
+        self.pixel_owner = owner[order]
+
+    def __len__(self) -> int:
+        return len(self.x)
+
+    def update(self, dt: float) -> bool:
+        """Advance the twinkle; True when the surface was re-rendered this call"""
+        self.since_refresh += dt
+        if self.since_refresh < self.refresh_ms:
+            return False
+        self.twinkle_phase += self.twinkle_speed * self.since_refresh
+        self.since_refresh = 0.0
+        self.refresh()
+        return True
+
+    def refresh(self):
+        """Recompute every star colour and write the star pixels into the surface"""
+        level = self.brightness * (0.5 + 0.5 * np.sin(self.twinkle_phase))
+        colors = (self.base_color * level[:, None]).astype(np.uint8)
+        self.changed = np.any(colors != self.colors, axis=1)
+        self.colors = colors
+
+        pixels = pygame.surfarray.pixels3d(self.surface)
+        pixels[self.pixel_x, self.pixel_y] = colors[self.pixel_owner]
+        del pixels  # unlock the surface
+
+    def draw(self, screen: pygame.Surface, area: Optional[pygame.Rect] = None):
+        """Blit the whole background, or just area of it, to the same place on screen"""
+        if area is None:
+            screen.blit(self.surface, (0, 0))
+        else:
+            screen.blit(self.surface, area.topleft, area)
+
+    def dirty_rects(self, covered: Sequence[pygame.Rect], tile: int = STARFIELD_TILE) -> List[pygame.Rect]:
+        """Areas changed by the last refresh, leaving out stars under any covered rect
+
+        Changed stars are grouped per tile into one bounding rectangle, so the
+        number of rectangles stays bounded however many stars there are.
+        """
+        visible = self.changed.copy()
+        if covered:
+            boxes = np.array([tuple(rect) for rect in covered], dtype=np.int64)
+            box_left, box_top = boxes[:, 0], boxes[:, 1]
+            box_right, box_bottom = box_left + boxes[:, 2], box_top + boxes[:, 3]
+            overlaps = ((self.left[:, None] < box_right) & (self.right[:, None] > box_left) &
+                        (self.top[:, None] < box_bottom) & (self.bottom[:, None] > box_top))
+            visible &= ~overlaps.any(axis=1)
+
+        stars = np.flatnonzero(visible)
+        if not len(stars):
+            return []
+
+        columns = self.size[0] // tile + 1
+        tiles = (self.y[stars] // tile) * columns + self.x[stars] // tile
+        tile_ids, groups = np.unique(tiles, return_inverse=True)
+        left = np.full(len(tile_ids), np.iinfo(np.int64).max)
+        top = left.copy()
+        right = np.full(len(tile_ids), np.iinfo(np.int64).min)
+        bottom = right.copy()
+        np.minimum.at(left, groups, self.left[stars])
+        np.minimum.at(top, groups, self.top[stars])
+        np.maximum.at(right, groups, self.right[stars])
+        np.maximum.at(bottom, groups, self.bottom[stars])
+        return [pygame.Rect(int(l), int(t), int(r - l), int(b - t))
+                for l, t, r, b in zip(left, top, right, bottom)]
@@ -0,0 +1,253 @@
+import os
+import re
+import shutil
+import sys
+import unicodedata
+from typing import List, Optional, TextIO, Tuple
+
+RENDER_STATS_ENV = 'MEMORY_GAME_RENDER_STATS'  # set to print bytes per frame when a game ends
+CLEAR = '\033[H\033[2J'
+RESET = '\033[0m'
+SGR = re.compile(r'\033\[[0-9;]*m')
+# Unchanged columns between two changes worth rewriting rather than moving the cursor over
+DIFF_GAP = 8
+# Lines left below a frame for the prompt and messages before the screen could scroll
+PROMPT_LINES = 6
+
+# One character cluster on screen: (style, text, width)
+Cluster = Tuple[str, str, int]
+
+
+def clear_screen(stream: Optional[TextIO] = None):
+    """Clear the terminal with an escape sequence (nothing when output is not a terminal)"""
+    stream = stream or sys.stdout
+    if stream.isatty():
+        stream.write(CLEAR)
+        stream.flush()
+
+
+def display_width(text: str) -> int:
+    """Columns text takes on screen, ignoring color codes"""
+    return sum(width for line in parse_frame(text) for _, _, width in line)
+
+
+def parse_line(text: str, style: str = '') -> Tuple[List[Cluster], str]:
+    """Split one line with SGR color codes into styled character clusters
+
+    A cluster is a base character plus whatever joins it (combining marks,
+    variation selectors, zero-width joiners); emoji and East Asian wide
+    characters take two columns. style is the one active where the line
+    starts, and every code up to a reset is part of it. Returns the
+    clusters and the style active at the end of the line.
+    """
+    line: List[Cluster] = []
+    joining = False
+    position = 0
+    for match in list(SGR.finditer(text)) + [None]:
+        end = match.start() if match else len(text)
+        for char in text[position:end]:
+            zero_width = char in '\u200d\ufe0f' or unicodedata.combining(char)
+            if (zero_width or joining) and line and line[-1][0] == style:
+                previous_style, previous, width = line[-1]
+                if char == '\ufe0f':
+                    width = 2  # emoji presentation
+                line[-1] = (style, previous + char, width)
+            else:
+                width = 2 if unicodedata.east_asian_width(char) in 'WF' else 1
+                line.append((style, char, width))
+            joining = char == '\u200d'
+        if match:
+            code = match.group()
+            style = '' if code in (RESET, '\033[m') else style + code
+            position = match.end()
+    return line, style
+
+
+def parse_frame(text: str) -> List[List[Cluster]]:
+    """parse_line over every line of text, carrying styles over line breaks like a terminal"""
+    lines = []
+    style = ''
+    for text_line in text.split('\n'):
+        line, style = parse_line(text_line, style)
+        lines.append(line)
+    return lines
+
+
+def columns(line: List[Cluster]) -> List[Tuple]:
+    """Per screen column: the cluster starting there, or a marker continuing a wide one"""
+    keys = []
+    for cluster in line:
+        keys.append(cluster)
+        keys.extend([(cluster, 1)] * (cluster[2] - 1))
+    return keys
+
+
+def uncertain(cluster: Cluster) -> bool:
+    """True for clusters terminals disagree on the width of (emoji and other wide text)"""
+    return len(cluster[1]) > 1 or cluster[2] > 1
+
+
+class Line:
+    """One line of a frame, parsed once and kept while its text and starting style stay the same"""
+
+    __slots__ = ('text', 'style', 'clusters', 'end_style', 'keys', 'width')
+
+    def __init__(self, text: str, style: str):
+        self.text = text
+        self.style = style
+        self.clusters, self.end_style = parse_line(text, style)
+        self.keys = columns(self.clusters)
+        self.width = len(self.keys)
+
+
+class TerminalRenderer:
+    """Draws whole frames but only sends the terminal what changed since the last one
+
+    A frame is the text a display function would have printed. The
+    renderer keeps the previous frame as styled clusters per screen column
+    and, for each line, moves the cursor to the runs of columns that differ
+    and rewrites just those, switching colors only where the style changes.
+    Text after an emoji is placed with an absolute column, so terminals that
+    draw emoji narrower or wider than expected stay in step with the frame.
+    Lines whose text has not changed are neither parsed nor compared again.
+    Everything for one frame goes out in a single write. When output is not
+    a terminal, frames are printed in full as before.
+    """
+
+    def __init__(self, stream: Optional[TextIO] = None):
+        self.stream = stream or sys.stdout
+        self.interactive = self.stream.isatty()
+        self.previous: Optional[List[Line]] = None
+        self.frame_bytes: List[int] = []
+        self.full_frames = 0
+        if os.name == 'nt' and self.interactive:
+            os.system('')  # turns on escape sequence handling in the Windows console
+
+    def clear(self):
+        """Clear the screen; the next frame is drawn in full"""
+        clear_screen(self.stream)
+        self.previous = None
+
+    def render(self, text: str) -> int:
+        """Show a frame and leave the cursor on the line below it; returns the bytes written"""
+        text = text.rstrip('\n')
+        if not self.interactive:
+            return self.write(text + '\n', full=True)
+
+        previous = self.previous or []
+        frame: List[Line] = []
+        style = ''
+        for row, text_line in enumerate(text.split('\n')):
+            old = previous[row] if row < len(previous) else None
+            line = old if old is not None and old.text == text_line and old.style == style else Line(text_line, style)
+            frame.append(line)
+            style = line.end_style
+
+        size = shutil.get_terminal_size()
+        fits = len(frame) + PROMPT_LINES <= size.lines and all(line.width <= size.columns for line in frame)
+        if not fits:
+            # Lines would wrap or scroll away, so positions cannot be trusted
+            self.previous = None
+            return self.write(CLEAR + text + RESET + '\n', full=True)
+
+        out: List[str] = []
+        style = ''
+        if self.previous is None:
+            out.append(CLEAR)
+            for row, line in enumerate(frame):
+                if row:
+                    out.append('\n')
+                style = self.write_clusters(out, line.clusters, 0, len(line.clusters), 0, style)
+            full = True
+        else:
+            for row, line in enumerate(frame):
+                old = previous[row] if row < len(previous) else None
+                if line is not old:
+                    style = self.diff_line(out, row, old.keys if old else [], line, style)
+            full = False
+        if style:
+            out.append(RESET)
+        # Park the cursor under the frame, wiping old prompts, messages and longer frames
+        out.append(f'\033[{len(frame) + 1};1H\033[J')
+        self.previous = frame
+        return self.write(''.join(out), full)
+
+    def diff_line(self, out: List[str], row: int, old_keys: List[Tuple], line: Line, style: str) -> str:
+        new, new_keys = line.clusters, line.keys
+        width = max(len(old_keys), len(new_keys))
+        changed = [column for column in range(width)
+                   if (old_keys[column] if column < len(old_keys) else None)
+                   != (new_keys[column] if column < len(new_keys) else None)]
+        if not changed:
+            return style
+
+        # Group changed columns into runs, bridging short unchanged gaps
+        runs = [[changed[0], changed[0]]]
+        for column in changed[1:]:
+            if column - runs[-1][1] <= DIFF_GAP:
+                runs[-1][1] = column
+            else:
+                runs.append([column, column])
+
+        # Column at which each cluster of the new line starts
+        starts = []
+        position = 0
+        for cluster in new:
+            starts.append(position)
+            position += cluster[2]
+
+        for first, last in runs:
+            # Widen the run to whole clusters of the new line
+            begin = 0
+            while begin < len(new) and starts[begin] + new[begin][2] <= first:
+                begin += 1
+            end = begin
+            while end < len(new) and starts[end] <= last:
+                end += 1
+            column = starts[begin] if begin < len(new) else position
+            stop = starts[end - 1] + new[end - 1][2] if end > begin else column
+            if style:
+                out.append(RESET)
+                style = ''
+            out.append(f'\033[{row + 1};{column + 1}H')
+            if last >= position:
+                # The new line is shorter than the old one here
+                out.append('\033[K')
+            else:
+                # Blank the run first, in case the terminal draws an emoji narrower than expected
+                out.append(f'\033[{max(stop, last + 1) - column}X')
+            style = self.write_clusters(out, new, begin, end, column, style)
+        return style
+
+    @staticmethod
+    def write_clusters(out: List[str], line: List[Cluster], begin: int, end: int, column: int,
+                       style: str) -> str:
+        """Append clusters begin..end of a line starting at column; returns the style left active"""
+        realign = False
+        for cluster_style, text, width in line[begin:end]:
+            if realign:
+                out.append(f'\033[{column + 1}G')
+            if cluster_style != style:
+                out.append(RESET + cluster_style if style else cluster_style)
+                style = cluster_style
+            out.append(text)
+            column += width
+            realign = uncertain((cluster_style, text, width))
+        return style
+
+    def write(self, data: str, full: bool) -> int:
+        self.stream.write(data)
+        self.stream.flush()
+        size = len(data.encode('utf-8'))
+        self.frame_bytes.append(size)
+        self.full_frames += full
+        return size
+
+    def report(self) -> str:
+        """Summary of the bytes written per frame"""
+        if not self.frame_bytes:
+            return "Terminal output: no frames drawn"
+        frames = len(self.frame_bytes)
+        return (f"Terminal output: {frames} frames ({self.full_frames} full), "
+                f"{sum(self.frame_bytes) / frames:.0f} bytes/frame on average, "
+                f"last {self.frame_bytes[-1]}, largest {max(self.frame_bytes)}")
@@ -0,0 +1,137 @@
+import random
+
+from memory_engine import EMPTY, FIRST, INVALID, MATCH, MISMATCH, MemoryEngine
+
+
+def make_engine():
+    # 0 1 2
+    # 1 0 .
+    return MemoryEngine([0, 1, 2, 1, 0, EMPTY], columns=3)
+
+
+def test_deal_pads_with_empty():
+    engine = MemoryEngine.deal([7, 8, 9], columns=4, cells=8, rng=random.Random(1))
+    assert len(engine) == 8
+    assert engine.rows == 2
+    assert list(engine.cards).count(EMPTY) == 2
+    assert sorted(card for card in engine.cards if card != EMPTY) == [7, 7, 8, 8, 9, 9]
+    assert engine.pairs == 3
+
+
+def test_deal_without_cells_has_no_padding():
+    engine = MemoryEngine.deal([1, 2], columns=2, rng=random.Random(1))
+    assert len(engine) == 4
+    assert EMPTY not in engine.cards
+
+
+def test_board_with_unpaired_card_counts_pairs():
+    engine = make_engine()
+    assert engine.pairs == 2
+    assert engine.rows == 2
+    assert engine.cell(1, 2) == 5
+
+
+def test_flip_empty_or_off_board_is_invalid():
+    engine = make_engine()
+    assert engine.flip(5) == INVALID
+    assert engine.flip(-1) == INVALID
+    assert engine.flip(6) == INVALID
+    assert engine.first == -1
+
+
+def test_flip_first_then_match():
+    engine = make_engine()
+    assert engine.flip(0) == FIRST
+    assert engine.first == 0
+    assert engine.is_revealed(0)
+    assert engine.moves == 0
+
+    assert engine.flip(4) == MATCH
+    assert engine.first == -1
+    assert engine.is_matched(0) and engine.is_matched(4)
+    assert engine.moves == 1
+    assert engine.matches == 1
+    assert engine.remaining == 1
+
+
+def test_flip_revealed_or_matched_card_is_invalid():
+    engine = make_engine()
+    assert engine.flip(0) == FIRST
+    assert engine.flip(0) == INVALID
+    assert engine.flip(4) == MATCH
+    assert engine.flip(4) == INVALID
+    assert engine.flip(0) == INVALID
+    assert engine.moves == 1
+
+
+def test_mismatch_stays_up_until_concealed():
+    engine = make_engine()
+    assert engine.flip(0) == FIRST
+    assert engine.flip(1) == MISMATCH
+    assert engine.moves == 1
+    assert engine.is_revealed(0) and engine.is_revealed(1)
+    assert not engine.is_matched(0)
+    assert not engine.can_flip(0)
+
+    assert engine.conceal(0)
+    assert engine.conceal(1)
+    assert not engine.is_revealed(0) and not engine.is_revealed(1)
+    assert engine.can_flip(0)
+
+
+def test_conceal_refuses_matched_and_face_down_cards():
+    engine = make_engine()
+    assert not engine.conceal(0)
+    engine.flip(0)
+    engine.flip(4)
+    assert not engine.conceal(0)
+    assert engine.is_revealed(0)
+
+
+def test_cancel_takes_back_first_card():
+    engine = make_engine()
+    engine.flip(1)
+    engine.cancel()
+    assert engine.first == -1
+    assert not engine.is_revealed(1)
+    assert engine.moves == 0
+    # Nothing open: a no-op
+    engine.cancel()
+    assert engine.flip(1) == FIRST
+
+
+def test_turn_match_and_mismatch():
+    engine = make_engine()
+    assert engine.turn(0, 1) == MISMATCH
+    assert not engine.is_revealed(0) and not engine.is_revealed(1)
+    assert engine.moves == 1
+
+    assert engine.turn(1, 3) == MATCH
+    assert engine.is_matched(1) and engine.is_matched(3)
+    assert engine.moves == 2
+    assert engine.matches == 1
+
+
+def test_turn_invalid_moves_do_not_count():
+    engine = make_engine()
+    assert engine.turn(0, 0) == INVALID
+    assert engine.turn(0, 5) == INVALID
+    assert engine.turn(0, 6) == INVALID
+    engine.turn(0, 4)
+    assert engine.turn(0, 1) == INVALID
+    engine.flip(1)
+    # A turn is still open
+    assert engine.turn(2, 3) == INVALID
+    assert engine.moves == 1
+
+
+def test_won_after_every_pair():
+    engine = make_engine()
+    assert not engine.won
+    engine.turn(0, 4)
+    assert not engine.won
+    engine.flip(3)
+    engine.flip(1)
+    assert engine.won
+    assert engine.remaining == 0
+    assert engine.moves == 2
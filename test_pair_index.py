@@ -0,0 +1,78 @@
+from memory_engine import EMPTY, FIRST, MATCH, MISMATCH, MemoryEngine
+from pair_index import PairIndex
+
+
+def make_index():
+    # Pairs: 0 at cells 0/3, 1 at cells 1/4, 2 at cells 2/5
+    engine = MemoryEngine([0, 1, 2, 0, 1, 2, EMPTY, EMPTY], columns=4)
+    return engine, PairIndex(engine)
+
+
+def flip(engine, index, cell):
+    outcome = engine.flip(cell)
+    index.record(cell, outcome)
+    return outcome
+
+
+def test_hint_with_nothing_seen_points_at_a_pair():
+    engine, index = make_index()
+    assert len(index) == 3
+    card, first, second = index.hint()
+    assert engine.cards[first] == engine.cards[second] == card
+
+
+def test_hint_prefers_pair_with_one_card_seen():
+    engine, index = make_index()
+    assert flip(engine, index, 1) == FIRST
+    engine.cancel()
+    assert index.hint() == (1, 1, 4)
+
+
+def test_hint_prefers_both_seen_over_one_seen():
+    engine, index = make_index()
+    # One card of pair 2 seen
+    flip(engine, index, 2)
+    engine.cancel()
+    # Both cards of pair 0 seen in a mismatch with pair 1
+    assert flip(engine, index, 0) == FIRST
+    assert flip(engine, index, 1) == MISMATCH
+    engine.conceal(0)
+    engine.conceal(1)
+    assert flip(engine, index, 3) == FIRST
+    engine.cancel()
+    assert index.hint() == (0, 0, 3)
+
+
+def test_seeing_a_card_twice_counts_once():
+    engine, index = make_index()
+    flip(engine, index, 2)
+    engine.cancel()
+    flip(engine, index, 2)
+    engine.cancel()
+    assert index.seen_count[2] == 1
+    # Pair 1 now has one card seen as well; ties go to the pair seen first
+    flip(engine, index, 4)
+    engine.cancel()
+    assert index.hint() == (2, 2, 5)
+
+
+def test_matched_pairs_are_no_longer_hinted():
+    engine, index = make_index()
+    flip(engine, index, 0)
+    assert flip(engine, index, 3) == MATCH
+    assert len(index) == 2
+    assert index.hint()[0] != 0
+    for first, second in ((1, 4), (2, 5)):
+        flip(engine, index, first)
+        flip(engine, index, second)
+    assert len(index) == 0
+    assert index.hint() is None
+
+
+def test_index_built_mid_game_sees_board_state():
+    engine = MemoryEngine([0, 1, 0, 1], columns=2)
+    engine.turn(0, 2)
+    engine.flip(1)
+    index = PairIndex(engine)
+    assert len(index) == 1
+    assert index.hint() == (1, 1, 3)
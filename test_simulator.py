@@ -0,0 +1,23 @@
+from simulator import rating_cutoffs
+
+
+def test_distinct_percentiles_are_used_as_is():
+    # 4x4: 16 cards; quartiles at 10, 20 and 30 moves
+    histogram = {10: 25, 20: 25, 30: 25, 40: 25}
+    cutoffs, notes = rating_cutoffs(4, histogram)
+    assert cutoffs == {'Jedi Master': 1.6, 'Jedi Knight': 0.8, 'Padawan': 0.533}
+    assert notes == {}
+
+
+def test_equal_percentiles_are_shifted_to_next_move_count():
+    histogram = {12: 80, 13: 15, 14: 5}
+    cutoffs, notes = rating_cutoffs(4, histogram)
+    assert cutoffs == {'Jedi Master': 1.333, 'Jedi Knight': 1.231, 'Padawan': 1.143}
+    assert notes == {'Jedi Knight': 'shifted', 'Padawan': 'shifted'}
+
+
+def test_cutoffs_collapse_when_no_higher_move_count_exists():
+    histogram = {12: 90, 13: 10}
+    cutoffs, notes = rating_cutoffs(4, histogram)
+    assert cutoffs == {'Jedi Master': 1.333, 'Jedi Knight': 1.231, 'Padawan': 1.231}
+    assert notes == {'Jedi Knight': 'shifted', 'Padawan': 'collapsed'}
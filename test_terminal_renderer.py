@@ -0,0 +1,107 @@
+import io
+import os
+import re
+
+import pytest
+
+import terminal_renderer
+from terminal_renderer import CLEAR, RESET, TerminalRenderer
+
+RED = '\033[31m'
+GREEN = '\033[32m'
+CURSOR_MOVE = re.compile(r'\033\[(\d+);(\d+)H')
+
+
+class FakeTerminal(io.StringIO):
+    def isatty(self):
+        return True
+
+
+@pytest.fixture
+def renderer(monkeypatch):
+    monkeypatch.setattr(terminal_renderer.shutil, 'get_terminal_size', lambda: os.terminal_size((80, 40)))
+    stream = FakeTerminal()
+    return TerminalRenderer(stream)
+
+
+def rendered(renderer, text):
+    stream = renderer.stream
+    stream.seek(0)
+    stream.truncate()
+    renderer.render(text)
+    return stream.getvalue()
+
+
+def moves(output):
+    """(row, column) of every cursor move, 1-based"""
+    return [(int(row), int(column)) for row, column in CURSOR_MOVE.findall(output)]
+
+
+def test_first_frame_is_drawn_in_full(renderer):
+    output = rendered(renderer, 'one\ntwo\nthree')
+    assert output.startswith(CLEAR)
+    assert 'one\ntwo\nthree' in output
+    assert renderer.full_frames == 1
+
+
+def test_unchanged_frame_only_parks_cursor(renderer):
+    rendered(renderer, 'one\ntwo')
+    output = rendered(renderer, 'one\ntwo')
+    assert output == '\033[3;1H\033[J'
+    assert renderer.full_frames == 1
+
+
+def test_only_changed_lines_are_rewritten(renderer):
+    rendered(renderer, 'alpha\nbravo\ncharlie')
+    output = rendered(renderer, 'alpha\nbrave\ncharlie')
+    assert 'alpha' not in output and 'charlie' not in output
+    assert moves(output) == [(2, 5), (4, 1)]
+    assert '\033[2;5H\033[1Xe' in output
+
+
+def test_nearby_changes_share_one_run(renderer):
+    rendered(renderer, 'a-b-c-d')
+    output = rendered(renderer, 'x-b-c-y')
+    # Columns 1 and 7 are closer than DIFF_GAP, so one cursor move covers both
+    assert moves(output)[:-1] == [(1, 1)]
+    assert 'x-b-c-y' in output
+
+
+def test_distant_changes_get_separate_runs(renderer):
+    line = 'a' + '-' * 20 + 'b'
+    rendered(renderer, line)
+    output = rendered(renderer, 'x' + '-' * 20 + 'y')
+    assert moves(output)[:-1] == [(1, 1), (1, 22)]
+    assert '-' not in output
+
+
+def test_colour_runs_are_coalesced(renderer):
+    output = rendered(renderer, f'{RED}abc{RESET} {GREEN}de{RESET}')
+    # One colour switch per run of equally styled characters, not per character
+    assert output.count(RED) == 1
+    assert output.count(GREEN) == 1
+    assert f'{RED}abc' in output and f'{GREEN}de' in output
+
+
+def test_diff_switches_colour_only_where_style_changes(renderer):
+    rendered(renderer, f'{RED}aaaa{RESET}')
+    output = rendered(renderer, f'{RED}abba{RESET}')
+    assert moves(output)[:-1] == [(1, 2)]
+    assert output.count(RED) == 1
+    assert f'{RED}bb' in output
+
+
+def test_shorter_line_clears_to_end(renderer):
+    rendered(renderer, 'long line')
+    output = rendered(renderer, 'long')
+    assert moves(output)[:-1] == [(1, 5)]
+    assert '\033[K' in output
+
+
+def test_non_terminal_prints_full_frames():
+    stream = io.StringIO()
+    renderer = TerminalRenderer(stream)
+    renderer.render('one\ntwo')
+    renderer.render('one\ntwo')
+    assert stream.getvalue() == 'one\ntwo\none\ntwo\n'
+    assert renderer.full_frames == 2
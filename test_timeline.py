@@ -0,0 +1,43 @@
+import os
+
+import pytest
+
+import timeline
+from timeline import PACING_ENV, read_key
+
+
+@pytest.mark.parametrize('value, scale', [('normal', 1.0), ('Fast', 0.35), (' TURBO ', 0.0), ('0.5', 0.5), ('-2', 0.0)])
+def test_pacing_scale(monkeypatch, value, scale):
+    monkeypatch.setenv(PACING_ENV, value)
+    assert timeline.pacing_scale() == scale
+
+
+@pytest.mark.parametrize('value', ['0,5', 'quick', 'nan', 'inf'])
+def test_bad_pacing_falls_back_to_normal(monkeypatch, capsys, value):
+    monkeypatch.setenv(PACING_ENV, value)
+    assert timeline.pacing_scale() == 1.0
+    assert PACING_ENV in capsys.readouterr().out
+
+
+@pytest.fixture
+def pipe():
+    read_fd, write_fd = os.pipe()
+    yield read_fd, write_fd
+    os.close(read_fd)
+    os.close(write_fd)
+
+
+def remaining(fd):
+    os.set_blocking(fd, False)
+    try:
+        return os.read(fd, 64)
+    except BlockingIOError:
+        return b''
+
+
+@pytest.mark.parametrize('key', [b'x', b'\033[A', b'\033[15~', b'\033OP', b'\033x', 'é'.encode(), '😀'.encode()])
+def test_read_key_leaves_typed_input(pipe, key):
+    read_fd, write_fd = pipe
+    os.write(write_fd, key + b'2 3\n')
+    assert read_key(read_fd) == key
+    assert remaining(read_fd) == b'2 3\n'
@@ -1,18 +1,22 @@
-import requests
 import random
-import time
 import os
+from roster_cache import load_roster
+from memory_engine import MemoryEngine, MATCH
+from terminal_renderer import TerminalRenderer, RENDER_STATS_ENV
+from timeline import Timeline
+
+EMPTY_CARD = {'id': 999, 'name': 'Empty'}  # filler for slots the roster cannot fill
 
 class TextMemoryGame:
     def __init__(self):
         self.grid_size = 6
         self.total_pairs = (self.grid_size * self.grid_size) // 2
-        self.board = [[None for _ in range(self.grid_size)] for _ in range(self.grid_size)]
-        self.revealed = [[False for _ in range(self.grid_size)] for _ in range(self.grid_size)]
-        self.matched = [[False for _ in range(self.grid_size)] for _ in range(self.grid_size)]
+        self.engine = MemoryEngine([], self.grid_size)
+        self.roster = {}  # card id -> character
+        self.cell_faces = []  # per cell: hidden and face-up strings
         self.characters = []
-        self.moves = 0
-        self.matches_found = 0
+        self.renderer = TerminalRenderer()
+        self.timeline = Timeline()
 
         self.load_characters()
         self.setup_board()
@@ -21,18 +25,13 @@ class TextMemoryGame:
         """Load characters from Star Wars API"""
         print("Loading Star Wars characters...")
         try:
-            response = requests.get("https://akabab.github.io/starwars-api/api/all.json")
-            if response.status_code == 200:
-                all_characters = response.json()
-                # Select random characters for the game
-                if len(all_characters) >= self.total_pairs:
-                    self.characters = random.sample(all_characters, self.total_pairs)
-                else:
-                    self.characters = all_characters[:self.total_pairs]
-                print(f"Loaded {len(self.characters)} characters")
+            all_characters = load_roster()
+            # Select random characters for the game
+            if len(all_characters) >= self.total_pairs:
+                self.characters = random.sample(all_characters, self.total_pairs)
             else:
-                print(f"Error loading characters: HTTP {response.status_code}")
-                self.use_fallback_characters()
+                self.characters = all_characters[:self.total_pairs]
+            print(f"Loaded {len(self.characters)} characters")
         except Exception as e:
             print(f"Error loading characters: {e}")
             self.use_fallback_characters()
@@ -55,64 +54,57 @@ class TextMemoryGame:
         # Create pairs
         all_cards = []
         for character in self.characters:
-            all_cards.extend([character, character])
+            all_cards.extend([character['id'], character['id']])
 
         # Fill remaining slots if needed
         while len(all_cards) < self.grid_size * self.grid_size:
-            all_cards.append({'id': 999, 'name': 'Empty'})
+            all_cards.append(EMPTY_CARD['id'])
 
-        # Shuffle cards
+        # Shuffle cards and place them on the board
         random.shuffle(all_cards)
+        self.roster = {character['id']: character for character in self.characters}
+        self.roster[EMPTY_CARD['id']] = EMPTY_CARD
+        self.engine = MemoryEngine(all_cards, self.grid_size)
 
-        # Place on board
-        index = 0
-        for i in range(self.grid_size):
-            for j in range(self.grid_size):
-                self.board[i][j] = all_cards[index]
-                index += 1
+        # Render every cell's faces once; matched and revealed cards look the same
+        names = {card: f"{character['name'][:7]:^8} " for card, character in self.roster.items()}
+        self.cell_faces = [("   ??    ", names[card], names[card]) for card in all_cards]
 
     def clear_screen(self):
         """Clear the console screen"""
-        os.system('cls' if os.name == 'nt' else 'clear')
+        self.renderer.clear()
 
     def display_board(self):
         """Display the current state of the board"""
-        self.clear_screen()
-        print("=" * 60)
-        print("STAR WARS MEMORY GAME")
-        print("=" * 60)
-        print(f"Moves: {self.moves} | Matches: {self.matches_found}/{self.total_pairs}")
-        print("-" * 60)
+        frame = []
+        frame.append("=" * 60 + "\n")
+        frame.append("STAR WARS MEMORY GAME\n")
+        frame.append("=" * 60 + "\n")
+        frame.append(f"Moves: {self.engine.moves} | Matches: {self.engine.matches}/{self.total_pairs}\n")
+        frame.append("-" * 60 + "\n")
 
         # Column headers
-        print("    ", end="")
+        frame.append("    ")
         for j in range(self.grid_size):
-            print(f"{j+1:^8}", end=" ")
-        print()
+            frame.append(f"{j+1:^8} ")
+        frame.append("\n")
 
         # Board rows
         for i in range(self.grid_size):
-            print(f"{chr(65+i):>2}: ", end="")
-            for j in range(self.grid_size):
-                if self.matched[i][j]:
-                    # Show matched cards
-                    name = self.board[i][j]['name'][:7]
-                    print(f"{name:^8}", end=" ")
-                elif self.revealed[i][j]:
-                    # Show temporarily revealed cards
-                    name = self.board[i][j]['name'][:7]
-                    print(f"{name:^8}", end=" ")
-                else:
-                    # Show hidden cards
-                    print("   ??   ", end=" ")
-            print()
-
-        print("-" * 60)
-        if self.matches_found == self.total_pairs:
-            print("🎉 CONGRATULATIONS! YOU WON! 🎉")
-            print(f"You completed the game in {self.moves} moves!")
+            frame.append(f"{chr(65+i):>2}: ")
+            for cell in range(i * self.grid_size, (i + 1) * self.grid_size):
+                # Hidden, temporarily revealed or matched
+                frame.append(self.cell_faces[cell][self.engine.is_revealed(cell) + self.engine.is_matched(cell)])
+            frame.append("\n")
+
+        frame.append("-" * 60 + "\n")
+        if self.engine.won:
+            frame.append("🎉 CONGRATULATIONS! YOU WON! 🎉\n")
+            frame.append(f"You completed the game in {self.engine.moves} moves!\n")
         else:
-            print("Enter coordinates (e.g., A1, B3) or 'quit' to exit")
+            frame.append("Enter coordinates (e.g., A1, B3) or 'quit' to exit\n")
+
+        self.renderer.render("".join(frame))
 
     def get_coordinates(self, coord_str):
         """Convert coordinate string (like A1) to row, col indices"""
@@ -134,8 +126,7 @@ class TextMemoryGame:
         """Check if a move is valid"""
         return (0 <= row < self.grid_size and
                 0 <= col < self.grid_size and
-                not self.matched[row][col] and
-                not self.revealed[row][col])
+                self.engine.can_flip(self.engine.cell(row, col)))
 
     def play_turn(self):
         """Handle one turn of the game"""
@@ -151,11 +142,11 @@ class TextMemoryGame:
 
             row, col = self.get_coordinates(choice)
             if row is not None and self.is_valid_move(row, col):
-                first_card = (row, col)
-                self.revealed[row][col] = True
+                first_card = self.engine.cell(row, col)
+                outcome = self.engine.flip(first_card)
             else:
                 print("Invalid selection! Try again.")
-                time.sleep(1)
+                self.timeline.pause(1)
 
         # Get second card
         while second_card is None:
@@ -166,32 +157,25 @@ class TextMemoryGame:
 
             row, col = self.get_coordinates(choice)
             if row is not None and self.is_valid_move(row, col):
-                second_card = (row, col)
-                self.revealed[row][col] = True
+                second_card = self.engine.cell(row, col)
+                outcome = self.engine.flip(second_card)
             else:
                 print("Invalid selection! Try again.")
-                time.sleep(1)
+                self.timeline.pause(1)
 
         # Show both cards
         self.display_board()
-        self.moves += 1
-
-        # Check for match
-        r1, c1 = first_card
-        r2, c2 = second_card
 
-        if self.board[r1][c1]['id'] == self.board[r2][c2]['id']:
+        # The engine resolved the match on the second flip
+        if outcome == MATCH:
             print("🎉 MATCH! 🎉")
-            self.matched[r1][c1] = True
-            self.matched[r2][c2] = True
-            self.matches_found += 1
         else:
             print("No match. Cards will be hidden again.")
-            time.sleep(2)
-            self.revealed[r1][c1] = False
-            self.revealed[r2][c2] = False
+            self.timeline.pause(2)
+            self.engine.conceal(first_card)
+            self.engine.conceal(second_card)
 
-        time.sleep(2)
+        self.timeline.pause(2)
         return True
 
     def play(self):
@@ -202,14 +186,18 @@ class TextMemoryGame:
         print("\nPress Enter to start...")
         input()
 
-        while self.matches_found < self.total_pairs:
+        while not self.engine.won:
             if not self.play_turn():
                 print("Thanks for playing!")
+                if os.environ.get(RENDER_STATS_ENV):
+                    print(self.renderer.report())
                 return
 
         self.display_board()
-        print(f"\n🏆 Game completed in {self.moves} moves! 🏆")
+        print(f"\n🏆 Game completed in {self.engine.moves} moves! 🏆")
         print("Thanks for playing the Star Wars Memory Game!")
+        if os.environ.get(RENDER_STATS_ENV):
+            print(self.renderer.report())
 
 if __name__ == "__main__":
     game = TextMemoryGame()
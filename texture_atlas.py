@@ -0,0 +1,88 @@
+from typing import Dict, Hashable, List, Tuple
+
+import pygame
+
+# Page dimensions in cells; 12x12 card faces fit a 1024px texture
+ATLAS_PAGE_COLUMNS = 12
+ATLAS_PAGE_ROWS = 12
+
+
+class TextureAtlas:
+    """Packs equally sized card faces into a few display-format pages
+
+    Every face is flattened onto the card colour it is always drawn over
+    and copied into a cell of an opaque page surface in the display's pixel
+    format, so blitting a face is a plain copy with no per-pixel alpha or
+    format conversion. Cards blit from the returned subsurface. Faces are
+    reference counted by key, so both cards of a pair share one cell, and
+    released cells are reused.
+    """
+
+    def __init__(self, cell_size: Tuple[int, int], background: Tuple[int, int, int],
+                 columns: int = ATLAS_PAGE_COLUMNS, rows: int = ATLAS_PAGE_ROWS):
+        self.cell_size = cell_size
+        self.background = background
+        self.columns = columns
+        self.rows = rows
+        self.pages: List[pygame.Surface] = []
+        self.free_cells: List[Tuple[int, int, int]] = []  # (page, column, row)
+        self.entries: Dict[Hashable, Tuple[pygame.Surface, Tuple[int, int, int]]] = {}
+        self.refcounts: Dict[Hashable, int] = {}
+
+    def _new_page(self):
+        width, height = self.cell_size
+        page = pygame.Surface((width * self.columns, height * self.rows))
+        if pygame.display.get_surface() is not None:
+            page = page.convert()
+        index = len(self.pages)
+        self.pages.append(page)
+        # Hand cells out in reading order
+        for row in reversed(range(self.rows)):
+            for column in reversed(range(self.columns)):
+                self.free_cells.append((index, column, row))
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self.entries
+
+    def acquire(self, key: Hashable) -> pygame.Surface:
+        """Take another reference to an existing face"""
+        self.refcounts[key] += 1
+        return self.entries[key][0]
+
+    def add(self, key: Hashable, surface: pygame.Surface) -> pygame.Surface:
+        """Pack a face (or reuse the one already stored under key) and return its subsurface"""
+        if key in self.entries:
+            return self.acquire(key)
+
+        if not self.free_cells:
+            self._new_page()
+        cell = self.free_cells.pop()
+        page_index, column, row = cell
+        width, height = self.cell_size
+        rect = pygame.Rect(column * width, row * height, width, height)
+
+        page = self.pages[page_index]
+        page.fill(self.background, rect)
+        page.blit(surface, rect.topleft, pygame.Rect((0, 0), self.cell_size))
+
+        face = page.subsurface(rect)
+        self.entries[key] = (face, cell)
+        self.refcounts[key] = 1
+        return face
+
+    def release(self, key: Hashable):
+        """Drop a reference; the cell is recycled once nothing uses it"""
+        if key not in self.refcounts:
+            return
+        self.refcounts[key] -= 1
+        if self.refcounts[key] <= 0:
+            del self.refcounts[key]
+            _, cell = self.entries.pop(key)
+            self.free_cells.append(cell)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            'pages': len(self.pages),
+            'faces': len(self.entries),
+            'free_cells': len(self.free_cells),
+        }
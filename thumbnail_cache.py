@@ -0,0 +1,154 @@
+import hashlib
+import io
+import os
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+import pygame
+
+from cache_paths import atomic_write, cache_path
+
+# Default disk budget for cached thumbnails
+THUMBNAIL_CACHE_BYTES = 32 * 1024 * 1024
+
+# Returned by get() for images known to be unusable (broken URL, placeholder art)
+MISSING = object()
+
+
+class ThumbnailCache:
+    """Content-addressed disk cache of already scaled card images
+
+    Entries are keyed by image URL plus target size and stored as PNG files.
+    Writes go to a temporary file that is atomically renamed into place, so a
+    crash never leaves a half-written thumbnail behind. File modification
+    times record last use, and the least recently used entries are evicted
+    once the cache grows past its byte budget. Safe to use from worker threads.
+    """
+
+    def __init__(self, directory: Optional[str] = None, max_bytes: int = THUMBNAIL_CACHE_BYTES):
+        self.directory = directory or cache_path('thumbnails')
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.lock = threading.Lock()
+        self.entries: Optional[Dict[str, Tuple[int, float]]] = None  # name -> (bytes, last use)
+        self.total_bytes = 0
+
+    @staticmethod
+    def key(url: str, size: Tuple[int, int]) -> str:
+        """Cache key for an image URL scaled to size"""
+        return hashlib.sha256(f"{url}|{size[0]}x{size[1]}".encode('utf-8')).hexdigest()
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.directory, name)
+
+    def _scan(self):
+        """Build the in-memory index from the files on disk"""
+        if self.entries is not None:
+            return
+        self.entries = {}
+        self.total_bytes = 0
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            return
+        for name in names:
+            path = self._path(name)
+            if name.endswith('.tmp'):
+                # Leftover from an interrupted write
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+                continue
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            self.entries[name] = (stat.st_size, stat.st_mtime)
+            self.total_bytes += stat.st_size
+
+    def get(self, url: str, size: Tuple[int, int]):
+        """Return the cached surface, MISSING for known-bad images, or None"""
+        name = self.key(url, size)
+        with self.lock:
+            self._scan()
+            entry = self.entries.get(name)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            now = time.time()
+            self.entries[name] = (entry[0], now)
+
+        path = self._path(name)
+        try:
+            os.utime(path, (now, now))
+            if entry[0] == 0:
+                return MISSING
+            with open(path, 'rb') as f:
+                return pygame.image.load(io.BytesIO(f.read()), 'thumb.png')
+        except (OSError, pygame.error):
+            # Entry vanished or is corrupt; treat it as a miss
+            with self.lock:
+                self.hits -= 1
+                self.misses += 1
+                self._forget(name)
+            return None
+
+    def put(self, url: str, size: Tuple[int, int], surface):
+        """Store a scaled surface"""
+        buffer = io.BytesIO()
+        pygame.image.save(surface, buffer, 'thumb.png')
+        self._write(self.key(url, size), buffer.getvalue())
+
+    def put_missing(self, url: str, size: Tuple[int, int]):
+        """Remember that an image URL does not yield a usable picture"""
+        self._write(self.key(url, size), b'')
+
+    def _write(self, name: str, data: bytes):
+        try:
+            atomic_write(self._path(name), data)
+        except OSError as e:
+            print(f"Could not write thumbnail cache entry: {e}")
+            return
+
+        with self.lock:
+            self._scan()
+            self._forget(name)
+            self.entries[name] = (len(data), time.time())
+            self.total_bytes += len(data)
+            self._evict()
+
+    def _forget(self, name: str):
+        entry = self.entries.pop(name, None)
+        if entry is not None:
+            self.total_bytes -= entry[0]
+
+    def _evict(self):
+        """Drop least recently used entries until the cache fits its budget"""
+        if self.total_bytes <= self.max_bytes:
+            return
+        for name, _ in sorted(self.entries.items(), key=lambda item: item[1][1]):
+            if self.total_bytes <= self.max_bytes:
+                break
+            try:
+                os.remove(self._path(name))
+            except OSError:
+                pass
+            self._forget(name)
+            self.evictions += 1
+
+    def stats(self) -> Dict[str, float]:
+        """Hit/miss counters and current size"""
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'evictions': self.evictions,
+            'entries': len(self.entries or ()),
+            'bytes': self.total_bytes,
+        }
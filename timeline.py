@@ -0,0 +1,155 @@
+import math
+import os
+import select
+import sys
+import time
+from typing import Iterable, Iterator, Optional, TextIO, TypeVar
+
+try:
+    import termios
+except ImportError:  # Windows
+    termios = None
+try:
+    import msvcrt
+except ImportError:  # everywhere else
+    msvcrt = None
+
+PACING_ENV = 'MEMORY_GAME_PACING'
+# How long the console games' pauses last, as a share of their nominal length
+PACING_PROFILES = {
+    'normal': 1.0,
+    'fast': 0.35,
+    'turbo': 0.0,
+}
+KEY_POLL_SECONDS = 0.02  # Windows checks for a keypress this often
+
+T = TypeVar('T')
+
+
+def pacing_scale() -> float:
+    """Scale from MEMORY_GAME_PACING: a profile name or a number (1 = normal)"""
+    value = os.environ.get(PACING_ENV, 'normal').strip().lower()
+    if value in PACING_PROFILES:
+        return PACING_PROFILES[value]
+    try:
+        scale = float(value)
+    except ValueError:
+        scale = math.nan
+    if not math.isfinite(scale):
+        print(f"Warning: ignoring {PACING_ENV}={value!r}; use {', '.join(PACING_PROFILES)} or a number")
+        return PACING_PROFILES['normal']
+    return max(0.0, scale)
+
+
+def read_key(fd: int) -> bytes:
+    """Read one keypress from a cbreak terminal: a character, or a whole escape sequence
+
+    Only bytes that belong to the key are consumed, so anything typed after
+    it stays queued for the next prompt.
+    """
+    def more() -> bytes:
+        ready, _, _ = select.select([fd], [], [], 0)
+        return os.read(fd, 1) if ready else b''
+
+    key = os.read(fd, 1)
+    if key == b'\033':
+        # Alt+key, SS3 (ESC O x) or CSI (ESC [ parameters final) sequences
+        byte = more()
+        key += byte
+        if byte == b'O':
+            key += more()
+        elif byte == b'[':
+            while True:
+                byte = more()
+                key += byte
+                if not byte or 0x40 <= byte[0] <= 0x7e:
+                    break
+    elif key and key[0] >= 0xc0:
+        # The continuation bytes of a UTF-8 character
+        for _ in range(1 if key[0] < 0xe0 else 2 if key[0] < 0xf0 else 3):
+            key += more()
+    return key
+
+
+class Timeline:
+    """Every cosmetic pause of a console game, scaled by the pacing profile and skippable
+
+    pause() waits like time.sleep but returns early, True, as soon as a key
+    is pressed. That one key is swallowed so it does not end up in the next
+    prompt; input typed before the pause ends it at once and is kept. On
+    POSIX terminals stdin is put in cbreak mode and watched with select for
+    the length of the pause, on Windows the console is polled with msvcrt;
+    when stdin is not a terminal pauses are plain sleeps. With a scale of 0
+    (the turbo profile) pauses cost nothing at all.
+    """
+
+    def __init__(self, scale: Optional[float] = None, stream: Optional[TextIO] = None):
+        self.scale = pacing_scale() if scale is None else scale
+        self.stream = stream or sys.stdin
+        self.interactive = self.stream.isatty()
+        self.skipped = 0
+        self.waited = 0.0
+
+    def pause(self, seconds: float) -> bool:
+        """Wait seconds (scaled); True if a keypress cut it short"""
+        seconds *= self.scale
+        if seconds <= 0:
+            return False
+
+        start = time.perf_counter()
+        if not self.interactive:
+            time.sleep(seconds)
+            skipped = False
+        elif termios is not None:
+            skipped = self.wait_posix(seconds)
+        elif msvcrt is not None:
+            skipped = self.wait_windows(seconds)
+        else:
+            time.sleep(seconds)
+            skipped = False
+        self.waited += time.perf_counter() - start
+        self.skipped += skipped
+        return skipped
+
+    def animate(self, frames: Iterable[T], interval: float) -> Iterator[T]:
+        """Yield animation frames interval seconds apart; stops early on a keypress
+
+        At a scale of 0 only the first frame is shown.
+        """
+        for frame in frames:
+            yield frame
+            if self.scale <= 0 or self.pause(interval):
+                return
+
+    def wait_posix(self, seconds: float) -> bool:
+        fd = self.stream.fileno()
+        saved = termios.tcgetattr(fd)
+        cbreak = termios.tcgetattr(fd)
+        # Keys arrive one at a time, without echo; Ctrl+C still interrupts
+        cbreak[3] &= ~(termios.ICANON | termios.ECHO)
+        cbreak[6][termios.VMIN] = 1
+        cbreak[6][termios.VTIME] = 0
+        try:
+            termios.tcsetattr(fd, termios.TCSANOW, cbreak)
+            typed_ahead, _, _ = select.select([fd], [], [], 0)
+            if typed_ahead:
+                # The player is already typing the next command: end the pause, keep the input
+                return True
+            ready, _, _ = select.select([fd], [], [], seconds)
+            if ready:
+                read_key(fd)
+            return bool(ready)
+        finally:
+            termios.tcsetattr(fd, termios.TCSADRAIN, saved)
+
+    def wait_windows(self, seconds: float) -> bool:
+        deadline = time.perf_counter() + seconds
+        while True:
+            if msvcrt.kbhit():
+                if msvcrt.getwch() in '\x00\xe0':
+                    msvcrt.getwch()  # second half of a function or arrow key
+                return True
+            left = deadline - time.perf_counter()
+            if left <= 0:
+                return False
+            time.sleep(min(left, KEY_POLL_SECONDS))
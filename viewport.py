@@ -0,0 +1,103 @@
+import math
+from typing import Sequence, Tuple
+
+import pygame
+
+# Zoom steps the +/- keys and Ctrl+wheel move between
+VIEWPORT_ZOOM_LEVELS = (0.5, 0.75, 1.0)
+
+
+class Viewport:
+    """Camera over a board laid out in world coordinates
+
+    The board is drawn into ``area`` (a screen rectangle) at ``zoom``,
+    with (x, y) the world point shown at the area's top-left corner.
+    Scrolling is clamped to the board, and a board smaller than the area
+    along an axis is centred on it, so a board that fits the window is
+    drawn exactly where the fixed layout put it.
+    """
+
+    def __init__(self, area: pygame.Rect, world_size: Tuple[int, int],
+                 zoom_levels: Sequence[float] = VIEWPORT_ZOOM_LEVELS, zoom: float = 1.0):
+        self.area = pygame.Rect(area)
+        self.world_width, self.world_height = world_size
+        self.zoom_levels = tuple(sorted(zoom_levels))
+        self.zoom = zoom
+        self.x = 0.0
+        self.y = 0.0
+        self.clamp()
+
+    @property
+    def scrollable(self) -> bool:
+        """True when part of the board lies outside the area"""
+        return (self.world_width * self.zoom > self.area.width
+                or self.world_height * self.zoom > self.area.height)
+
+    @staticmethod
+    def _clamp_axis(position: float, span: float, world: float) -> float:
+        if world <= span:
+            return -(span - world) / 2
+        return min(max(position, 0.0), world - span)
+
+    def clamp(self):
+        self.x = self._clamp_axis(self.x, self.area.width / self.zoom, self.world_width)
+        self.y = self._clamp_axis(self.y, self.area.height / self.zoom, self.world_height)
+
+    def visible(self) -> pygame.Rect:
+        """World rectangle currently inside the area"""
+        left, top = math.floor(self.x), math.floor(self.y)
+        right = math.ceil(self.x + self.area.width / self.zoom)
+        bottom = math.ceil(self.y + self.area.height / self.zoom)
+        return pygame.Rect(left, top, right - left, bottom - top)
+
+    def to_screen(self, world_x: float, world_y: float) -> Tuple[int, int]:
+        return (self.area.x + math.floor((world_x - self.x) * self.zoom),
+                self.area.y + math.floor((world_y - self.y) * self.zoom))
+
+    def to_world(self, pos: Tuple[int, int]) -> Tuple[float, float]:
+        return (self.x + (pos[0] - self.area.x) / self.zoom,
+                self.y + (pos[1] - self.area.y) / self.zoom)
+
+    def scale(self, length: float) -> int:
+        """A world length in screen pixels"""
+        return max(1, round(length * self.zoom))
+
+    def scroll(self, dx: float, dy: float) -> bool:
+        """Move the view by (dx, dy) screen pixels; False if it could not move"""
+        before = (self.x, self.y)
+        self.x += dx / self.zoom
+        self.y += dy / self.zoom
+        self.clamp()
+        return (self.x, self.y) != before
+
+    def zoom_at(self, pos: Tuple[int, int], steps: int) -> bool:
+        """Zoom in (steps > 0) or out by whole levels, keeping the world point under pos still"""
+        levels = self.zoom_levels
+        current = min(range(len(levels)), key=lambda i: abs(levels[i] - self.zoom))
+        zoom = levels[min(len(levels) - 1, max(0, current + steps))]
+        if zoom == self.zoom:
+            return False
+
+        anchor_x, anchor_y = self.to_world(pos)
+        self.zoom = zoom
+        self.x = anchor_x - (pos[0] - self.area.x) / zoom
+        self.y = anchor_y - (pos[1] - self.area.y) / zoom
+        self.clamp()
+        return True
+
+    def reveal(self, rect: pygame.Rect) -> bool:
+        """Scroll as little as possible to bring a world rectangle fully into view"""
+        right = self.x + self.area.width / self.zoom
+        bottom = self.y + self.area.height / self.zoom
+        dx = dy = 0.0
+        if rect.left < self.x:
+            dx = rect.left - self.x
+        elif rect.right > right:
+            dx = rect.right - right
+        if rect.top < self.y:
+            dy = rect.top - self.y
+        elif rect.bottom > bottom:
+            dy = rect.bottom - bottom
+        if not dx and not dy:
+            return False
+        return self.scroll(dx * self.zoom, dy * self.zoom)